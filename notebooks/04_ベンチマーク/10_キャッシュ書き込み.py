@@ -0,0 +1,133 @@
+import marimo
+
+__generated_with = "0.23.6"
+app = marimo.App(width="medium")
+
+with app.setup:
+    import datetime
+    import statistics
+    import tempfile
+    import time
+    from pathlib import Path
+
+    import marimo as mo
+    import numpy as np
+    import polars as pl
+
+    from kabukit.utils.cache import (
+        COMPRESSION_PROFILES,
+        ParquetOptions,
+        get_parquet_options,
+        write_parquet,
+    )
+
+
+@app.cell
+def _():
+    mo.md("""
+    # キャッシュの書き込み設定とスキャン時間
+
+    株価データと同じ形の合成データを、設定を変えてParquetファイルに書き込み、
+    ファイルサイズ、書き込み時間、1銘柄を読み込むスキャン時間を比較する。
+    `unsorted`はpolarsのデフォルト設定で、並べ替えずに書き込んだもの。
+    """)
+    return
+
+
+@app.cell
+def _():
+    n_codes = mo.ui.slider(500, 4000, step=500, value=4000, label="銘柄数")
+    n_days = mo.ui.slider(100, 1000, step=100, value=500, label="営業日数")
+    mo.hstack([n_codes, n_days])
+    return n_codes, n_days
+
+
+@app.cell
+def _(n_codes, n_days):
+    rng = np.random.default_rng(0)
+    codes = [f"{i:04d}0" for i in range(1300, 1300 + n_codes.value)]
+    start = datetime.date(2020, 1, 1)
+    dates = [start + datetime.timedelta(days=i) for i in range(n_days.value)]
+
+    df = (
+        pl
+        .DataFrame({"Date": dates})
+        .join(pl.DataFrame({"Code": codes}), how="cross")
+        .sample(fraction=1, shuffle=True, seed=0)
+        .with_columns(
+            pl.Series("Close", rng.lognormal(7, 1, n_codes.value * n_days.value)),
+            pl.Series("Volume", rng.integers(0, 10**7, n_codes.value * n_days.value)),
+        )
+        .with_columns(
+            (pl.col("Close") * 0.99).alias("Open"),
+            (pl.col("Close") * 1.01).alias("High"),
+            (pl.col("Close") * 0.98).alias("Low"),
+        )
+    )
+    df.shape
+    return codes, df
+
+
+@app.function
+def measure(func, repeat: int = 5) -> float:
+    """関数の実行時間の中央値をミリ秒で返す。"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+@app.cell
+def _(codes, df):
+    options = get_parquet_options("jquants", "prices")
+    code = codes[len(codes) // 2]
+    rows = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        variants = {"unsorted": None}
+        variants.update({name: name for name in COMPRESSION_PROFILES})
+
+        for name, profile in variants.items():
+            path = Path(tmp) / f"{name}.parquet"
+
+            start = time.perf_counter()
+            if profile is None:
+                df.write_parquet(path)
+            else:
+                write_parquet(df, path, options, profile=profile)
+            write_ms = (time.perf_counter() - start) * 1000
+
+            def scan_code(path=path):
+                return pl.scan_parquet(path).filter(Code=code).collect()
+
+            def read_all(path=path):
+                return pl.read_parquet(path)
+
+            rows.append(
+                {
+                    "Variant": name,
+                    "SizeMB": path.stat().st_size / 2**20,
+                    "WriteMs": write_ms,
+                    "ScanOneCodeMs": measure(scan_code),
+                    "ReadAllMs": measure(read_all),
+                },
+            )
+
+    pl.DataFrame(rows)
+    return
+
+
+@app.cell
+def _():
+    mo.md(f"""
+    既定の設定: `{get_parquet_options("jquants", "prices")}`
+
+    ソートキーを持たない場合: `{ParquetOptions()}`
+    """)
+    return
+
+
+if __name__ == "__main__":
+    app.run()
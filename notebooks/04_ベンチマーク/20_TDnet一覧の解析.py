@@ -0,0 +1,104 @@
+import marimo
+
+__generated_with = "0.23.6"
+app = marimo.App(width="medium")
+
+with app.setup:
+    import statistics
+    import time
+
+    import marimo as mo
+    import polars as pl
+    from polars.testing import assert_frame_equal
+
+    from kabukit.sources.tdnet.client import TdnetClient
+    from kabukit.sources.tdnet.parser import iter_items, parse_list
+    from kabukit.sources.utils import get_soup
+    from kabukit.utils.config import get_cache_dir
+
+
+@app.cell
+def _():
+    mo.md("""
+    # TDnetの書類一覧ページの解析時間
+
+    保存したTDnetの書類一覧ページを、BeautifulSoupで1件ずつ解析する方法
+    (`iter_items`) と、lxmlのXPathで列ごとに解析する方法 (`parse_list`) で
+    解析し、時間を比較する。
+
+    ページは`fixtures`のディレクトリに保存したものを使う。
+    ディレクトリが空のときは、最新の開示日のページを取得して保存する。
+    同じページで比較を繰り返せるので、ネットワークの影響を受けない。
+    """)
+    return
+
+
+@app.cell
+def _():
+    fixtures = get_cache_dir() / "benchmark" / "tdnet"
+    mo.md(f"fixtures: `{fixtures}`")
+    return (fixtures,)
+
+
+@app.cell
+async def _(fixtures):
+    if not any(fixtures.glob("*.html")):
+        fixtures.mkdir(parents=True, exist_ok=True)
+
+        async with TdnetClient() as client:
+            date = (await client.get_dates())[0]
+            index = 0
+            async for page in client.iter_pages(date):
+                index += 1
+                path = fixtures / f"{date:%Y%m%d}-{index:03d}.html"
+                path.write_text(page, encoding="utf-8")
+
+    pages = [p.read_text(encoding="utf-8") for p in sorted(fixtures.glob("*.html"))]
+    len(pages)
+    return (pages,)
+
+
+@app.function
+def measure(func, repeat: int = 5) -> float:
+    """関数の実行時間の中央値をミリ秒で返す。"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+@app.function
+def parse_soup(page: str) -> pl.DataFrame:
+    """BeautifulSoupで1件ずつ解析する。キャッシュは使わない。"""
+    get_soup.cache_clear()
+    items = [item.to_dict() for item in iter_items(page)]
+    return pl.DataFrame(items, infer_schema_length=None).drop("DisclosedDate")
+
+
+@app.cell
+def _(pages):
+    rows = []
+
+    for page in pages:
+        assert_frame_equal(parse_list(page), parse_soup(page), check_dtypes=False)
+
+        rows.append(
+            {
+                "Items": parse_list(page).height,
+                "Chars": len(page),
+                "SoupMs": measure(lambda page=page: parse_soup(page)),
+                "XPathMs": measure(lambda page=page: parse_list(page)),
+            },
+        )
+
+    df = pl.DataFrame(rows).with_columns(
+        (pl.col("SoupMs") / pl.col("XPathMs")).alias("Speedup"),
+    )
+    df
+    return
+
+
+if __name__ == "__main__":
+    app.run()
@@ -1,24 +1,73 @@
+"""日本の金融市場データを取得・分析するためのツールキット。
+
+トップレベルの属性は、最初にアクセスしたときにインポートする。
+`import kabukit`だけではpolarsやhttpxなどの重い依存パッケージを読み込まないので、
+CLIや短時間で終了するスクリプトの起動が速くなる。
+"""
+
 from __future__ import annotations
 
-from .domain.edinet.list import List as EdinetList
-from .domain.jquants.info import Info
-from .domain.jquants.prices import Prices
-from .domain.jquants.statements import Statements
-from .domain.tdnet.list import List as TdnetList
-from .sources.edinet.client import EdinetClient
-from .sources.edinet.concurrent import get_documents as get_edinet_documents
-from .sources.edinet.concurrent import get_list as get_edinet_list
-from .sources.jpx.concurrent import get_shares as get_jpx_shares
-from .sources.jquants.client import JQuantsClient
-from .sources.jquants.concurrent import (
-    get_calendar,
-    get_info,
-    get_prices,
-    get_statements,
-)
-from .sources.tdnet.client import TdnetClient
-from .sources.tdnet.concurrent import get_list as get_tdnet_list
-from .utils import cache
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .domain.edinet.list import List as EdinetList
+    from .domain.jquants.info import Info
+    from .domain.jquants.prices import Prices
+    from .domain.jquants.statements import Statements
+    from .domain.tdnet.list import List as TdnetList
+    from .sources.edinet.client import EdinetClient
+    from .sources.edinet.concurrent import get_documents as get_edinet_documents
+    from .sources.edinet.concurrent import get_list as get_edinet_list
+    from .sources.jpx.concurrent import get_shares as get_jpx_shares
+    from .sources.jquants.client import JQuantsClient
+    from .sources.jquants.concurrent import (
+        get_calendar,
+        get_info,
+        get_prices,
+        get_statements,
+    )
+    from .sources.tdnet.client import TdnetClient
+    from .sources.tdnet.concurrent import get_list as get_tdnet_list
+    from .utils import cache
+
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {  # noqa: RUF067
+    "EdinetClient": (".sources.edinet.client", "EdinetClient"),
+    "EdinetList": (".domain.edinet.list", "List"),
+    "Info": (".domain.jquants.info", "Info"),
+    "JQuantsClient": (".sources.jquants.client", "JQuantsClient"),
+    "Prices": (".domain.jquants.prices", "Prices"),
+    "Statements": (".domain.jquants.statements", "Statements"),
+    "TdnetClient": (".sources.tdnet.client", "TdnetClient"),
+    "TdnetList": (".domain.tdnet.list", "List"),
+    "cache": (".utils.cache", None),
+    "get_calendar": (".sources.jquants.concurrent", "get_calendar"),
+    "get_edinet_documents": (".sources.edinet.concurrent", "get_documents"),
+    "get_edinet_list": (".sources.edinet.concurrent", "get_list"),
+    "get_info": (".sources.jquants.concurrent", "get_info"),
+    "get_jpx_shares": (".sources.jpx.concurrent", "get_shares"),
+    "get_prices": (".sources.jquants.concurrent", "get_prices"),
+    "get_statements": (".sources.jquants.concurrent", "get_statements"),
+    "get_tdnet_list": (".sources.tdnet.concurrent", "get_list"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attr = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    module = importlib.import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
+
 
 __all__ = [
     "EdinetClient",
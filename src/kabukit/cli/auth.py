@@ -4,7 +4,6 @@ from typing import Annotated
 
 import typer
 from async_typer import AsyncTyper
-from httpx import HTTPStatusError
 from typer import Exit, Option
 
 # pyright: reportMissingTypeStubs=false
@@ -37,6 +36,8 @@ Password = Annotated[
 @app.async_command()
 async def jquants(mailaddress: Mailaddress = None, password: Password = None) -> None:
     """J-Quants APIの認証を行い、トークンを設定ファイルに保存します。"""
+    from httpx import HTTPStatusError
+
     from kabukit.sources.jquants.client import AuthKey, JQuantsClient
     from kabukit.utils.config import get_config_value, save_config_key
 
@@ -26,6 +26,10 @@ MaxItems = Annotated[
     int | None,
     Option("--max-items", help="取得するデータ数を制限します。"),
 ]
+Update = Annotated[
+    bool,
+    Option("--update", help="キャッシュ済みのデータに最新のデータを追加します。"),
+]
 Quiet = Annotated[
     bool,
     Option("--quiet", "-q", help="プログレスバーおよびメッセージを表示しません。"),
@@ -76,25 +80,41 @@ async def statements(
     arg: Arg = None,
     *,
     all_: All = False,
+    update: Update = False,
     max_items: MaxItems = None,
     first: First = False,
     last: Last = False,
     quiet: Quiet = False,
 ) -> None:
     """財務情報を取得します。"""
-    from kabukit.sources.jquants.concurrent import get_statements
+    from kabukit.sources.jquants.concurrent import get_statements, update_statements
     from kabukit.utils.datetime import today
 
-    from .utils import CustomTqdm, display_dataframe, get_code_date, write_cache
+    from .utils import (
+        CustomTqdm,
+        display_dataframe,
+        get_code_date,
+        read_cache,
+        write_cache,
+    )
 
-    if arg is None and not all_:
+    if update and arg:
+        typer.echo("--update は銘柄コード・日付と同時に指定できません。", err=True)
+        raise typer.Exit(1)
+
+    if arg is None and not all_ and not update:
         arg = today(as_str=True)
 
-    df = await get_statements(
-        *get_code_date(arg),
-        max_items=max_items,
-        progress=None if arg or quiet else CustomTqdm,
-    )
+    cached = read_cache("jquants", "statements", quiet=quiet) if update else None
+
+    if cached is not None:
+        df = await update_statements(cached, progress=None if quiet else CustomTqdm)
+    else:
+        df = await get_statements(
+            *get_code_date(arg),
+            max_items=max_items,
+            progress=None if arg or quiet else CustomTqdm,
+        )
     display_dataframe(df, first=first, last=last, quiet=quiet)
 
     if not any([arg, max_items, first, last]):
@@ -106,25 +126,41 @@ async def prices(
     arg: Arg = None,
     *,
     all_: All = False,
+    update: Update = False,
     max_items: MaxItems = None,
     first: First = False,
     last: Last = False,
     quiet: Quiet = False,
 ) -> None:
     """株価情報を取得します。"""
-    from kabukit.sources.jquants.concurrent import get_prices
+    from kabukit.sources.jquants.concurrent import get_prices, update_prices
     from kabukit.utils.datetime import today
 
-    from .utils import CustomTqdm, display_dataframe, get_code_date, write_cache
+    from .utils import (
+        CustomTqdm,
+        display_dataframe,
+        get_code_date,
+        read_cache,
+        write_cache,
+    )
+
+    if update and arg:
+        typer.echo("--update は銘柄コード・日付と同時に指定できません。", err=True)
+        raise typer.Exit(1)
 
-    if arg is None and not all_:
+    if arg is None and not all_ and not update:
         arg = today(as_str=True)
 
-    df = await get_prices(
-        *get_code_date(arg),
-        max_items=max_items,
-        progress=None if arg or quiet else CustomTqdm,
-    )
+    cached = read_cache("jquants", "prices", quiet=quiet) if update else None
+
+    if cached is not None:
+        df = await update_prices(cached, progress=None if quiet else CustomTqdm)
+    else:
+        df = await get_prices(
+            *get_code_date(arg),
+            max_items=max_items,
+            progress=None if arg or quiet else CustomTqdm,
+        )
     display_dataframe(df, first=first, last=last, quiet=quiet)
 
     if not any([arg, max_items, first, last]):
@@ -136,6 +172,7 @@ async def jquants(
     arg: Arg = None,
     *,
     all_: All = False,
+    update: Update = False,
     max_items: MaxItems = None,
     first: First = False,
     last: Last = False,
@@ -149,6 +186,7 @@ async def jquants(
     await statements(
         arg,
         all_=all_,
+        update=update,
         max_items=max_items,
         first=first,
         last=last,
@@ -159,6 +197,7 @@ async def jquants(
     await prices(
         arg,
         all_=all_,
+        update=update,
         max_items=max_items,
         first=first,
         last=last,
@@ -195,6 +234,7 @@ async def edinet(
         years=10,
         max_items=max_items,
         progress=None if date or quiet else CustomTqdm,
+        cache=all_,
     )
     display_dataframe(df, first=first, last=last, quiet=quiet)
 
@@ -230,6 +270,7 @@ async def tdnet(
         date_,
         max_items=max_items,
         progress=None if date or quiet else CustomTqdm,
+        cache=all_,
     )
     display_dataframe(df, first=first, last=last, quiet=quiet)
 
@@ -253,6 +294,7 @@ async def shares(
     df = await get_shares(
         max_items=max_items,
         progress=None if quiet else CustomTqdm,
+        store=True,
     )
     display_dataframe(df, first=first, last=last, quiet=quiet)
 
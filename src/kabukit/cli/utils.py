@@ -9,7 +9,7 @@ from rich import box
 from rich.console import Console
 from rich.table import Table
 
-from kabukit.utils.cache import write
+from kabukit.utils.cache import read, write
 from kabukit.utils.params import get_code_date as _get_code_date
 
 if TYPE_CHECKING:
@@ -34,6 +34,23 @@ def get_code_date(
         raise typer.Exit(1) from None
 
 
+def read_cache(
+    source: str,
+    group: str,
+    /,
+    *,
+    quiet: bool = False,
+) -> pl.DataFrame | None:
+    try:
+        df = read(source, group)
+    except FileNotFoundError:
+        if not quiet:
+            typer.echo("キャッシュが見つからないため、全データを取得します。")
+        return None
+
+    return None if df.is_empty() else df
+
+
 def write_cache(
     df: pl.DataFrame,
     source: str,
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Self
 
-from kabukit.utils.cache import read, write
+from kabukit.utils.cache import read, scan, write
 from kabukit.utils.config import get_cache_dir
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Sequence
     from pathlib import Path
 
     import polars as pl
@@ -21,13 +21,46 @@ class Base:
         data: pl.DataFrame | None = None,
         *,
         name: str | None = None,
+        columns: Sequence[str] | None = None,
+        filters: IntoExprColumn | Iterable[IntoExprColumn] | None = None,
+        **constraints: Any,
     ) -> None:
-        if data is not None:
+        """Initialize with data, or load it from the cache.
+
+        When `columns`, `filters` or `constraints` are given, the cache file is
+        scanned lazily so that the projection and the predicates are pushed
+        down into the Parquet reader. Only the selected columns are decoded and
+        row groups that cannot match are skipped.
+
+        Args:
+            data: The data. If None, the latest cache file (or `name`) is loaded.
+            name: A specific cache filename (without extension) to load.
+            columns: The columns to keep.
+            filters: Predicates to filter the rows, as in `polars.LazyFrame.filter`.
+            **constraints: Column-value equality constraints (e.g., `Code="7203"`).
+        """
+        if columns is None and filters is None and not constraints:
+            if data is None:
+                source, group = self._get_cache_path_parts()
+                data = read(source, group, name)
+
             self.data = data
             return
 
-        source, group = self._get_cache_path_parts()
-        self.data = read(source, group, name)
+        if data is None:
+            source, group = self._get_cache_path_parts()
+            lf = scan(source, group, name)
+        else:
+            lf = data.lazy()
+
+        if filters is not None or constraints:
+            predicates = [] if filters is None else [filters]
+            lf = lf.filter(*predicates, **constraints)
+
+        if columns is not None:
+            lf = lf.select(columns)
+
+        self.data = lf.collect()
 
     @classmethod
     def _get_cache_path_parts(cls) -> tuple[str, str]:
@@ -2,33 +2,110 @@ from __future__ import annotations
 
 import asyncio
 import functools
-from typing import TYPE_CHECKING, ClassVar, Self
+from typing import TYPE_CHECKING, ClassVar, Self, TypedDict
 
 import httpx
 import tenacity
 from httpx import AsyncClient
 
+from .limiter import RateLimiter, get_retry_after
+from .response_cache import ResponseCache, get_request_url
+from .transport import create_transport
+
 if TYPE_CHECKING:
     from collections.abc import Callable
     from concurrent.futures import Executor
+    from typing import IO
 
     from httpx import Response
     from httpx._types import QueryParamTypes
 
 
+THROTTLED_STATUS_CODES = frozenset({429, 502, 503, 504})
+
+CHUNK_SIZE = 1 << 16
+"""ストリーミングでファイルに書き込むときのチャンクの大きさ (バイト)"""
+
+
+def is_throttled(e: BaseException) -> bool:
+    """例外がスロットリングまたは一時的なサーバーエラーによるものかを判定する。"""
+    return (
+        isinstance(e, httpx.HTTPStatusError)
+        and e.response.status_code in THROTTLED_STATUS_CODES
+    )
+
+
 def is_retryable(e: BaseException) -> bool:
     """例外がリトライ可能なネットワークエラーであるかを判定する。"""
+    if is_throttled(e):
+        return True
+
     return isinstance(e, (httpx.ConnectTimeout, httpx.ReadTimeout, httpx.ConnectError))
 
 
+_wait_exponential = tenacity.wait_exponential(multiplier=1, min=2, max=10)
+
+
+def wait_retry_after(retry_state: tenacity.RetryCallState) -> float:
+    """`Retry-After`ヘッダーがあればその秒数を、なければ指数関数的な待機時間を返す。"""
+    if retry_state.outcome is not None:
+        e = retry_state.outcome.exception()
+        if isinstance(e, httpx.HTTPStatusError):
+            retry_after = get_retry_after(e.response)
+            if retry_after is not None:
+                return retry_after
+
+    return _wait_exponential(retry_state)
+
+
+class ClientOptions(TypedDict, total=False):
+    """サブクラスのコンストラクタが`Client`に渡すキーワード引数。"""
+
+    rate_limit: float | None
+    """毎秒のリクエスト数の上限"""
+    cache: ResponseCache | bool
+    """レスポンスのディスクキャッシュ"""
+    limits: httpx.Limits | None
+    """コネクションプールの上限とキープアライブの有効期間"""
+    http2: bool
+    """HTTP/2を使用するか"""
+    transport: httpx.AsyncBaseTransport | None
+    """共有するトランスポート。指定したとき`limits`と`http2`は無視される"""
+
+
 class Client:
     client: AsyncClient
     base_url: ClassVar[str]
+    rate_limit: ClassVar[float | None] = None
     executor: Executor | None = None
+    limiter: RateLimiter
+    cache: ResponseCache | None = None
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        *,
+        rate_limit: float | None = None,
+        cache: ResponseCache | bool = False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if transport is None and (limits is not None or http2):
+            transport = create_transport(limits, http2=http2)
 
-    def __init__(self, executor: Executor | None = None) -> None:
-        self.client = AsyncClient(base_url=self.__class__.base_url, timeout=20)
+        self.client = AsyncClient(
+            base_url=self.__class__.base_url,
+            timeout=20,
+            transport=transport,
+        )
         self.executor = executor
+        self.limiter = RateLimiter(rate_limit or self.__class__.rate_limit)
+
+        if cache is True:
+            self.cache = ResponseCache()
+        elif isinstance(cache, ResponseCache):
+            self.cache = cache
 
     async def aclose(self) -> None:
         """HTTPクライアントを閉じる。"""
@@ -40,32 +117,208 @@ class Client:
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # pyright: ignore[reportMissingParameterType, reportUnknownParameterType]  # noqa: ANN001
         await self.aclose()
 
+    def cache_ttl(self, url: str, params: QueryParamTypes | None) -> float | None:  # noqa: ARG002
+        """レスポンスをキャッシュする有効期間 (秒) を返す。
+
+        サブクラスでエンドポイントごとに定義する。Noneのときキャッシュしない。
+
+        Args:
+            url: GETリクエストのURLパス。
+            params: リクエストのクエリパラメータ。
+
+        Returns:
+            float | None: キャッシュの有効期間。
+        """
+        return None
+
+    def is_cacheable(self, url: str, response: Response) -> bool:  # noqa: ARG002
+        """レスポンスをキャッシュに保存してよいかを返す。
+
+        HTTPステータスが成功でも、本文がエラーを表すAPIがある。
+        サブクラスでそのようなレスポンスを除外する。`download`から
+        呼ばれるときは本文を読み込んでいないので、ヘッダーだけで判定する。
+
+        Args:
+            url: GETリクエストのURLパス。
+            response: APIからのレスポンスオブジェクト。
+
+        Returns:
+            bool: 保存してよいときはTrue。
+        """
+        return True
+
+    async def get(self, url: str, /, params: QueryParamTypes | None = None) -> Response:
+        """GETリクエストを送信する。
+
+        `cache`が設定され、`cache_ttl`が有効期間を返すエンドポイントのとき、
+        レスポンスをディスクにキャッシュする。有効期間内のキャッシュがあれば
+        リクエストを送信しない。有効期間が過ぎたキャッシュにETagまたは
+        Last-Modifiedがあれば、条件付きリクエストで再検証する。
+        `is_cacheable`がFalseを返すレスポンスは保存しない。
+
+        Args:
+            url: GETリクエストのURLパス。
+            params: リクエストのクエリパラメータ。
+
+        Returns:
+            httpx.Response: APIからのレスポンスオブジェクト。
+
+        Raises:
+            httpx.HTTPStatusError: APIリクエストがHTTPエラーステータスを返した場合。
+        """
+        if self.cache is None or (ttl := self.cache_ttl(url, params)) is None:
+            return await self.request(url, params)
+
+        request_url = get_request_url(self.base_url, url, params)
+        key = self.cache.key(request_url)
+        entry = self.cache.load(key)
+
+        if entry is None:
+            response = await self.request(url, params)
+            if self.is_cacheable(url, response):
+                self.cache.store(key, request_url, response)
+            return response
+
+        if entry.is_fresh(ttl):
+            return self.cache.read(entry)
+
+        response = await self.request(url, params, entry.validators())
+
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            self.cache.touch(key, entry)
+            return self.cache.read(entry)
+
+        if self.is_cacheable(url, response):
+            self.cache.store(key, request_url, response)
+        return response
+
     @tenacity.retry(
         reraise=True,
         stop=tenacity.stop_after_attempt(3),
-        wait=tenacity.wait_exponential(multiplier=1, min=2, max=10),
+        wait=wait_retry_after,
         retry=tenacity.retry_if_exception(is_retryable),
     )
-    async def get(self, url: str, /, params: QueryParamTypes | None = None) -> Response:
-        """リトライ処理を伴うGETリクエストを送信する。
+    async def request(
+        self,
+        url: str,
+        /,
+        params: QueryParamTypes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> Response:
+        """レート制限とリトライ処理を伴うGETリクエストを送信する。
+
+        ネットワークエラー、またはスロットリング (429, 502, 503, 504) が
+        発生した場合、最大3回までリトライする。`Retry-After`ヘッダーがあれば
+        その秒数だけ、なければ指数関数的バックオフを用いて待機する。
+        スロットリングを受けると、同じクライアントの同時実行数を減らす。
+
+        Args:
+            url: GETリクエストのURLパス。
+            params: リクエストのクエリパラメータ。
+            headers: 条件付きリクエストのためのヘッダー。
+
+        Returns:
+            httpx.Response: APIからのレスポンスオブジェクト。
+                `headers`を指定したときは、304 Not Modifiedを返すことがある。
+
+        Raises:
+            httpx.HTTPStatusError: APIリクエストがHTTPエラーステータスを返した場合。
+        """
+        async with self.limiter:
+            if headers:
+                response = await self.client.get(url, params=params, headers=headers)
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    return response
+            else:
+                response = await self.client.get(url, params=params)
+
+            try:
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                if is_throttled(e):
+                    self.limiter.throttle(get_retry_after(e.response))
+                raise
+
+            self.limiter.succeed()
+            return response
+
+    async def download(
+        self,
+        url: str,
+        file: IO[bytes],
+        /,
+        params: QueryParamTypes | None = None,
+    ) -> Response:
+        """GETリクエストを送信し、レスポンスの本文をファイルに書き込む。
+
+        本文はチャンクごとに`file`に書き込み、単一のバイト列としてメモリに
+        保持しない。ZIPファイルなど大きなレスポンスに使用する。
+        書き込み後、`file`の位置は先頭に戻す。
 
-        ネットワークエラーが発生した場合、指数関数的バックオフを用いて
-        最大3回までリトライする。
+        `cache`が設定され、`cache_ttl`が有効期間を返すエンドポイントのとき、
+        有効期間内のキャッシュがあれば、リクエストを送信せずにキャッシュから
+        `file`に書き込む。`get`と異なり、条件付きリクエストによる再検証は行わない。
 
         Args:
             url: GETリクエストのURLパス。
+            file: 本文を書き込むバイナリファイル。シーク可能であること。
             params: リクエストのクエリパラメータ。
 
         Returns:
             httpx.Response: APIからのレスポンスオブジェクト。
+                本文は読み込まれていないため、ヘッダーとステータスだけを参照する。
 
         Raises:
             httpx.HTTPStatusError: APIリクエストがHTTPエラーステータスを返した場合。
         """
-        response = await self.client.get(url, params=params)
-        response.raise_for_status()
+        if self.cache is None or (ttl := self.cache_ttl(url, params)) is None:
+            return await self._download(url, file, params)
+
+        request_url = get_request_url(self.base_url, url, params)
+        key = self.cache.key(request_url)
+        entry = self.cache.load(key)
+
+        if entry is not None and entry.is_fresh(ttl):
+            return self.cache.read_into(entry, file)
+
+        response = await self._download(url, file, params)
+        if self.is_cacheable(url, response):
+            self.cache.store_file(key, request_url, response, file)
         return response
 
+    @tenacity.retry(
+        reraise=True,
+        stop=tenacity.stop_after_attempt(3),
+        wait=wait_retry_after,
+        retry=tenacity.retry_if_exception(is_retryable),
+    )
+    async def _download(
+        self,
+        url: str,
+        file: IO[bytes],
+        params: QueryParamTypes | None = None,
+    ) -> Response:
+        async with self.limiter, self.client.stream("GET", url, params=params) as r:
+            try:
+                r.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                if is_throttled(e):
+                    self.limiter.throttle(get_retry_after(e.response))
+                raise
+
+            file.seek(0)
+            file.truncate()
+
+            async for chunk in r.aiter_bytes(CHUNK_SIZE):
+                file.write(chunk)
+
+            file.flush()
+
+            self.limiter.succeed()
+
+        file.seek(0)
+        return r
+
     async def run_in_executor[**P, R](
         self,
         func: Callable[P, R],
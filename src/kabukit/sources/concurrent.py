@@ -3,24 +3,22 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import functools
+from collections.abc import AsyncIterable, Sized
 from itertools import islice
-from typing import TYPE_CHECKING, Any, Protocol
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, Unpack
 
 import polars as pl
 
 if TYPE_CHECKING:
-    from collections.abc import (
-        AsyncIterable,
-        AsyncIterator,
-        Awaitable,
-        Callable,
-        Iterable,
-    )
+    import datetime
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 
     from marimo._plugins.stateless.status import progress_bar
     from tqdm.asyncio import tqdm
 
-    from kabukit.sources.client import Client
+    from kabukit.sources.client import Client, ClientOptions
+    from kabukit.utils.partition import DailyPartitions
 
     class _Progress(Protocol):
         def __call__(
@@ -42,36 +40,159 @@ async def collect[T, R](
     /,
     max_concurrency: int | None = None,
 ) -> AsyncIterator[R]:
-    semaphore = asyncio.Semaphore(max_concurrency or MAX_CONCURRENCY)
+    """引数ごとに非同期関数を実行し、完了した順に結果を生成する。
 
-    async def func(arg: T) -> R:
-        async with semaphore:
-            return await function(arg)
+    実行中のタスクを最大`max_concurrency`個に保ち、タスクが完了するたびに
+    `args`から次の引数を取り出す。`args`は必要になるまで消費されないので、
+    長さの分からないジェネレータも渡せる。
 
-    tasks = {asyncio.create_task(func(arg)) for arg in args}
+    Args:
+        function (Callable[[T], Awaitable[R]]): 各引数に対して実行する非同期関数。
+        args (Iterable[T]): 引数のイテラブル。
+        max_concurrency (int | None, optional): 同時に実行するタスクの最大数。
+            指定しないときはデフォルト値が使用される。
+
+    Yields:
+        R: 完了したタスクの結果。
+    """
+    limit = max_concurrency or MAX_CONCURRENCY
+    it = iter(args)
+    pending: set[asyncio.Future[R]] = set()
+    done: list[asyncio.Future[R]] = []
 
     try:
-        for future in asyncio.as_completed(tasks):  # async for (python 3.13+)
-            with contextlib.suppress(asyncio.CancelledError):
-                yield await future
+        while True:
+            pending.update(
+                asyncio.ensure_future(function(arg))
+                for arg in islice(it, limit - len(pending))
+            )
+
+            while done:
+                future = done.pop()
+                with contextlib.suppress(asyncio.CancelledError):
+                    yield future.result()
+
+            if not pending:
+                break
+
+            finished, pending = await asyncio.wait(
+                pending,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            done = list(finished)
+    finally:
+        futures = [*pending, *done]
+        for future in futures:
+            future.cancel()
+        if futures:
+            await asyncio.gather(*futures, return_exceptions=True)
+
+
+async def pipeline[T, R](
+    function: Callable[[T], Awaitable[R]],
+    args: AsyncIterable[T],
+    /,
+    max_concurrency: int | None = None,
+    maxsize: int | None = None,
+) -> AsyncIterator[R]:
+    """非同期イテラブルの引数ごとに非同期関数を実行し、完了した順に結果を生成する。
+
+    `args`を消費するタスクと`function`を実行するタスクを、上限付きのキューで
+    つなぐ。引数の生成と関数の実行が並行して進むので、URLの探索とダウンロードの
+    ように段階を持つ処理は、全体の時間がおおよそ最も遅い段階の時間で済む。
+    キューが満杯のときは`args`の消費を止めるので、先読みは`maxsize`個までとなる。
+
+    Args:
+        function (Callable[[T], Awaitable[R]]): 各引数に対して実行する非同期関数。
+        args (AsyncIterable[T]): 引数の非同期イテラブル。
+        max_concurrency (int | None, optional): 同時に実行するタスクの最大数。
+            指定しないときはデフォルト値が使用される。
+        maxsize (int | None, optional): キューの上限。
+            指定しないときは同時に実行するタスクの最大数の2倍。
+
+    Yields:
+        R: 完了したタスクの結果。
+    """
+    limit = max_concurrency or MAX_CONCURRENCY
+    queue: asyncio.Queue[T] = asyncio.Queue(maxsize or 2 * limit)
+
+    async def produce() -> None:
+        async for arg in args:
+            await queue.put(arg)
+
+    producer = asyncio.ensure_future(produce())
+    getter: asyncio.Future[T] | None = None
+    pending: set[asyncio.Future[R]] = set()
+
+    try:
+        while True:
+            getter = _next_arg(queue, producer, getter, ready=len(pending) < limit)
+
+            if getter is None and not pending:
+                break
+
+            waiters: set[asyncio.Future[Any]] = {*pending}
+            waiters.update(f for f in (getter, producer) if f and not f.done())
+
+            finished, _ = await asyncio.wait(
+                waiters,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            if getter is not None and getter in finished:
+                pending.add(asyncio.ensure_future(function(getter.result())))
+                getter = None
+
+            for future in finished & pending:
+                pending.discard(future)
+                with contextlib.suppress(asyncio.CancelledError):
+                    yield future.result()
     finally:
-        for task in tasks:
-            task.cancel()
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        futures = [producer, *pending, *([getter] if getter else [])]
+        for future in futures:
+            future.cancel()
+        await asyncio.gather(*futures, return_exceptions=True)
+
+
+def _next_arg[T](
+    queue: asyncio.Queue[T],
+    producer: asyncio.Future[None],
+    getter: asyncio.Future[T] | None,
+    /,
+    *,
+    ready: bool,
+) -> asyncio.Future[T] | None:
+    """キューから次の引数を取り出すフューチャーを返す。
+
+    引数の生成が終わり、キューが空のときはNoneを返す。
+    引数の生成で例外が発生したときは、その例外を送出する。
+    """
+    if producer.done():
+        producer.result()
+
+        if queue.empty():
+            if getter is not None:
+                getter.cancel()
+            return None
+
+    if getter is None and ready:
+        return asyncio.ensure_future(queue.get())
+
+    return getter
 
 
 type Progress = type[progress_bar[Any] | tqdm[Any]] | _Progress
 
 
 async def get[T, C: Client](
-    client_factory: Callable[[], C],
+    client_factory: Callable[..., C],
     get: Callable[[C, T], Awaitable[pl.DataFrame]],
-    args: Iterable[T],
+    args: Iterable[T] | AsyncIterable[T],
     /,
     max_items: int | None = None,
     max_concurrency: int | None = None,
     progress: Progress | None = None,
+    **options: Unpack[ClientOptions],
 ) -> pl.DataFrame:
     """各種データを取得し、単一のDataFrameにまとめて返す。
 
@@ -81,27 +202,227 @@ async def get[T, C: Client](
             JQuantsClientやEdinetClientなど、Clientを継承したクラスを指定できる。
         get (Callable[[Client, T], Awaitable[pl.DataFrame]]): 取得するClientクラスの
             メソッドデータ。
-        args (Iterable[T]): 取得対象の引数のリスト。
+        args (Iterable[T] | AsyncIterable[T]): 取得対象の引数のリスト。
+            非同期イテラブルのときは、引数の生成と取得を上限付きのキューで
+            つなぎ、並行して実行する (`pipeline`を参照)。
         max_items (int | None, optional): 取得数する上限。
         max_concurrency (int | None, optional): 同時に実行するリクエストの最大数。
             指定しないときはデフォルト値が使用される。
         progress (Progress | None, optional): 進捗表示のための関数。
             tqdm, marimoなどのライブラリを使用できる。
             指定しないときは進捗表示は行われない。
+        **options (ClientOptions): `client_factory`に渡すキーワード引数。
+            `limits`でコネクションプールの上限とキープアライブの有効期間を、
+            `http2`でHTTP/2の使用を指定できる。`transport`に
+            `SharedTransport`を指定すると、複数の呼び出しでコネクションを共有する。
 
     Returns:
         DataFrame:
             すべての情報を含む単一のDataFrame。
     """
-    args = list(islice(args, max_items))
-    total = len(args)
+    async with client_factory(**options) as client:
+        ait = _iter_results(
+            client,
+            get,
+            args,
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+        dfs = [df async for df in ait]
+        return pl.concat(dfs, how="vertical_relaxed") if dfs else pl.DataFrame()
+
+
+async def sink[T, C: Client](
+    client_factory: Callable[..., C],
+    get: Callable[[C, T], Awaitable[pl.DataFrame]],
+    args: Iterable[T] | AsyncIterable[T],
+    path: str | Path,
+    /,
+    max_items: int | None = None,
+    max_concurrency: int | None = None,
+    progress: Progress | None = None,
+    batch_size: int = 100,
+    **options: Unpack[ClientOptions],
+) -> pl.LazyFrame:
+    """各種データを取得し、Parquetファイルに逐次書き出す。
+
+    `get`とは異なり、取得したDataFrameをメモリに保持し続けない。
+    `batch_size`個の結果が揃うたびに、ディレクトリ`path`に
+    `part-NNNNN.parquet`として書き出す。すべての結果を単一の
+    DataFrameに結合する必要がないため、ピークメモリはバッチの大きさで抑えられる。
+
+    Args:
+        client_factory (Callable[[], Client]): Clientインスタンスを生成する
+            呼び出し可能オブジェクト。
+        get (Callable[[Client, T], Awaitable[pl.DataFrame]]): 取得するClientクラスの
+            メソッドデータ。
+        args (Iterable[T] | AsyncIterable[T]): 取得対象の引数のリスト。
+            非同期イテラブルのときは、引数の生成と取得を上限付きのキューで
+            つなぎ、並行して実行する (`pipeline`を参照)。
+        path (str | Path): Parquetファイルを書き出すディレクトリ。
+            存在しないときは作成する。以前の書き出しの`part-*.parquet`が
+            残らないように、書き出す前に削除する。その他のファイルは削除しない。
+        max_items (int | None, optional): 取得数する上限。
+        max_concurrency (int | None, optional): 同時に実行するリクエストの最大数。
+            指定しないときはデフォルト値が使用される。
+        progress (Progress | None, optional): 進捗表示のための関数。
+            tqdm, marimoなどのライブラリを使用できる。
+            指定しないときは進捗表示は行われない。
+        batch_size (int, optional): 1つのファイルにまとめる結果の数。
+            デフォルトは100。
+        **options (ClientOptions): `client_factory`に渡すキーワード引数。
+            `limits`でコネクションプールの上限とキープアライブの有効期間を、
+            `http2`でHTTP/2の使用を指定できる。`transport`に
+            `SharedTransport`を指定すると、複数の呼び出しでコネクションを共有する。
+
+    Returns:
+        LazyFrame:
+            書き出したすべてのファイルを読み込むLazyFrame。
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    for file in path.glob("part-*.parquet"):
+        file.unlink()
+
+    files: list[Path] = []
+    batch: list[pl.DataFrame] = []
+
+    def flush() -> None:
+        filename = path / f"part-{len(files):05d}.parquet"
+        pl.concat(batch, how="vertical_relaxed").write_parquet(filename)
+        files.append(filename)
+        batch.clear()
+
+    async with client_factory(**options) as client:
+        ait = _iter_results(
+            client,
+            get,
+            args,
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+        async for df in ait:
+            batch.append(df)
+            if len(batch) >= batch_size:
+                flush()
+
+    if batch:
+        flush()
+
+    if not files:
+        return pl.LazyFrame()
+
+    lfs = [pl.scan_parquet(file) for file in files]
+    return pl.concat(lfs, how="diagonal_relaxed")
+
+
+async def get_daily[C: Client](
+    client_factory: Callable[..., C],
+    get: Callable[[C, datetime.date], Awaitable[pl.DataFrame]],
+    dates: Iterable[datetime.date],
+    partitions: DailyPartitions,
+    /,
+    max_items: int | None = None,
+    max_concurrency: int | None = None,
+    progress: Progress | None = None,
+    **options: Unpack[ClientOptions],
+) -> pl.DataFrame:
+    """日ごとのデータを、キャッシュにない日だけ取得して返す。
+
+    `partitions`に確定済みとして保存されている日は取得しない。
+    取得した日の結果は`partitions`に保存し、最後に対象のすべての日の
+    データを`partitions`から読み込んで返す。
+
+    Args:
+        client_factory (Callable[[], Client]): Clientインスタンスを生成する
+            呼び出し可能オブジェクト。
+        get (Callable[[Client, datetime.date], Awaitable[pl.DataFrame]]):
+            取得するClientクラスのメソッド。
+        dates (Iterable[datetime.date]): 取得対象の日付のリスト。
+        partitions (DailyPartitions): 日ごとのデータを保存するキャッシュ。
+        max_items (int | None, optional): 取得する日数の上限。
+            キャッシュから読み込む日は数えない。
+        max_concurrency (int | None, optional): 同時に実行するリクエストの最大数。
+            指定しないときはデフォルト値が使用される。
+        progress (Progress | None, optional): 進捗表示のための関数。
+            tqdm, marimoなどのライブラリを使用できる。
+            指定しないときは進捗表示は行われない。
+        **options (ClientOptions): `client_factory`に渡すキーワード引数。
+
+    Returns:
+        DataFrame:
+            対象のすべての日のデータを含む単一のDataFrame。
+    """
+    dates = list(dates)
+
+    async def fetch(client: C, date: datetime.date) -> pl.DataFrame:
+        df = await get(client, date)
+        partitions.write(date, df)
+        return df
+
+    async with client_factory(**options) as client:
+        ait = _iter_results(
+            client,
+            fetch,
+            partitions.missing(dates),
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+        try:
+            async for _ in ait:
+                pass
+        finally:
+            partitions.flush()
+
+    return partitions.read(dates)
+
+
+async def _iter_results[T, C: Client](
+    client: C,
+    get: Callable[[C, T], Awaitable[pl.DataFrame]],
+    args: Iterable[T] | AsyncIterable[T],
+    /,
+    max_items: int | None = None,
+    max_concurrency: int | None = None,
+    progress: Progress | None = None,
+) -> AsyncIterator[pl.DataFrame]:
+    function = functools.partial(get, client)
+    total: int | None = None
+
+    if isinstance(args, AsyncIterable):
+        if max_items is not None:
+            args = _aislice(args, max_items)
+
+        ait = pipeline(function, args, max_concurrency=max_concurrency)
+
+    else:
+        total = len(args) if isinstance(args, Sized) else None
+
+        if max_items is not None:
+            args = islice(args, max_items)
+            total = None if total is None else min(total, max_items)
 
-    async with client_factory() as client:
-        function = functools.partial(get, client)
         ait = collect(function, args, max_concurrency=max_concurrency)
 
-        if progress:
-            ait = progress(ait, total=total)
+    if progress:
+        ait = progress(ait, total=total)
 
-        dfs = [df async for df in ait if not df.is_empty()]
-        return pl.concat(dfs, how="vertical_relaxed") if dfs else pl.DataFrame()
+    async for df in ait:
+        if not df.is_empty():
+            yield df
+
+
+async def _aislice[T](aiterable: AsyncIterable[T], stop: int, /) -> AsyncIterator[T]:
+    if stop <= 0:
+        return
+
+    count = 0
+    async for item in aiterable:
+        yield item
+        count += 1
+        if count >= stop:
+            return
@@ -1,37 +1,128 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import datetime
 from typing import final
 
 import polars as pl
 
+from kabukit.utils.business_calendar import BusinessCalendar
+
 # pyright: reportImportCycles=false
 
 
+CALENDAR_MARGIN = datetime.timedelta(days=14)
+"""翌営業日を求めるために、対象の日付より先にカレンダーが必要な日数"""
+
+
 @final
 class _CalendarCacheManager:
+    """`with_date`が使う営業日カレンダーを管理する。
+
+    カレンダーは、メモリ、ディスクキャッシュ (`jquants/calendar`)、
+    J-Quants APIの順に探す。必要な日付までカバーしていないときだけ
+    次の取得元を使う。APIから取得したカレンダーはディスクキャッシュに保存する。
+    """
+
     def __init__(self) -> None:
-        self._holidays: list[datetime.date] | None = None
+        self._calendar: pl.DataFrame | None = None
+        self._business_calendar: BusinessCalendar | None = None
+        self._complete = False
         self._lock = asyncio.Lock()
 
-    async def get_holidays(self) -> list[datetime.date]:
-        from kabukit.sources.jquants.client import JQuantsClient
+    def set_calendar(self, calendar: pl.DataFrame) -> None:
+        self._set(calendar)
+        self._complete = True
+
+    def _set(self, calendar: pl.DataFrame) -> None:
+        self._calendar = calendar.select("Date", "IsHoliday")
+        self._business_calendar = None
 
+    async def get_calendar(self, until: datetime.date | None = None) -> pl.DataFrame:
         async with self._lock:
-            if self._holidays is None:
-                async with JQuantsClient() as client:
-                    df = await client.get_calendar()
+            calendar = self._calendar
+
+            if calendar is None or not self._covers(calendar, until):
+                calendar = _read_calendar()
+
+                if calendar is None or not self._covers(calendar, until):
+                    calendar = await _fetch_calendar()
+                    self._complete = True
+
+                self._set(calendar)
+
+            return calendar
+
+    async def get_holidays(
+        self,
+        until: datetime.date | None = None,
+    ) -> list[datetime.date]:
+        calendar = await self.get_calendar(until)
+        return calendar.filter(pl.col("IsHoliday"))["Date"].to_list()
+
+    async def get_business_calendar(
+        self,
+        until: datetime.date | None = None,
+    ) -> BusinessCalendar:
+        calendar = await self.get_calendar(until)
+
+        if self._business_calendar is None:
+            self._business_calendar = BusinessCalendar.from_frame(calendar)
+
+        return self._business_calendar
+
+    def _covers(self, calendar: pl.DataFrame, until: datetime.date | None) -> bool:
+        if calendar.is_empty():
+            return False
+
+        if self._complete or until is None:
+            return True
+
+        end = calendar["Date"].max()
+        return isinstance(end, datetime.date) and end >= until
 
-                holidays = df.filter(pl.col("IsHoliday"))["Date"]
-                self._holidays = holidays.to_list()
 
-            return self._holidays
+def _read_calendar() -> pl.DataFrame | None:
+    from kabukit.utils import cache
+
+    try:
+        return cache.read("jquants", "calendar").select("Date", "IsHoliday")
+    except (FileNotFoundError, pl.exceptions.ColumnNotFoundError):
+        return None
+
+
+async def _fetch_calendar() -> pl.DataFrame:
+    from kabukit.sources.jquants.client import JQuantsClient
+    from kabukit.utils import cache
+
+    async with JQuantsClient() as client:
+        df = await client.get_calendar()
+
+    if not df.is_empty():
+        with contextlib.suppress(OSError):
+            cache.write("jquants", "calendar", df)
+
+    return df
 
 
 _calendar_cache_manager = _CalendarCacheManager()
 
 
+def set_calendar(calendar: pl.DataFrame) -> None:
+    """`with_date`が使う営業日カレンダーを設定する。
+
+    設定したカレンダーは、ディスクキャッシュやJ-Quants APIより優先して
+    使用される。オフラインで実行するときや、多数の短命なワーカーに
+    同じカレンダーを配るときに使う。
+
+    Args:
+        calendar (pl.DataFrame): `Date`列と`IsHoliday`列を持つDataFrame。
+            `get_calendar`の戻り値をそのまま指定できる。
+    """
+    _calendar_cache_manager.set_calendar(calendar)
+
+
 async def with_date(df: pl.DataFrame) -> pl.DataFrame:
     """`Date`列を追加する。
 
@@ -43,12 +134,29 @@ async def with_date(df: pl.DataFrame) -> pl.DataFrame:
     - SubmittedTime: 15時00分
 
     とする。
+
+    営業日カレンダーは、`set_calendar`で設定したもの、ディスクキャッシュ、
+    J-Quants APIの順に探す。キャッシュが対象の日付までカバーしていないときだけ
+    APIから取得する。
     """
-    holidays = await _calendar_cache_manager.get_holidays()
-    return _with_date(df, holidays)
+    calendar = await _calendar_cache_manager.get_business_calendar(_get_until(df))
+    return _with_date(df, calendar)
+
 
+def _get_until(df: pl.DataFrame) -> datetime.date | None:
+    for name in ["DisclosedDate", "SubmittedDate"]:
+        if name in df.columns:
+            date = df[name].max()
+            if isinstance(date, datetime.date):
+                return date + CALENDAR_MARGIN
 
-def _with_date(df: pl.DataFrame, holidays: list[datetime.date]) -> pl.DataFrame:
+    return None
+
+
+def _with_date(
+    df: pl.DataFrame,
+    holidays: BusinessCalendar | list[datetime.date],
+) -> pl.DataFrame:
     if "DisclosedDate" in df.columns and "DisclosedTime" in df.columns:
         prefix, limit = "Disclosed", datetime.time(15, 30)
     elif "SubmittedDate" in df.columns and "SubmittedTime" in df.columns:
@@ -58,14 +166,17 @@ def _with_date(df: pl.DataFrame, holidays: list[datetime.date]) -> pl.DataFrame:
         msg += " or SubmittedDate and SubmittedTime columns."
         raise ValueError(msg)
 
+    if isinstance(holidays, list):
+        holidays = BusinessCalendar(holidays)
+
     is_null = pl.col(f"{prefix}Time").is_null()
     is_late = pl.col(f"{prefix}Time") >= limit
 
-    return df.select(
-        pl.when(is_null | is_late)
+    date = (
+        pl
+        .when(is_null | is_late)
         .then(pl.col(f"{prefix}Date") + datetime.timedelta(days=1))
         .otherwise(pl.col(f"{prefix}Date"))
-        .dt.add_business_days(0, holidays=holidays, roll="forward")
-        .alias("Date"),
-        pl.all(),
     )
+
+    return df.select(holidays.roll_forward(date).alias("Date"), pl.all())
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import contextlib
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from enum import StrEnum
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Unpack
 
 import polars as pl
 
 from kabukit.sources.client import Client
 from kabukit.sources.datetime import with_date
+from kabukit.sources.response_cache import IMMUTABLE, ttl_for_date
 from kabukit.utils.config import get_config_value
 from kabukit.utils.params import get_params
 
@@ -15,12 +19,43 @@ from .transform import transform_list
 
 if TYPE_CHECKING:
     import datetime
+    from collections.abc import AsyncGenerator
     from concurrent.futures import Executor
+    from typing import IO
+
+    from httpx import Response
+    from httpx._types import QueryParamTypes
+
+    from kabukit.sources.client import ClientOptions
+
+    from .store import DocumentStore
 
 
 API_VERSION = "v2"
 BASE_URL = f"https://api.edinet-fsa.go.jp/api/{API_VERSION}"
 
+SPOOL_SIZE = 1 << 20
+"""ZIPファイルをメモリ上に保持する上限 (バイト)。超えると一時ファイルに書き出す。"""
+
+
+def check_status(metadata: dict[str, Any]) -> None:
+    """書類一覧APIのレスポンスの`metadata`がエラーでないかを確認する。
+
+    EDINET APIは、エラーもHTTPステータス200のJSONで返す。
+
+    Args:
+        metadata (dict[str, Any]): レスポンスの`metadata`。
+
+    Raises:
+        ValueError: `metadata.status`が"200"でない場合。
+    """
+    status = metadata.get("status")
+
+    if status != "200":
+        msg = f"EDINET APIがエラーを返した (status: {status}, "
+        msg += f"message: {metadata.get('message')})。"
+        raise ValueError(msg)
+
 
 class AuthKey(StrEnum):
     """EDINET認証のための環境変数キー。"""
@@ -44,10 +79,46 @@ class EdinetClient(Client):
         self,
         api_key: str | None = None,
         executor: Executor | None = None,
+        **kwargs: Unpack[ClientOptions],
     ) -> None:
-        super().__init__(executor=executor)
+        super().__init__(executor=executor, **kwargs)
         self.set_api_key(api_key)
 
+    def cache_ttl(self, url: str, params: QueryParamTypes | None) -> float | None:
+        """レスポンスをキャッシュする有効期間 (秒) を返す。
+
+        書類は変更されないため無期限とする。書類一覧は、過去のファイル日付の
+        ときは無期限、当日以降のときは短時間とする。
+        """
+        if url.startswith("/documents/"):
+            return IMMUTABLE
+
+        if url == "/documents.json" and isinstance(params, dict):
+            date = params.get("date")
+            if isinstance(date, str):
+                return ttl_for_date(date)
+
+        return None
+
+    def is_cacheable(self, url: str, response: Response) -> bool:
+        """レスポンスをキャッシュに保存してよいかを返す。
+
+        EDINET APIは、エラーもHTTPステータス200のJSONで返す。書類一覧は
+        `metadata.status`が"200"のときだけ、書類はJSON以外のときだけ保存する。
+        """
+        content_type = response.headers.get("content-type", "")
+
+        if not content_type.startswith("application/json"):
+            return True
+
+        if url != "/documents.json":
+            return False
+
+        try:
+            return response.json()["metadata"]["status"] == "200"
+        except (ValueError, KeyError, TypeError):
+            return False
+
     def set_api_key(self, api_key: str | None = None) -> None:
         """HTTPクエリパラメータにAPIキーを設定する。
 
@@ -69,14 +140,15 @@ class EdinetClient(Client):
 
         Returns:
             int: 指定日の提出書類数。
+
+        Raises:
+            ValueError: APIがエラーを返した場合。書類がない日と区別するため、
+                0を返さずに例外を送出する。
         """
         params = get_params(date=date, type=1)
         response = await self.get("/documents.json", params)
-        data = response.json()
-        metadata = data["metadata"]
-
-        if metadata["status"] != "200":
-            return 0
+        metadata = response.json()["metadata"]
+        check_status(metadata)
 
         return metadata["resultset"]["count"]
 
@@ -95,11 +167,18 @@ class EdinetClient(Client):
 
         Returns:
             pl.DataFrame: 提出書類一覧を格納したDataFrame。
+
+        Raises:
+            ValueError: APIがエラーを返した場合。書類がない日と区別するため、
+                空のDataFrameを返さずに例外を送出する。
         """
         params = get_params(date=date, type=2)
         response = await self.get("/documents.json", params)
         data = response.json()
 
+        if "metadata" in data:
+            check_status(data["metadata"])
+
         if "results" not in data:
             return pl.DataFrame()
 
@@ -142,6 +221,8 @@ class EdinetClient(Client):
             4 英文ファイル ZIP 形式
             5 CSV ZIP 形式
 
+        ZIPファイル全体をメモリに読み込む。大きな書類には`open_zip`を使う。
+
         Args:
             doc_id: EDINETの書類ID。
             doc_type: 書類タイプ (通常は5:CSV)。
@@ -157,9 +238,61 @@ class EdinetClient(Client):
 
         return None
 
+    @contextlib.asynccontextmanager
+    async def open_zip(
+        self,
+        doc_id: str,
+        doc_type: int,
+    ) -> AsyncGenerator[IO[bytes] | None]:
+        """ZIP形式の書類を一時ファイルにダウンロードし、そのファイルを返す。
+
+        `get_zip`と異なり、ZIPファイル全体を単一のバイト列として保持しない。
+        `SPOOL_SIZE`を超えるZIPファイルはディスク上の一時ファイルに書き出し、
+        コンテキストを抜けると削除する。`executor`がプロセスプールのときは、
+        常にディスク上の名前付きの一時ファイルに書き出す。
+
+        Example:
+            ```python
+            async with client.open_zip(doc_id, doc_type=5) as file:
+                if file is not None:
+                    df = parse_csv(file, doc_id)
+            ```
+
+        Args:
+            doc_id: EDINETの書類ID。
+            doc_type: 書類タイプ。`get_zip`を参照。
+
+        Yields:
+            IO[bytes] | None: ZIPファイル。Noneの場合、ZIPが存在しない。
+        """
+        with self._temporary_file() as file:
+            url = f"/documents/{doc_id}"
+            response = await self.download(url, file, {"type": doc_type})
+
+            if response.headers["content-type"] == "application/octet-stream":
+                yield file
+            else:
+                yield None
+
+    def _temporary_file(self) -> IO[bytes]:
+        if not isinstance(self.executor, ProcessPoolExecutor):
+            return tempfile.SpooledTemporaryFile(SPOOL_SIZE)
+
+        # ワーカープロセスからパスで開けるように、名前付きのファイルにする
+        return tempfile.NamedTemporaryFile(delete_on_close=False)
+
+    def _zip_source(self, file: IO[bytes]) -> IO[bytes] | str:
+        if isinstance(self.executor, ProcessPoolExecutor):
+            return file.name
+
+        return file
+
     async def get_xbrl(self, doc_id: str) -> str | None:
         """XBRL形式の書類を取得する。
 
+        ZIPファイルの展開と復号はCPUバウンドなので、`executor`属性が
+        設定されているときはエグゼキューターで実行する。
+
         Args:
             doc_id: EDINETの書類ID。
 
@@ -168,12 +301,11 @@ class EdinetClient(Client):
                 Noneの場合、XBRLが存在しない。
         """
 
-        content = await self.get_zip(doc_id, doc_type=1)
+        async with self.open_zip(doc_id, doc_type=1) as file:
+            if file is None:
+                return None
 
-        if content is None:
-            return None
-
-        return parse_xbrl(content)
+            return await self.run_in_executor(parse_xbrl, self._zip_source(file))
 
     async def get_csv(self, doc_id: str) -> pl.DataFrame:
         """CSV形式の書類(XBRL)を取得し、DataFrameに変換する。
@@ -181,18 +313,57 @@ class EdinetClient(Client):
         書類取得API (`type=5`) で取得したZIPファイルの中からCSVファイルを
         探し出し、DataFrameとして読み込む。
 
+        ZIPファイルの展開とCSVのパース処理はCPUバウンドなので、`executor`属性が
+        設定されているときはエグゼキューターで実行する。
+
         Args:
             doc_id: EDINETの書類ID。
 
         Returns:
             pl.DataFrame: CSVデータを含むDataFrame。
         """
-        content = await self.get_zip(doc_id, doc_type=5)
+        async with self.open_zip(doc_id, doc_type=5) as file:
+            if file is None:
+                return pl.DataFrame()
 
-        if content is None:
-            return pl.DataFrame()
+            source = self._zip_source(file)
+            return await self.run_in_executor(parse_csv, source, doc_id)
+
+    async def save_document(
+        self,
+        doc_id: str,
+        store: DocumentStore,
+        *,
+        doc_type: int = 2,
+    ) -> pl.DataFrame:
+        """書類をストアに保存し、その参照を返す。
+
+        書類の内容をDataFrameに含めないので、多数のPDFやZIPファイルを
+        取得してもメモリを消費しない。すでに保存した書類はダウンロードしない。
+
+        Args:
+            doc_id: EDINETの書類ID。
+            store: 書類を保存するストア。
+            doc_type: 書類タイプ (デフォルトは2:PDF)。`get_zip`を参照。
+
+        Returns:
+            pl.DataFrame: 書類ID、書類タイプ、パス、サイズ、SHA-256ハッシュを
+                含む1行のDataFrame。書類が存在しないときは空のDataFrame。
+        """
+        if (ref := store.get(doc_id, doc_type)) is not None:
+            return ref
+
+        pdf = doc_type == 2
+        content_type = "application/pdf" if pdf else "application/octet-stream"
+
+        with tempfile.SpooledTemporaryFile(SPOOL_SIZE) as file:
+            url = f"/documents/{doc_id}"
+            response = await self.download(url, file, {"type": doc_type})
+
+            if response.headers["content-type"] != content_type:
+                return pl.DataFrame()
 
-        return parse_csv(content, doc_id)
+            return store.put(doc_id, doc_type, file)
 
     async def get_document(self, doc_id: str, *, pdf: bool = False) -> pl.DataFrame:
         """指定したIDの書類を取得する。
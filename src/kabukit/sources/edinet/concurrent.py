@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING
 
 import polars as pl
 
 from kabukit.sources import concurrent
-from kabukit.utils.datetime import get_past_dates
+from kabukit.utils.datetime import get_past_dates, parse_date
+from kabukit.utils.partition import DailyPartitions
 
 from .client import EdinetClient
+from .store import SCHEMA, DocumentStore
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Awaitable, Iterable
+    from pathlib import Path
 
     from kabukit.sources.concurrent import Progress
 
@@ -24,6 +30,8 @@ async def get_list(
     max_items: int | None = None,
     max_concurrency: int = 12,
     progress: Progress | None = None,
+    *,
+    cache: bool = False,
 ) -> pl.DataFrame:
     """過去 days 日または years 年の文書一覧を取得し、単一の DataFrame にまとめて返す。
 
@@ -40,11 +48,17 @@ async def get_list(
         progress (Progress | None, optional): 進捗表示のための関数。
             tqdm, marimoなどのライブラリを使用できる。
             指定しないときは進捗表示は行われない。
+        cache (bool, optional): Trueのとき、日ごとの文書一覧をキャッシュに保存し、
+            確定済みの日はキャッシュから読み込む。`backfill_list`と同じく、
+            書類数を確認して書類がある日だけ一覧を取得する。デフォルトはFalse。
 
     Returns:
         DataFrame:
             文書一覧を含む単一のDataFrame。
     """
+    if isinstance(dates, (str, datetime.date)) and cache:
+        dates = [dates]
+
     if isinstance(dates, (str, datetime.date)):
         async with EdinetClient() as client:
             return await client.get_list(dates)
@@ -52,10 +66,85 @@ async def get_list(
     if dates is None:
         dates = get_past_dates(days=days, years=years)
 
-    df = await concurrent.get(
+    if cache:
+        df = await concurrent.get_daily(
+            EdinetClient,
+            _get_list_if_any,
+            [parse_date(d) if isinstance(d, str) else d for d in dates],
+            DailyPartitions("edinet", "list", "FileDate"),
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+    else:
+        df = await concurrent.get(
+            EdinetClient,
+            EdinetClient.get_list,
+            dates,
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+
+    if df.is_empty():
+        return pl.DataFrame()
+
+    return df.sort("Code", "Date")
+
+
+async def backfill_list(
+    dates: Iterable[datetime.date | str] | None = None,
+    /,
+    days: int | None = None,
+    years: int | None = None,
+    path: str | Path | None = None,
+    max_items: int | None = None,
+    max_concurrency: int = 12,
+    progress: Progress | None = None,
+) -> pl.DataFrame:
+    """長期間の文書一覧を、提出書類のない日を省いて取得する。
+
+    各日について、まず書類数だけを返す軽いリクエスト (`get_count`) を送り、
+    提出書類がある日だけ文書一覧を取得する。週末や祝日など、書類のない日の
+    文書一覧は取得しない。
+
+    日ごとの結果は`get_list(cache=True)`と同じ`DailyPartitions`に保存する。
+    取得した時点で過ぎていた日は確定として、次の呼び出しでは取得せずに
+    読み込む。当日以降の日は、書類が追加されうるので常に取得する。
+    APIがエラーを返した日は保存せずに例外を送出するので、中断した後に
+    同じ`path`で呼び出すと、保存していない日から再開する。
+
+    Args:
+        dates (Iterable[datetime.date | str] | None): 取得対象の日付のリスト。
+            None の場合は days または years に基づいて日付リストを生成する。
+        days (int | None): 過去 days 日の日付リストを取得する。
+        years (int | None): 過去 years 年の日付リストを取得する。
+            daysが指定されている場合は無視される。
+        path (str | Path | None, optional): 日ごとの結果を保存するディレクトリ。
+            指定しないときはキャッシュディレクトリの`edinet/list`。
+        max_items (int | None, optional): 取得する日数の上限。
+            保存済みの日は数えない。
+        max_concurrency (int, optional): 同時に実行するリクエストの最大数。
+            デフォルトは12。
+        progress (Progress | None, optional): 進捗表示のための関数。
+            tqdm, marimoなどのライブラリを使用できる。
+            指定しないときは進捗表示は行われない。
+
+    Returns:
+        DataFrame:
+            文書一覧を含む単一のDataFrame。
+
+    Raises:
+        ValueError: APIがエラーを返した場合。
+    """
+    if dates is None:
+        dates = get_past_dates(days=days, years=years)
+
+    df = await concurrent.get_daily(
         EdinetClient,
-        EdinetClient.get_list,
-        dates,
+        _get_list_if_any,
+        [parse_date(d) if isinstance(d, str) else d for d in dates],
+        DailyPartitions("edinet", "list", "FileDate", path=path),
         max_items=max_items,
         max_concurrency=max_concurrency,
         progress=progress,
@@ -67,6 +156,13 @@ async def get_list(
     return df.sort("Code", "Date")
 
 
+async def _get_list_if_any(client: EdinetClient, date: datetime.date) -> pl.DataFrame:
+    if not await client.get_count(date):
+        return pl.DataFrame()
+
+    return await client.get_list(date)
+
+
 async def get_documents(
     doc_ids: Iterable[str] | str,
     /,
@@ -75,9 +171,16 @@ async def get_documents(
     progress: Progress | None = None,
     *,
     pdf: bool = False,
+    store: DocumentStore | bool = False,
+    max_workers: int | None = None,
 ) -> pl.DataFrame:
     """文書をCSV形式またはPDF形式で取得し、単一のDataFrameにまとめて返す。
 
+    `store`を指定すると、書類の内容ではなく、ストアに保存したファイルの参照
+    (`DocumentId`, `DocumentType`, `Path`, `Size`, `Sha256`) を返す。
+    PDF形式 (`pdf=True`) ではPDFファイルを、CSV形式ではCSVを含むZIPファイルを
+    保存する。すでに保存した書類はダウンロードしない。
+
     Args:
         doc_ids (Iterable[str] | str): 取得対象の文書IDのリスト。
         max_items (int | None, optional): 取得数の上限。
@@ -87,21 +190,90 @@ async def get_documents(
             tqdm, marimoなどのライブラリを使用できる。
             指定しないときは進捗表示は行われない。
         pdf (bool): PDF形式で取得する場合はTrue、CSV形式で取得する場合はFalse。
+        store (DocumentStore | bool, optional): 書類を保存するストア。
+            Trueのときはキャッシュディレクトリのストアを使用する。
+        max_workers (int | None, optional): CSV形式の書類のZIPファイルの展開と
+            パース処理を実行するための、ワーカープロセスの最大数。
+            指定しないときは`ProcessPoolExecutor`のデフォルト値が使用される。
+            PDF形式 (`pdf=True`) や`store`を指定したときはパース処理を
+            行わないので、使用しない。
 
     Returns:
         DataFrame:
             文書含む単一のDataFrame。
     """
+    if store:
+        if store is True:
+            store = DocumentStore()
+
+        return await _save_documents(
+            doc_ids,
+            store,
+            doc_type=2 if pdf else 5,
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+
     if isinstance(doc_ids, str):
         async with EdinetClient() as client:
             return await client.get_document(doc_ids, pdf=pdf)
 
-    df = await concurrent.get(
-        EdinetClient,
-        EdinetClient.get_pdf if pdf else EdinetClient.get_csv,
-        doc_ids,
-        max_items=max_items,
-        max_concurrency=max_concurrency,
-        progress=progress,
-    )
+    if pdf:
+        df = await concurrent.get(
+            EdinetClient,
+            EdinetClient.get_pdf,
+            doc_ids,
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+        return df.sort("DocumentId")
+
+    # polarsはfork後の子プロセスでデッドロックすることがあるので、spawnを使う
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(max_workers, mp_context=context) as executor:
+        df = await concurrent.get(
+            functools.partial(EdinetClient, executor=executor),
+            EdinetClient.get_csv,
+            doc_ids,
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+
+    return df.sort("DocumentId")
+
+
+async def _save_documents(
+    doc_ids: Iterable[str] | str,
+    store: DocumentStore,
+    /,
+    doc_type: int,
+    max_items: int | None = None,
+    max_concurrency: int = 12,
+    progress: Progress | None = None,
+) -> pl.DataFrame:
+    if isinstance(doc_ids, str):
+        doc_ids = [doc_ids]
+
+    def save(client: EdinetClient, doc_id: str) -> Awaitable[pl.DataFrame]:
+        return client.save_document(doc_id, store, doc_type=doc_type)
+
+    try:
+        df = await concurrent.get(
+            EdinetClient,
+            save,
+            doc_ids,
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+    finally:
+        store.flush()
+
+    if df.is_empty():
+        return pl.DataFrame(schema=SCHEMA)
+
     return df.sort("DocumentId")
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import re
+from typing import TYPE_CHECKING
 
 import polars as pl
 
 from kabukit.sources.utils import iter_contents
 
+if TYPE_CHECKING:
+    from typing import IO
+
 
 def parse_pdf(content: bytes, doc_id: str) -> pl.DataFrame:
     return pl.DataFrame({"DocumentId": [doc_id], "PdfContent": [content]})
 
 
-def parse_csv(content: bytes, doc_id: str) -> pl.DataFrame:
+def parse_csv(content: bytes | IO[bytes] | str, doc_id: str) -> pl.DataFrame:
     pattern = re.compile(r"^.+\.csv$")
 
     for csv in iter_contents(content, pattern):
@@ -32,7 +36,7 @@ def read_csv(content: bytes) -> pl.DataFrame:
     )
 
 
-def parse_xbrl(content: bytes) -> str | None:
+def parse_xbrl(content: bytes | IO[bytes] | str) -> str | None:
     pattern = re.compile(r"^XBRL/PublicDoc/.+\.xbrl$")
 
     for xbrl in iter_contents(content, pattern):
@@ -0,0 +1,169 @@
+"""EDINETの書類ファイルをキャッシュディレクトリに保存するためのモジュール。
+
+PDFやZIPファイルは内容のSHA-256ハッシュをファイル名として保存し、
+同じ内容のファイルは一度だけ保存する。書類IDと書類タイプから
+ファイルを引くための索引をParquetファイルとして保存する。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, final
+
+import polars as pl
+
+from kabukit.utils.config import get_cache_dir
+
+if TYPE_CHECKING:
+    from typing import IO
+
+INDEX = "index.parquet"
+"""索引のファイル名"""
+
+SUFFIXES = {1: ".zip", 2: ".pdf", 3: ".zip", 4: ".zip", 5: ".zip"}
+"""書類タイプごとのファイルの拡張子"""
+
+SCHEMA = {
+    "DocumentId": pl.String,
+    "DocumentType": pl.UInt8,
+    "Path": pl.String,
+    "Size": pl.Int64,
+    "Sha256": pl.String,
+}
+"""`DocumentStore`が返す参照のスキーマ"""
+
+
+@final
+class DocumentStore:
+    """書類ファイルのコンテンツアドレス型ストア。
+
+    `objects/<ハッシュの先頭2文字>/<ハッシュ><拡張子>`にファイルを保存し、
+    書類IDと書類タイプの組から、パス、サイズ、ハッシュを引く索引を
+    `index.parquet`に保存する。索引はメモリ上で更新するので、
+    `flush`を呼び出して保存する。
+
+    Args:
+        path (str | Path | None, optional): 保存先のディレクトリ。
+            指定しないときはキャッシュディレクトリの`edinet/documents`。
+
+    Attributes:
+        path (Path): 保存先のディレクトリ。
+    """
+
+    path: Path
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else get_cache_dir() / "edinet" / "documents"
+        self._index: dict[tuple[str, int], tuple[str, int, str]] | None = None
+
+    @property
+    def index(self) -> dict[tuple[str, int], tuple[str, int, str]]:
+        """書類IDと書類タイプの組から、相対パス、サイズ、ハッシュへの辞書。"""
+        if self._index is None:
+            self._index = self._load()
+
+        return self._index
+
+    def _load(self) -> dict[tuple[str, int], tuple[str, int, str]]:
+        try:
+            df = pl.read_parquet(self.path / INDEX)
+        except (OSError, pl.exceptions.PolarsError):
+            return {}
+
+        rows = df.select(list(SCHEMA)).iter_rows()
+        return {(d, t): (p, size, sha) for d, t, p, size, sha in rows}
+
+    def flush(self) -> None:
+        """索引をディスクに保存する。"""
+        if self._index is None:
+            return
+
+        path = self.path / INDEX
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        self.to_frame(absolute=False).write_parquet(tmp)
+        tmp.replace(path)
+
+    def to_frame(self, *, absolute: bool = True) -> pl.DataFrame:
+        """保存したすべての書類の参照を返す。
+
+        Args:
+            absolute (bool, optional): Trueのとき、`Path`列を絶対パスにする。
+
+        Returns:
+            pl.DataFrame: `SCHEMA`の列を持つDataFrame。
+        """
+        rows = [(*key, *value) for key, value in sorted(self.index.items())]
+        df = pl.DataFrame(rows, schema=SCHEMA, orient="row")
+
+        if absolute:
+            root = f"{self.path.resolve().as_posix()}/"
+            df = df.with_columns((pl.lit(root) + pl.col("Path")).alias("Path"))
+
+        return df
+
+    def get(self, doc_id: str, doc_type: int) -> pl.DataFrame | None:
+        """保存した書類の参照を返す。
+
+        Args:
+            doc_id (str): EDINETの書類ID。
+            doc_type (int): 書類タイプ。
+
+        Returns:
+            pl.DataFrame | None: 1行の参照。保存していないとき、
+                またはファイルが失われているときはNone。
+        """
+        value = self.index.get((doc_id, doc_type))
+
+        if value is None or not (self.path / value[0]).exists():
+            return None
+
+        return self._reference(doc_id, doc_type, *value)
+
+    def put(self, doc_id: str, doc_type: int, file: IO[bytes]) -> pl.DataFrame:
+        """ファイルを保存し、参照を返す。
+
+        同じ内容のファイルがすでにあれば、ファイルは書き込まない。
+        保存後、`file`の位置は先頭に戻す。
+
+        Args:
+            doc_id (str): EDINETの書類ID。
+            doc_type (int): 書類タイプ。
+            file (IO[bytes]): 書類の内容。シーク可能であること。
+
+        Returns:
+            pl.DataFrame: 1行の参照。
+        """
+        file.seek(0)
+        digest = hashlib.file_digest(file, "sha256").hexdigest()
+        size = file.seek(0, os.SEEK_END)
+
+        relative = f"objects/{digest[:2]}/{digest}{SUFFIXES.get(doc_type, '')}"
+        path = self.path / relative
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            file.seek(0)
+            with tmp.open("wb") as dst:
+                shutil.copyfileobj(file, dst)
+            tmp.replace(path)
+
+        file.seek(0)
+        self.index[doc_id, doc_type] = (relative, size, digest)
+        return self._reference(doc_id, doc_type, relative, size, digest)
+
+    def _reference(
+        self,
+        doc_id: str,
+        doc_type: int,
+        relative: str,
+        size: int,
+        digest: str,
+    ) -> pl.DataFrame:
+        path = (self.path / relative).resolve().as_posix()
+        row = (doc_id, doc_type, path, size, digest)
+        return pl.DataFrame([row], schema=SCHEMA, orient="row")
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, ClassVar
 
 from kabukit.sources.client import Client
-
-from .parser import iter_shares_html_urls, iter_shares_pdf_urls, parse_shares
+from kabukit.sources.concurrent import collect
+from kabukit.sources.response_cache import DAILY_TTL, IMMUTABLE
+
+from .parser import (
+    count_pages,
+    extract_pages,
+    iter_shares_html_urls,
+    iter_shares_pdf_urls,
+    parse_shares_pages,
+    select_shares_pages,
+)
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
     import polars as pl
+    from httpx._types import QueryParamTypes
+
+    from .store import SharesStore
 
 BASE_URL = "https://www.jpx.co.jp"
 SHARES_URL = "/listing/co/01.html"
 
+PAGES_PER_TASK = 8
+"""上場株式数PDFのテキスト抽出で、1つのタスクが担当するページ数"""
+
 
 class JpxClient(Client):
     """JPXと非同期に対話するためのクライアント。
@@ -27,6 +43,20 @@ class JpxClient(Client):
 
     base_url: ClassVar[str] = BASE_URL
 
+    def cache_ttl(self, url: str, params: QueryParamTypes | None) -> float | None:  # noqa: ARG002
+        """レスポンスをキャッシュする有効期間 (秒) を返す。
+
+        月ごとの上場株式数PDFは変更されないため無期限とする。
+        バックナンバーのHTMLページは1日とする。
+        """
+        if url.endswith(".pdf"):
+            return IMMUTABLE
+
+        if url.endswith(".html"):
+            return DAILY_TTL
+
+        return None
+
     async def iter_shares_html_urls(self) -> AsyncIterator[str]:
         """上場株式数データが掲載されたHTMLページのURLを取得する。
 
@@ -38,57 +68,102 @@ class JpxClient(Client):
         for html_url in iter_shares_html_urls(response.text):
             yield html_url
 
-    async def _iter_shares_pdf_urls(self, html_url: str) -> AsyncIterator[str]:
+    async def get_shares_pdf_urls(self, html_url: str) -> list[str]:
         """指定されたHTMLページから上場株式数PDFのURLを取得する。
 
         Args:
             html_url (str): PDFのURLを抽出する対象のHTMLページのURL。
 
-        Yields:
-            str: 上場株式数PDFのURL。
+        Returns:
+            list[str]: 上場株式数PDFのURLのリスト。
         """
         response = await self.get(html_url)
-
-        for pdf_url in iter_shares_pdf_urls(response.text):
-            yield pdf_url
+        return list(iter_shares_pdf_urls(response.text))
 
     async def iter_shares_pdf_urls(
         self,
         html_url: str | None = None,
+        max_concurrency: int | None = None,
     ) -> AsyncIterator[str]:
         """上場株式数PDFのURLを取得する。
 
         引数 `html_url` が指定された場合はそのページからのみURLを取得する。
-        指定されない場合は、利用可能な全てのバックナンバーページを巡回して
-        PDFのURLを取得する。
+        指定されない場合は、利用可能な全てのバックナンバーページを並行して
+        巡回してPDFのURLを取得する。このとき、URLはページの取得が完了した
+        順に生成されるので、月の順序は保証されない。
 
         Args:
             html_url (str | None, optional): PDFのURLを抽出する対象の
                 HTMLページのURL。 指定しない場合は全ページが対象となる。
+            max_concurrency (int | None, optional): バックナンバーページを
+                同時に取得する最大数。指定しないときはデフォルト値が使用される。
 
         Yields:
             str: 上場株式数PDFのURL。
         """
         if html_url:
-            async for pdf_url in self._iter_shares_pdf_urls(html_url):
-                yield pdf_url
-
+            html_urls = [html_url]
         else:
-            async for url in self.iter_shares_html_urls():
-                async for pdf_url in self._iter_shares_pdf_urls(url):
-                    yield pdf_url
+            html_urls = [url async for url in self.iter_shares_html_urls()]
+
+        ait = collect(self.get_shares_pdf_urls, html_urls, max_concurrency)
+
+        async for pdf_urls in ait:
+            for pdf_url in pdf_urls:
+                yield pdf_url
 
-    async def get_shares(self, pdf_url: str) -> pl.DataFrame:
+    async def get_shares(
+        self,
+        pdf_url: str,
+        store: SharesStore | None = None,
+    ) -> pl.DataFrame:
         """指定されたPDFのURLから上場株式数データを取得し、DataFrameとして返す。
 
         PDFのパース処理はCPUバウンドです。
         `executor`属性によって非同期実行の方法を指定できます。
+        ページのテキスト抽出は`PAGES_PER_TASK`ページごとのタスクに分けるので、
+        プロセスプールを使うと大きなPDFを複数のプロセスで並列に解析できます。
 
         Args:
             pdf_url (str): 上場株式数データが記載されたPDFのURL。
+            store (SharesStore | None, optional): 解析結果のキャッシュ。
+                指定すると、同じURLと内容のPDFは解析せずにキャッシュから読み込む。
 
         Returns:
             pl.DataFrame: 上場株式数データを含むPolars DataFrame。
         """
         response = await self.get(pdf_url)
-        return await self.run_in_executor(parse_shares, response.content)
+        content = response.content
+
+        if store is not None and (df := store.get(pdf_url, content)) is not None:
+            return df
+
+        df = await self.parse_shares(content)
+
+        if store is not None:
+            store.put(pdf_url, content, df)
+
+        return df
+
+    async def parse_shares(self, content: bytes) -> pl.DataFrame:
+        """上場株式数PDFを解析し、DataFrameとして返す。
+
+        ページのテキスト抽出を`PAGES_PER_TASK`ページごとに分けて、
+        `executor`属性のエグゼキューターで並列に実行する。
+
+        Args:
+            content (bytes): PDFファイルのバイトコンテンツ。
+
+        Returns:
+            pl.DataFrame: 上場株式数データを含むPolars DataFrame。
+        """
+        n = await self.run_in_executor(count_pages, content)
+
+        tasks = [
+            self.run_in_executor(extract_pages, content, i, i + PAGES_PER_TASK)
+            for i in range(0, n, PAGES_PER_TASK)
+        ]
+        chunks = await asyncio.gather(*tasks)
+
+        pages = (page for chunk in chunks for page in chunk)
+        return parse_shares_pages(select_shares_pages(pages))
@@ -9,8 +9,11 @@ import polars as pl
 from kabukit.sources import concurrent
 
 from .client import JpxClient
+from .store import SharesStore
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from kabukit.sources.concurrent import Progress
 
 
@@ -19,9 +22,18 @@ async def get_shares(
     max_concurrency: int = 12,
     max_workers: int | None = None,
     progress: Progress | None = None,
+    *,
+    store: SharesStore | bool = False,
 ) -> pl.DataFrame:
     """上場株式数を取得する。
 
+    バックナンバーページの巡回で見つかったPDFのURLは、上限付きのキューを通じて
+    すぐにPDFの取得と解析に渡される。巡回、取得、解析が並行して進むので、
+    巡回の完了を待たずにPDFの取得を始める。
+
+    `store`を指定すると、PDFの解析結果を保存し、同じ内容のPDFは解析しない。
+    過去の月のPDFは変更されないので、全期間の取得でも最新月のPDFだけを解析する。
+
     Args:
         max_items (int | None, optional): 取得月数の上限。
         max_concurrency (int | None, optional): 同時に実行するリクエストの最大数。
@@ -32,23 +44,34 @@ async def get_shares(
         progress (Progress | None, optional): 進捗表示のための関数。
             tqdm, marimoなどのライブラリを使用できる。
             指定しないときは進捗表示は行われない。
+        store (SharesStore | bool, optional): PDFの解析結果のキャッシュ。
+            Trueのときはキャッシュディレクトリのストアを使用する。
 
     Returns:
         DataFrame:
             文書一覧を含む単一のDataFrame。
     """
-    async with JpxClient() as client:
-        pdf_urls = [url async for url in client.iter_shares_pdf_urls()]
+    get = JpxClient.get_shares
+
+    if store:
+        shares_store = SharesStore() if store is True else store
+
+        def get(client: JpxClient, pdf_url: str) -> Awaitable[pl.DataFrame]:
+            return client.get_shares(pdf_url, shares_store)
 
     with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        df = await concurrent.get(
-            functools.partial(JpxClient, executor=executor),
-            JpxClient.get_shares,
-            pdf_urls,
-            max_items=max_items,
-            max_concurrency=max_concurrency,
-            progress=progress,
-        )
+        async with JpxClient() as client:
+            # バックナンバーの巡回とPDFの取得・解析を並行して進める
+            pdf_urls = client.iter_shares_pdf_urls(max_concurrency=max_concurrency)
+
+            df = await concurrent.get(
+                functools.partial(JpxClient, executor=executor),
+                get,
+                pdf_urls,
+                max_items=max_items,
+                max_concurrency=max_concurrency,
+                progress=progress,
+            )
 
     if df.is_empty():
         return pl.DataFrame()
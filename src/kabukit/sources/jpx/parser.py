@@ -19,7 +19,7 @@ from pypdf import PdfReader
 from kabukit.sources.utils import get_soup
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 
 def iter_shares_html_urls(html: str, /) -> Iterator[str]:
@@ -95,32 +95,84 @@ class Shares:
         }
 
 
-def iter_shares_pages(content: bytes, /) -> Iterator[str]:
-    """PDFコンテンツから上場株式数データを含むページテキストを抽出する。
+SHARES_HEADER = re.compile(
+    r"^\s*\d{4}年\d{1,2}月分.+会社別\n会社名\s+（コード）\s+月末現在上場株式数",
+    re.DOTALL,
+)
+"""上場株式数データの最初のページを判定するための正規表現"""
 
-    PDF内の特定のヘッダーを検出し、そのページ以降のテキストを抽出する。
+
+def count_pages(content: bytes, /) -> int:
+    """PDFコンテンツのページ数を返す。
 
     Args:
         content (bytes): PDFファイルのバイトコンテンツ。
 
-    Yields:
-        str: 上場株式数データを含むページのテキスト。
+    Returns:
+        int: ページ数。
+    """
+    return len(PdfReader(io.BytesIO(content)).pages)
+
+
+def extract_pages(
+    content: bytes,
+    start: int = 0,
+    stop: int | None = None,
+    /,
+) -> list[str]:
+    """PDFコンテンツの指定した範囲のページからテキストを抽出する。
+
+    ページごとに独立して抽出できるので、大きなPDFは範囲を分けて
+    複数のプロセスで並列に抽出できる。
+
+    Args:
+        content (bytes): PDFファイルのバイトコンテンツ。
+        start (int, optional): 最初のページの番号 (0始まり)。
+        stop (int | None, optional): 最後のページの次の番号。
+            指定しないときは最後のページまで。
+
+    Returns:
+        list[str]: ページごとのテキスト。
     """
     reader = PdfReader(io.BytesIO(content))
+    return [page.extract_text() for page in reader.pages[start:stop]]
+
+
+def select_shares_pages(pages: Iterable[str], /) -> Iterator[str]:
+    """ページテキストから上場株式数データを含むページを選択する。
+
+    特定のヘッダーを含むページを検出し、そのページ以降のテキストを返す。
 
-    header = r"^\s*\d{4}年\d{1,2}月分.+会社別\n会社名\s+（コード）\s+月末現在上場株式数"
-    pattern = re.compile(header, re.DOTALL)
+    Args:
+        pages (Iterable[str]): PDFのページごとのテキスト。
+
+    Yields:
+        str: 上場株式数データを含むページのテキスト。
+    """
     in_shares = False
 
-    for page in reader.pages:
-        text = page.extract_text()
+    for text in pages:
         if in_shares:
             yield text
-        elif pattern.match(text):
+        elif SHARES_HEADER.match(text):
             in_shares = True
             yield text
 
 
+def iter_shares_pages(content: bytes, /) -> Iterator[str]:
+    """PDFコンテンツから上場株式数データを含むページテキストを抽出する。
+
+    PDF内の特定のヘッダーを検出し、そのページ以降のテキストを抽出する。
+
+    Args:
+        content (bytes): PDFファイルのバイトコンテンツ。
+
+    Yields:
+        str: 上場株式数データを含むページのテキスト。
+    """
+    yield from select_shares_pages(extract_pages(content))
+
+
 def iter_shares(page: str, /) -> Iterator[Shares]:
     """単一のページテキストから上場株式数データを抽出する。
 
@@ -146,6 +198,19 @@ def iter_shares(page: str, /) -> Iterator[Shares]:
             yield Shares(company, code, number, year, month)
 
 
+def parse_shares_pages(pages: Iterable[str], /) -> pl.DataFrame:
+    """上場株式数データを含むページテキストからDataFrameを生成する。
+
+    Args:
+        pages (Iterable[str]): 上場株式数データを含むページのテキスト。
+
+    Returns:
+        pl.DataFrame: 上場株式数データを含むPolars DataFrame。
+    """
+    shares = (share.to_dict() for page in pages for share in iter_shares(page))
+    return pl.DataFrame(shares)
+
+
 def parse_shares(content: bytes, /) -> pl.DataFrame:
     """PDFコンテンツを解析し、上場株式数データのPolars DataFrameを生成する。
 
@@ -155,6 +220,4 @@ def parse_shares(content: bytes, /) -> pl.DataFrame:
     Returns:
         pl.DataFrame: 上場株式数データを含むPolars DataFrame。
     """
-    pages = iter_shares_pages(content)
-    shares = (share.to_dict() for page in pages for share in iter_shares(page))
-    return pl.DataFrame(shares)
+    return parse_shares_pages(iter_shares_pages(content))
@@ -0,0 +1,74 @@
+"""JPXの上場株式数PDFの解析結果をキャッシュディレクトリに保存するためのモジュール。
+
+月ごとの上場株式数PDFは公開後に変更されないので、一度解析した結果を
+保存しておけば、次の取得では最新月のPDFだけを解析すればよい。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path, PurePosixPath
+from typing import final
+from urllib.parse import urlsplit
+
+import polars as pl
+
+from kabukit.utils.config import get_cache_dir
+
+
+@final
+class SharesStore:
+    """上場株式数PDFの解析結果のキャッシュ。
+
+    PDFのURLのファイル名と内容のSHA-256ハッシュの組をキーとして、
+    解析結果を`<ファイル名>-<ハッシュの先頭16文字>.parquet`に保存する。
+    同じURLでも内容が変われば別のキーになるので、差し替えられたPDFは
+    再び解析される。
+
+    Args:
+        path (str | Path | None, optional): 保存先のディレクトリ。
+            指定しないときはキャッシュディレクトリの`jpx/shares/pdf`。
+
+    Attributes:
+        path (Path): 保存先のディレクトリ。
+    """
+
+    path: Path
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else get_cache_dir() / "jpx" / "shares" / "pdf"
+
+    def _path(self, pdf_url: str, content: bytes) -> Path:
+        stem = PurePosixPath(urlsplit(pdf_url).path).stem
+        digest = hashlib.sha256(content).hexdigest()
+        return self.path / f"{stem}-{digest[:16]}.parquet"
+
+    def get(self, pdf_url: str, content: bytes) -> pl.DataFrame | None:
+        """保存した解析結果を返す。
+
+        Args:
+            pdf_url (str): PDFのURL。
+            content (bytes): PDFファイルのバイトコンテンツ。
+
+        Returns:
+            pl.DataFrame | None: 解析結果。保存していないときはNone。
+        """
+        try:
+            return pl.read_parquet(self._path(pdf_url, content))
+        except (OSError, pl.exceptions.PolarsError):
+            return None
+
+    def put(self, pdf_url: str, content: bytes, df: pl.DataFrame) -> None:
+        """解析結果を保存する。
+
+        Args:
+            pdf_url (str): PDFのURL。
+            content (bytes): PDFファイルのバイトコンテンツ。
+            df (pl.DataFrame): 解析結果。
+        """
+        path = self._path(pdf_url, content)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        df.write_parquet(tmp)
+        tmp.replace(path)
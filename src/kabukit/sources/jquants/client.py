@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from enum import StrEnum
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, Unpack
 
 import polars as pl
 
 from kabukit.models.jquants.info import InfoDataFrame
 from kabukit.sources.client import Client
 from kabukit.sources.datetime import with_date
+from kabukit.sources.response_cache import DAILY_TTL, ttl_for_date
 from kabukit.utils.config import get_config_value
 from kabukit.utils.params import get_params
 
@@ -22,6 +23,9 @@ if TYPE_CHECKING:
     from httpx import (
         HTTPStatusError,  # noqa: F401  # pyright: ignore[reportUnusedImport]
     )
+    from httpx._types import QueryParamTypes
+
+    from kabukit.sources.client import ClientOptions
 
 
 API_VERSION = "v1"
@@ -52,10 +56,28 @@ class JQuantsClient(Client):
         self,
         id_token: str | None = None,
         executor: Executor | None = None,
+        **kwargs: Unpack[ClientOptions],
     ) -> None:
-        super().__init__(executor=executor)
+        super().__init__(executor=executor, **kwargs)
         self.set_id_token(id_token)
 
+    def cache_ttl(self, url: str, params: QueryParamTypes | None) -> float | None:
+        """レスポンスをキャッシュする有効期間 (秒) を返す。
+
+        日付を指定した財務情報は、過去の日付のときは無期限、当日以降のときは
+        短時間とする。営業日カレンダーは1日とする。株価は分割・併合によって
+        過去の調整済み株価が変わるため、キャッシュしない。
+        """
+        if url == "/fins/statements" and isinstance(params, dict):
+            date = params.get("date")
+            if isinstance(date, str):
+                return ttl_for_date(date)
+
+        if url == "/markets/trading_calendar":
+            return DAILY_TTL
+
+        return None
+
     def set_id_token(self, id_token: str | None = None) -> None:
         """HTTPヘッダーにIDトークンを設定する。
 
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
+import datetime
 from typing import TYPE_CHECKING
 
+import polars as pl
+
 from kabukit.sources import concurrent
+from kabukit.utils.datetime import today
 
 from .client import JQuantsClient
 
 if TYPE_CHECKING:
-    import datetime
     from collections.abc import Iterable
 
-    import polars as pl
-
     from kabukit.sources.concurrent import Progress
 
 
@@ -28,6 +29,39 @@ async def get_calendar() -> pl.DataFrame:
         return await client.get_calendar()
 
 
+async def get_trading_dates(
+    from_: str | datetime.date | None = None,
+    to: str | datetime.date | None = None,
+) -> list[datetime.date]:
+    """営業日の日付リストを取得する。
+
+    営業日カレンダーから休日を除き、今日以前の日付のみを返す。
+
+    Args:
+        from_ (str | datetime.date, optional): 取得期間の開始日。
+        to (str | datetime.date, optional): 取得期間の終了日。
+
+    Returns:
+        list[datetime.date]: 昇順に並んだ営業日のリスト。
+
+    Raises:
+        HTTPStatusError: APIリクエストが失敗した場合。
+    """
+    async with JQuantsClient() as client:
+        df = await client.get_calendar(from_=from_, to=to)
+
+    if df.is_empty():
+        return []
+
+    return (
+        df
+        .filter(~pl.col("IsHoliday"), pl.col("Date") <= today())
+        .get_column("Date")
+        .sort()
+        .to_list()
+    )
+
+
 async def get_info(
     code: str | None = None,
     date: str | datetime.date | None = None,
@@ -111,6 +145,70 @@ async def get_statements(
     return data.sort("Code", "Date")
 
 
+async def _get_statements_by_date(
+    client: JQuantsClient,
+    date: datetime.date,
+) -> pl.DataFrame:
+    return await client.get_statements(date=date)
+
+
+async def update_statements(
+    data: pl.DataFrame,
+    /,
+    max_concurrency: int = 12,
+    progress: Progress | None = None,
+) -> pl.DataFrame:
+    """取得済みの財務情報に、最終開示日以降に開示された財務情報を追加する。
+
+    `data`の`DisclosedDate`列の最大値から今日までの各日について、
+    日付を指定して全銘柄の財務情報を取得する。取得した行は
+    (`Code`, `DisclosedDate`, `DisclosureNumber`) をキーとして
+    取得済みの行を置き換える。
+
+    Args:
+        data (pl.DataFrame): 取得済みの財務情報を含むDataFrame。
+        max_concurrency (int | None, optional): 同時に実行するリクエストの最大数。
+            デフォルトは12。
+        progress (Progress | None, optional): 進捗表示のための関数。
+            tqdm, marimoなどのライブラリを使用できる。
+            指定しないときは進捗表示は行われない。
+
+    Returns:
+        pl.DataFrame: 追加分を含む財務情報のDataFrame。
+
+    Raises:
+        HTTPStatusError: APIリクエストが失敗した場合。
+    """
+    if data.is_empty():
+        return data
+
+    last_date: datetime.date = data.get_column("DisclosedDate").max()  # pyright: ignore[reportAssignmentType]
+    days = (today() - last_date).days
+    dates = [last_date + datetime.timedelta(days=i) for i in range(days + 1)]
+
+    new = await concurrent.get(
+        JQuantsClient,
+        _get_statements_by_date,
+        dates,
+        max_concurrency=max_concurrency,
+        progress=progress,
+    )
+
+    if new.is_empty():
+        return data
+
+    return (
+        pl
+        .concat([data, new], how="diagonal_relaxed")
+        .unique(
+            ["Code", "DisclosedDate", "DisclosureNumber"],
+            keep="last",
+            maintain_order=True,
+        )
+        .sort("Code", "Date")
+    )
+
+
 async def get_prices(
     codes: Iterable[str] | str | None = None,
     /,
@@ -118,30 +216,68 @@ async def get_prices(
     max_items: int | None = None,
     max_concurrency: int = 8,
     progress: Progress | None = None,
+    *,
+    by_date: bool = False,
+    from_: str | datetime.date | None = None,
+    to: str | datetime.date | None = None,
 ) -> pl.DataFrame:
     """日々の株価四本値を取得する。
 
     株価は分割・併合を考慮した調整済み株価（小数点第２位四捨五入）と調整前の株価を取得できる。
 
+    `by_date`がTrueのとき、銘柄ごとではなく営業日ごとに全銘柄の株価を取得する。
+    営業日は営業日カレンダーから求める。全銘柄の長期間の株価を取得する場合、
+    リクエスト数は銘柄数ではなく営業日数 (年間約245日) に比例する。
+
     Args:
         codes (Iterable[str] | str, optional): 株価情報を取得する銘柄のコード。
             省略された場合、全銘柄が対象となる。
         date (str | datetime.date, optional): 株価情報を取得する日付
-            (例: "2025-10-01")。
+            (例: "2025-10-01")。`by_date`がTrueのときは、`from_`と`to`に
+            同じ日付を指定したものとして扱う。
         max_items (int | None, optional): 取得する銘柄数の上限。
+            `by_date`がTrueのときは取得する営業日数の上限となる。
             指定しないときはすべての銘柄が対象となる。
         max_concurrency (int | None, optional): 同時に実行するリクエストの最大数。
             デフォルトは8。
         progress (Progress | None, optional): 進捗表示のための関数。
             tqdm, marimoなどのライブラリを使用できる。
             指定しないときは進捗表示は行われない。
+        by_date (bool, optional): Trueのとき、営業日ごとに全銘柄の株価を取得する。
+            `codes`が指定された場合、取得後にその銘柄に絞り込む。
+            デフォルトはFalse。
+        from_ (str | datetime.date, optional): `by_date`がTrueのときの
+            取得期間の開始日。指定しないときは営業日カレンダーの最初の日となる。
+        to (str | datetime.date, optional): `by_date`がTrueのときの
+            取得期間の終了日。指定しないときは今日となる。
 
     Returns:
         pl.DataFrame: 日々の株価四本値を含むDataFrame。
 
     Raises:
         HTTPStatusError: APIリクエストが失敗した場合。
+        ValueError: `by_date`がTrueで、`date`と`from_`/`to`を同時に指定した場合。
     """
+    if by_date:
+        if date and (from_ or to):
+            msg = "dateとfrom/toを同時に指定することはできない。"
+            raise ValueError(msg)
+
+        if date:
+            from_ = to = date
+
+        if isinstance(codes, str):
+            codes = [codes]
+
+        return await get_prices_by_date(
+            codes,
+            from_=from_,
+            to=to,
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+
     if isinstance(codes, str) or (codes is None and date):
         async with JQuantsClient() as client:
             return await client.get_prices(codes, date)
@@ -158,3 +294,129 @@ async def get_prices(
         progress=progress,
     )
     return data.sort("Code", "Date")
+
+
+async def _get_prices_by_date(
+    client: JQuantsClient,
+    date: datetime.date,
+) -> pl.DataFrame:
+    return await client.get_prices(date=date)
+
+
+async def get_prices_by_date(
+    codes: Iterable[str] | None = None,
+    /,
+    from_: str | datetime.date | None = None,
+    to: str | datetime.date | None = None,
+    max_items: int | None = None,
+    max_concurrency: int = 8,
+    progress: Progress | None = None,
+) -> pl.DataFrame:
+    """営業日ごとに全銘柄の株価四本値を取得する。
+
+    営業日カレンダーから取得期間内の営業日を求め、営業日ごとに
+    `/prices/daily_quotes?date=` を呼び出す。
+
+    Args:
+        codes (Iterable[str], optional): 絞り込む銘柄のコード。
+            省略された場合、全銘柄が対象となる。
+        from_ (str | datetime.date, optional): 取得期間の開始日。
+        to (str | datetime.date, optional): 取得期間の終了日。
+        max_items (int | None, optional): 取得する営業日数の上限。
+        max_concurrency (int | None, optional): 同時に実行するリクエストの最大数。
+            デフォルトは8。
+        progress (Progress | None, optional): 進捗表示のための関数。
+            tqdm, marimoなどのライブラリを使用できる。
+            指定しないときは進捗表示は行われない。
+
+    Returns:
+        pl.DataFrame: 日々の株価四本値を含むDataFrame。
+
+    Raises:
+        HTTPStatusError: APIリクエストが失敗した場合。
+    """
+    dates = await get_trading_dates(from_, to)
+
+    data = await concurrent.get(
+        JQuantsClient,
+        _get_prices_by_date,
+        dates,
+        max_items=max_items,
+        max_concurrency=max_concurrency,
+        progress=progress,
+    )
+
+    if data.is_empty():
+        return pl.DataFrame()
+
+    if codes is not None:
+        data = data.filter(pl.col("Code").is_in(list(codes)))
+
+    return data.sort("Code", "Date")
+
+
+async def update_prices(
+    data: pl.DataFrame,
+    /,
+    max_concurrency: int = 8,
+    progress: Progress | None = None,
+) -> pl.DataFrame:
+    """取得済みの株価四本値に、最終日より後の営業日の株価を追加する。
+
+    `data`の`Date`列の最大値より後の営業日についてのみ、営業日ごとに全銘柄の
+    株価を取得する。追加した期間に`AdjustmentFactor`が1以外の行を含む銘柄は、
+    分割・併合によって過去の調整済み株価が変わるため、全期間の株価を取得し直す。
+
+    Args:
+        data (pl.DataFrame): 取得済みの株価四本値を含むDataFrame。
+        max_concurrency (int | None, optional): 同時に実行するリクエストの最大数。
+            デフォルトは8。
+        progress (Progress | None, optional): 進捗表示のための関数。
+            tqdm, marimoなどのライブラリを使用できる。
+            指定しないときは進捗表示は行われない。
+
+    Returns:
+        pl.DataFrame: 追加分を含む日々の株価四本値のDataFrame。
+
+    Raises:
+        HTTPStatusError: APIリクエストが失敗した場合。
+    """
+    if data.is_empty():
+        return data
+
+    last_date: datetime.date = data.get_column("Date").max()  # pyright: ignore[reportAssignmentType]
+    from_ = last_date + datetime.timedelta(days=1)
+
+    new = await get_prices_by_date(
+        from_=from_,
+        max_concurrency=max_concurrency,
+        progress=progress,
+    )
+
+    if new.is_empty():
+        return data
+
+    adjusted = new.filter(pl.col("AdjustmentFactor") != 1).get_column("Code")
+    codes = sorted(adjusted.unique().to_list())
+
+    if codes:
+        refetched = await concurrent.get(
+            JQuantsClient,
+            JQuantsClient.get_prices,
+            codes,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+        data = data.filter(~pl.col("Code").is_in(codes))
+        new = new.filter(~pl.col("Code").is_in(codes))
+    else:
+        refetched = pl.DataFrame()
+
+    dfs = [df for df in (data, new, refetched) if not df.is_empty()]
+
+    return (
+        pl
+        .concat(dfs, how="vertical_relaxed")
+        .unique(["Code", "Date"], keep="last", maintain_order=True)
+        .sort("Code", "Date")
+    )
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import email.utils
+import time
+from typing import TYPE_CHECKING, Self, final
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+MAX_CONCURRENCY = 32
+MAX_RETRY_AFTER = 60.0
+THROTTLE_WINDOW = 1.0
+
+
+@final
+class RateLimiter:
+    """レート制限と同時実行数の制御を行う。
+
+    1つのクライアントのすべてのタスクで共有し、各リクエストの前後で使用する。
+
+    - 毎秒`rate`回を上限とするトークンバケットで、リクエストの開始間隔を制御する。
+    - AIMD (Additive Increase / Multiplicative Decrease) によって、
+      同時に実行するリクエストの数を制御する。スロットリングを受けると上限を
+      半分にし、正常なレスポンスが続くと少しずつ上限を戻す。同時に送った
+      リクエストがまとめてスロットリングを受けても、上限を減らすのは
+      1つのウィンドウ (`THROTTLE_WINDOW`秒、または`Retry-After`の秒数) に1回だけ。
+    - `Retry-After`を受け取ると、その時刻まですべてのリクエストを待機させる。
+
+    Attributes:
+        rate (float | None): 毎秒のリクエスト数の上限。Noneのとき制限しない。
+        limit (float): 現在の同時実行数の上限。
+    """
+
+    rate: float | None
+    limit: float
+
+    def __init__(
+        self,
+        rate: float | None = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+        min_concurrency: int = 1,
+    ) -> None:
+        self.rate = rate
+        self.limit = float(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self._running = 0
+        self._condition = asyncio.Condition()
+        self._next_time = 0.0
+        self._blocked_until = 0.0
+        self._throttled_until = 0.0
+
+    @property
+    def concurrency(self) -> int:
+        """現在の同時実行数の上限。"""
+        return max(self.min_concurrency, int(self.limit))
+
+    async def acquire(self) -> None:
+        """リクエストを開始できるまで待機する。"""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._running < self.concurrency)
+            self._running += 1
+
+        now = time.monotonic()
+        start = max(now, self._next_time, self._blocked_until)
+
+        if self.rate:
+            self._next_time = start + 1 / self.rate
+
+        if start > now:
+            try:
+                await asyncio.sleep(start - now)
+            except BaseException:
+                await self.release()
+                raise
+
+    async def release(self) -> None:
+        """リクエストの終了を通知する。"""
+        async with self._condition:
+            self._running -= 1
+            self._condition.notify_all()
+
+    async def __aenter__(self) -> Self:
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # pyright: ignore[reportMissingParameterType, reportUnknownParameterType]  # noqa: ANN001
+        await self.release()
+
+    def succeed(self) -> None:
+        """正常なレスポンスを受け取ったとき、同時実行数の上限を加算的に増やす。"""
+        limit = self.limit + 1 / self.limit
+        self.limit = min(float(self.max_concurrency), limit)
+
+    def throttle(self, retry_after: float | None = None) -> None:
+        """スロットリングを受けたとき、同時実行数の上限を乗算的に減らす。
+
+        Args:
+            retry_after (float | None, optional): 次のリクエストまで待機する秒数。
+        """
+        now = time.monotonic()
+
+        if now >= self._throttled_until:
+            self.limit = max(float(self.min_concurrency), self.limit / 2)
+            window = max(THROTTLE_WINDOW, retry_after or 0.0)
+            self._throttled_until = now + window
+
+        if retry_after:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+
+
+def get_retry_after(response: Response) -> float | None:
+    """レスポンスの`Retry-After`ヘッダーから待機する秒数を取得する。
+
+    Args:
+        response (Response): HTTPレスポンス。
+
+    Returns:
+        float | None: 待機する秒数。ヘッダーがない、または解釈できないときはNone。
+            `MAX_RETRY_AFTER`秒を上限とする。
+    """
+    value = response.headers.get("Retry-After")
+
+    if not value:
+        return None
+
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=datetime.UTC)
+
+        now = datetime.datetime.now(datetime.UTC)
+        seconds = (date - now).total_seconds()
+
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
@@ -0,0 +1,232 @@
+"""HTTPレスポンスをディスクにキャッシュするためのモジュール。
+
+レスポンスの本文は内容のSHA-256ハッシュをファイル名として保存し、
+同じ内容の本文は一度だけ保存する。リクエストごとのメタデータ
+(ハッシュ、保存時刻、ETag、Last-Modified) はJSONファイルとして保存する。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+import shutil
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, final
+
+import httpx
+
+from kabukit.utils.config import get_cache_dir
+from kabukit.utils.datetime import parse_date, today
+
+if TYPE_CHECKING:
+    import datetime
+    from typing import IO
+
+    from httpx._types import QueryParamTypes
+
+
+IMMUTABLE = math.inf
+"""過去の日付のデータなど、内容が変わらないレスポンスの有効期間。"""
+
+SHORT_TTL = 300.0
+"""当日のデータなど、内容が変わりうるレスポンスの有効期間 (秒)。"""
+
+DAILY_TTL = 86400.0
+"""一覧ページなど、日に一度程度更新されるレスポンスの有効期間 (秒)。"""
+
+HEADERS = ("content-type", "etag", "last-modified")
+
+
+def ttl_for_date(date: str | datetime.date) -> float:
+    """データの日付に応じたキャッシュの有効期間を返す。
+
+    Args:
+        date (str | datetime.date): レスポンスが対象とする日付。
+
+    Returns:
+        float: 過去の日付のとき`IMMUTABLE`、当日以降のとき`SHORT_TTL`。
+    """
+    if isinstance(date, str):
+        date = parse_date(date)
+
+    return IMMUTABLE if date < today() else SHORT_TTL
+
+
+@dataclass
+class CacheEntry:
+    """キャッシュされたレスポンスのメタデータ。"""
+
+    url: str
+    """リクエストのURL"""
+    digest: str
+    """本文のSHA-256ハッシュ"""
+    stored_at: float
+    """保存または再検証した時刻 (UNIX時間)"""
+    headers: dict[str, str]
+    """再構成に必要なレスポンスヘッダー"""
+
+    def is_fresh(self, ttl: float) -> bool:
+        """有効期間内であるかを判定する。"""
+        return time.time() - self.stored_at < ttl
+
+    def validators(self) -> dict[str, str]:
+        """条件付きリクエストのためのヘッダーを返す。"""
+        headers: dict[str, str] = {}
+
+        if etag := self.headers.get("etag"):
+            headers["If-None-Match"] = etag
+
+        if last_modified := self.headers.get("last-modified"):
+            headers["If-Modified-Since"] = last_modified
+
+        return headers
+
+
+@final
+class ResponseCache:
+    """HTTPレスポンスのディスクキャッシュ。
+
+    Attributes:
+        path (Path): キャッシュを保存するディレクトリ。
+            デフォルトはキャッシュディレクトリの`http`サブディレクトリ。
+    """
+
+    path: Path
+
+    def __init__(self, path: str | Path | None = None) -> None:
+        self.path = Path(path) if path else get_cache_dir() / "http"
+
+    def key(self, url: str) -> str:
+        """リクエストのURLからキーを返す。"""
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.path / "entries" / key[:2] / f"{key}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.path / "objects" / digest[:2] / digest
+
+    def load(self, key: str) -> CacheEntry | None:
+        """キーに対応するエントリーを読み込む。存在しないときはNoneを返す。"""
+        path = self._entry_path(key)
+
+        try:
+            entry = CacheEntry(**json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, TypeError):
+            return None
+
+        if not self._object_path(entry.digest).exists():
+            return None
+
+        return entry
+
+    def read(self, entry: CacheEntry) -> httpx.Response:
+        """エントリーからレスポンスを再構成する。"""
+        content = self._object_path(entry.digest).read_bytes()
+        request = httpx.Request("GET", entry.url)
+        return httpx.Response(
+            200,
+            headers=entry.headers,
+            content=content,
+            request=request,
+        )
+
+    def read_into(self, entry: CacheEntry, file: IO[bytes]) -> httpx.Response:
+        """エントリーの本文をファイルに書き込み、本文のないレスポンスを返す。"""
+        file.seek(0)
+        file.truncate()
+
+        with self._object_path(entry.digest).open("rb") as src:
+            shutil.copyfileobj(src, file)
+
+        file.seek(0)
+        request = httpx.Request("GET", entry.url)
+        return httpx.Response(200, headers=entry.headers, request=request)
+
+    def store(self, key: str, url: str, response: httpx.Response) -> CacheEntry:
+        """レスポンスを保存し、エントリーを返す。"""
+        content = response.content
+        digest = hashlib.sha256(content).hexdigest()
+
+        path = self._object_path(digest)
+        if not path.exists():
+            _write_bytes(path, content)
+
+        headers = {k: v for k in HEADERS if (v := response.headers.get(k))}
+        entry = CacheEntry(url, digest, time.time(), headers)
+        self._save(key, entry)
+        return entry
+
+    def store_file(
+        self,
+        key: str,
+        url: str,
+        response: httpx.Response,
+        file: IO[bytes],
+    ) -> CacheEntry:
+        """ファイルに書き込んだ本文を保存し、エントリーを返す。
+
+        `response`からはヘッダーだけを参照する。保存後、`file`の位置は先頭に戻す。
+        """
+        file.seek(0)
+        digest = hashlib.file_digest(file, "sha256").hexdigest()
+
+        path = self._object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            file.seek(0)
+            with tmp.open("wb") as dst:
+                shutil.copyfileobj(file, dst)
+            tmp.replace(path)
+
+        file.seek(0)
+        headers = {k: v for k in HEADERS if (v := response.headers.get(k))}
+        entry = CacheEntry(url, digest, time.time(), headers)
+        self._save(key, entry)
+        return entry
+
+    def touch(self, key: str, entry: CacheEntry) -> None:
+        """再検証に成功したエントリーの保存時刻を更新する。"""
+        entry.stored_at = time.time()
+        self._save(key, entry)
+
+    def _save(self, key: str, entry: CacheEntry) -> None:
+        text = json.dumps(asdict(entry), ensure_ascii=False)
+        _write_bytes(self._entry_path(key), text.encode("utf-8"))
+
+
+def get_request_url(
+    base_url: str,
+    url: str,
+    params: QueryParamTypes | None = None,
+) -> str:
+    """キャッシュのキーとするURLを返す。
+
+    クライアントに設定された認証用のパラメータやヘッダーは含まない。
+
+    Args:
+        base_url (str): クライアントのベースURL。
+        url (str): リクエストのURLパス、または絶対URL。
+        params (QueryParamTypes | None, optional): リクエストのクエリパラメータ。
+
+    Returns:
+        str: クエリパラメータを含む絶対URL。
+    """
+    relative = str(httpx.URL(url, params=params))
+
+    if relative.startswith(("http://", "https://")):
+        return relative
+
+    return f"{base_url.rstrip('/')}/{relative.lstrip('/')}"
+
+
+def _write_bytes(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(content)
+    tmp.replace(path)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import re
 from typing import TYPE_CHECKING, ClassVar
 
 import httpx
@@ -7,19 +9,23 @@ import polars as pl
 
 from kabukit.sources.client import Client
 from kabukit.sources.datetime import with_date
+from kabukit.sources.response_cache import SHORT_TTL, ttl_for_date
 from kabukit.utils.datetime import parse_date
 
-from .parser import iter_dates, iter_items, iter_page_numbers
-from .transform import transform_list
+from .parser import iter_dates, iter_items, iter_page_numbers, parse_list
+from .transform import transform_list, with_disclosed_date
 
 if TYPE_CHECKING:
     import datetime
     from collections.abc import AsyncIterator
 
+    from httpx._types import QueryParamTypes
+
     from .parser import Item
 
 
 BASE_URL = "https://www.release.tdnet.info/inbs"
+LIST_PATTERN = re.compile(r"^I_list_\d+_(\d{8})\.html$")
 
 
 class TdnetClient(Client):
@@ -34,6 +40,20 @@ class TdnetClient(Client):
 
     base_url: ClassVar[str] = BASE_URL
 
+    def cache_ttl(self, url: str, params: QueryParamTypes | None) -> float | None:  # noqa: ARG002
+        """レスポンスをキャッシュする有効期間 (秒) を返す。
+
+        開示情報一覧ページは、過去の開示日のときは無期限、当日のときは
+        短時間とする。開示日一覧ページは短時間とする。
+        """
+        if m := LIST_PATTERN.match(url):
+            return ttl_for_date(m.group(1))
+
+        if url == "I_main_00.html":
+            return SHORT_TTL
+
+        return None
+
     async def get_dates(self) -> list[datetime.date]:
         """TDnetで利用可能な開示日一覧を取得する。
 
@@ -59,25 +79,49 @@ class TdnetClient(Client):
         response = await self.get(f"I_list_{index:03}_{date}.html")
         return response.text
 
-    async def iter_pages(self, date: str | datetime.date) -> AsyncIterator[str]:
+    async def iter_pages(
+        self,
+        date: str | datetime.date,
+        *,
+        strict: bool = False,
+    ) -> AsyncIterator[str]:
         """指定した日のTDnet開示情報一覧ページを非同期に反復処理する。
 
+        1ページ目のページャーからすべてのページ番号を求め、残りのページを
+        並行して取得する。同時に実行するリクエストの数はクライアントの
+        `limiter`で制限される。ページは番号の順に生成する。
+
         Args:
             date (str | datetime.date): 取得する開示日の指定。
+            strict (bool, optional): Trueのとき、1ページ目を取得できなければ
+                例外を送出する。Falseのときはページを生成しない。
+                デフォルトはFalse。
 
         Yields:
             str: 各ページのHTMLコンテンツ。
+
+        Raises:
+            httpx.HTTPStatusError: `strict`がTrueで、1ページ目を取得できない場合。
         """
         try:
             text = await self.get_page(date, index=1)
         except httpx.HTTPStatusError:
+            if strict:
+                raise
             return
 
         yield text
 
-        for index in iter_page_numbers(text):
-            if index != 1:
-                yield await self.get_page(date, index)
+        indexes = [i for i in dict.fromkeys(iter_page_numbers(text)) if i != 1]
+        tasks = [asyncio.ensure_future(self.get_page(date, i)) for i in indexes]
+
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def iter_items(self, date: str | datetime.date) -> AsyncIterator[Item]:
         """指定した日のTDnet開示項目を生成する。
@@ -96,19 +140,36 @@ class TdnetClient(Client):
                 item.disclosed_date = date
                 yield item
 
-    async def get_list(self, date: str | datetime.date) -> pl.DataFrame:
+    async def get_list(
+        self,
+        date: str | datetime.date,
+        *,
+        strict: bool = False,
+    ) -> pl.DataFrame:
         """指定した日付の開示書類一覧を取得する。
 
         Args:
             date (str | datetime.date): 取得する開示日。
+            strict (bool, optional): Trueのとき、一覧を取得できない日は
+                空のDataFrameを返さずに例外を送出する。`iter_pages`を参照。
+                デフォルトはFalse。
 
         Returns:
             pl.DataFrame: 開示書類一覧を含むDataFrame。
+
+        Raises:
+            httpx.HTTPStatusError: `strict`がTrueで、一覧を取得できない場合。
         """
-        data = [item.to_dict() async for item in self.iter_items(date)]
+        if isinstance(date, str):
+            date = parse_date(date)
+
+        pages = self.iter_pages(date, strict=strict)
+        dfs = [parse_list(page) async for page in pages]
+        dfs = [df for df in dfs if not df.is_empty()]
 
-        if not data:
+        if not dfs:
             return pl.DataFrame()
 
-        df = transform_list(pl.DataFrame(data, infer_schema_length=None))
+        df = with_disclosed_date(pl.concat(dfs), date)
+        df = transform_list(df)
         return await with_date(df)
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import datetime
+import functools
 from typing import TYPE_CHECKING
 
 import polars as pl
 
 from kabukit.sources import concurrent
+from kabukit.utils.datetime import parse_date
+from kabukit.utils.partition import DailyPartitions
 
 from .client import TdnetClient
 
@@ -21,6 +24,8 @@ async def get_list(
     max_items: int | None = None,
     max_concurrency: int = 12,
     progress: Progress | None = None,
+    *,
+    cache: bool = False,
 ) -> pl.DataFrame:
     """TDnetの文書一覧を取得する。
 
@@ -33,11 +38,17 @@ async def get_list(
         progress (Progress | None, optional): 進捗表示のための関数。
             tqdm, marimoなどのライブラリを使用できる。
             指定しないときは進捗表示は行われない。
+        cache (bool, optional): Trueのとき、日ごとの文書一覧をキャッシュに保存し、
+            確定済みの日はキャッシュから読み込む。一覧を取得できない日は
+            保存せずに例外を送出する。デフォルトはFalse。
 
     Returns:
         DataFrame:
             文書一覧を含む単一のDataFrame。
     """
+    if isinstance(dates, (str, datetime.date)) and cache:
+        dates = [dates]
+
     if isinstance(dates, (str, datetime.date)):
         async with TdnetClient() as client:
             return await client.get_list(dates)
@@ -46,14 +57,25 @@ async def get_list(
         async with TdnetClient() as client:
             dates = await client.get_dates()
 
-    df = await concurrent.get(
-        TdnetClient,
-        TdnetClient.get_list,
-        dates,
-        max_items=max_items,
-        max_concurrency=max_concurrency,
-        progress=progress,
-    )
+    if cache:
+        df = await concurrent.get_daily(
+            TdnetClient,
+            functools.partial(TdnetClient.get_list, strict=True),
+            [parse_date(d) if isinstance(d, str) else d for d in dates],
+            DailyPartitions("tdnet", "list", "DisclosedDate"),
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
+    else:
+        df = await concurrent.get(
+            TdnetClient,
+            TdnetClient.get_list,
+            dates,
+            max_items=max_items,
+            max_concurrency=max_concurrency,
+            progress=progress,
+        )
 
     if df.is_empty():
         return pl.DataFrame()
@@ -4,6 +4,10 @@ import re
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import polars as pl
+from lxml import etree
+from lxml import html as lxml_html
+
 from kabukit.sources.utils import get_soup
 from kabukit.utils.datetime import parse_date, parse_time
 
@@ -112,3 +116,68 @@ def get_url(tag: Tag, /) -> str | None:
             return href
 
     return None
+
+
+LIST_SCHEMA = {
+    "Code": pl.String,
+    "DisclosedTime": pl.String,
+    "Company": pl.String,
+    "Title": pl.String,
+    "PdfUrl": pl.String,
+    "XbrlUrl": pl.String,
+    "UpdateStatus": pl.String,
+}
+
+_ROWS = etree.XPath('//table[@id="main-list-table"]//tr')
+_CELLS = etree.XPath(".//td")
+_TEXTS = etree.XPath(".//text()")
+_HREF = etree.XPath("(.//a/@href)[1]")
+
+
+def parse_list(html: str, /) -> pl.DataFrame:
+    """開示情報一覧ページを解析し、DataFrameを返す。
+
+    `iter_items`と同じ内容を返すが、BeautifulSoupの木と`Item`オブジェクトを
+    作らず、lxmlのXPathで各セルを列ごとのリストに直接格納する。
+    一年分の開示情報を取得するときなど、大量のページを解析するときに使う。
+
+    Args:
+        html (str): 開示情報一覧ページのHTML。
+
+    Returns:
+        pl.DataFrame: `Code`, `DisclosedTime`, `Company`, `Title`, `PdfUrl`,
+            `XbrlUrl`, `UpdateStatus`列を持つDataFrame。開示情報がないときは
+            空のDataFrame。
+    """
+    if not html.strip():
+        return pl.DataFrame()
+
+    root = lxml_html.fromstring(html)
+    columns: dict[str, list[str | None]] = {name: [] for name in LIST_SCHEMA}
+
+    for tr in _ROWS(root):
+        tds = _CELLS(tr)
+        columns["DisclosedTime"].append(_get_text(tds[0]))
+        columns["Code"].append(_get_text(tds[1]))
+        columns["Company"].append(_get_text(tds[2]))
+        columns["Title"].append(_get_text(tds[3]))
+        columns["PdfUrl"].append(_get_href(tds[3]))
+        columns["XbrlUrl"].append(_get_href(tds[4]))
+        columns["UpdateStatus"].append(_get_text(tds[6]) or None)
+
+    if not columns["Code"]:
+        return pl.DataFrame()
+
+    return pl.DataFrame(columns, schema=LIST_SCHEMA).with_columns(
+        pl.col("DisclosedTime").str.to_time("%H:%M"),
+    )
+
+
+def _get_text(element: etree._Element) -> str:  # pyright: ignore[reportPrivateUsage]
+    # BeautifulSoupのget_text(strip=True)と同じく、各テキストを除去して連結する
+    return "".join(text.strip() for text in _TEXTS(element))  # pyright: ignore[reportUnknownVariableType, reportGeneralTypeIssues, reportUnknownArgumentType]
+
+
+def _get_href(element: etree._Element) -> str | None:  # pyright: ignore[reportPrivateUsage]
+    hrefs = _HREF(element)
+    return str(hrefs[0]) if hrefs else None  # pyright: ignore[reportIndexIssue, reportArgumentType]
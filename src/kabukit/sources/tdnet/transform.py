@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import polars as pl
 
 from kabukit.sources.utils import normalize_code
 
+if TYPE_CHECKING:
+    import datetime
+
 
 def transform_list(df: pl.DataFrame) -> pl.DataFrame:
     null_columns = [c for c in df.columns if df[c].dtype == pl.Null]
@@ -11,3 +16,12 @@ def transform_list(df: pl.DataFrame) -> pl.DataFrame:
     return df.with_columns(
         pl.col(null_columns).cast(pl.String),
     ).pipe(normalize_code)
+
+
+def with_disclosed_date(df: pl.DataFrame, date: datetime.date) -> pl.DataFrame:
+    """`parse_list`の結果に`DisclosedDate`列を追加する。"""
+    return df.select(
+        "Code",
+        pl.lit(date).alias("DisclosedDate"),
+        pl.exclude("Code"),
+    )
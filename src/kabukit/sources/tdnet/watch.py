@@ -0,0 +1,150 @@
+"""TDnetの当日の開示情報を監視するためのモジュール。"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, final
+
+import httpx
+import polars as pl
+
+from kabukit.sources.datetime import with_date
+from kabukit.utils.datetime import today
+
+from .parser import iter_page_numbers, parse_list
+from .transform import transform_list, with_disclosed_date
+
+if TYPE_CHECKING:
+    import datetime
+    from collections.abc import AsyncIterator
+
+    from .client import TdnetClient
+
+
+KEY_COLUMNS = ("DisclosedTime", "Code", "Title", "PdfUrl")
+"""開示情報を識別する列"""
+
+
+@final
+class TdnetWatcher:
+    """当日の開示情報一覧を定期的に取得し、新しい開示情報を検出する。
+
+    TDnetの開示情報一覧は新しい順に並ぶ。1ページ目から順に取得し、
+    既知の開示情報を含むページに達したところで取得を止めるので、
+    通常は1ページ目だけを取得する。1ページ目は条件付きリクエストで取得し、
+    変更がなければ解析しない。開示情報は`KEY_COLUMNS`の組で識別する。
+
+    レスポンスキャッシュは使用しない。日付が変わると既知の開示情報を破棄する。
+
+    Example:
+        ```python
+        async with TdnetClient() as client:
+            async for df in TdnetWatcher(client, interval=20):
+                print(df.select("Code", "Company", "Title"))
+        ```
+
+    Args:
+        client (TdnetClient): リクエストに使用するクライアント。
+        interval (float, optional): ポーリングの間隔 (秒)。デフォルトは30。
+        initial (bool, optional): 最初のポーリングで、すでに開示されている
+            当日の開示情報も生成するとき True。デフォルトはFalse。
+    """
+
+    client: TdnetClient
+    interval: float
+    initial: bool
+
+    def __init__(
+        self,
+        client: TdnetClient,
+        interval: float = 30,
+        *,
+        initial: bool = False,
+    ) -> None:
+        self.client = client
+        self.interval = interval
+        self.initial = initial
+        self._date: datetime.date | None = None
+        self._seen: set[tuple[Any, ...]] = set()
+        self._validators: dict[str, str] = {}
+        self._started = False
+
+    async def poll(self) -> pl.DataFrame:
+        """開示情報一覧を一度取得し、新しい開示情報を返す。
+
+        Returns:
+            pl.DataFrame: 新しい開示情報を開示時刻の古い順に含むDataFrame。
+                `TdnetClient.get_list`と同じ列を持つ。新しい開示情報が
+                ないときは空のDataFrame。
+        """
+        date = today()
+
+        if date != self._date:
+            self._date = date
+            self._seen.clear()
+            self._validators.clear()
+
+        try:
+            text = await self._get_first_page(date)
+        except httpx.HTTPStatusError:
+            return pl.DataFrame()
+
+        if text is None:
+            return pl.DataFrame()
+
+        page_numbers = set(iter_page_numbers(text))
+        dfs: list[pl.DataFrame] = []
+        index = 1
+
+        while not (df := parse_list(text)).is_empty():
+            keys = df.select(KEY_COLUMNS).iter_rows()
+            is_new = [key not in self._seen for key in keys]
+            dfs.append(df.filter(pl.Series(is_new, dtype=pl.Boolean)))
+
+            if not all(is_new) or index + 1 not in page_numbers:
+                break
+
+            index += 1
+            response = await self.client.request(get_page_url(date, index))
+            text = response.text
+
+        df = pl.concat(dfs) if dfs else pl.DataFrame()
+
+        if not df.is_empty():
+            self._seen.update(df.select(KEY_COLUMNS).iter_rows())
+
+        started, self._started = self._started, True
+        if df.is_empty() or (not started and not self.initial):
+            return pl.DataFrame()
+
+        df = transform_list(with_disclosed_date(df.reverse(), date))
+        return await with_date(df)
+
+    async def _get_first_page(self, date: datetime.date) -> str | None:
+        url = get_page_url(date, 1)
+        response = await self.client.request(url, headers=self._validators or None)
+
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            return None
+
+        self._validators = {}
+        if etag := response.headers.get("etag"):
+            self._validators["If-None-Match"] = etag
+        if last_modified := response.headers.get("last-modified"):
+            self._validators["If-Modified-Since"] = last_modified
+
+        return response.text
+
+    async def __aiter__(self) -> AsyncIterator[pl.DataFrame]:
+        while True:
+            df = await self.poll()
+
+            if not df.is_empty():
+                yield df
+
+            await asyncio.sleep(self.interval)
+
+
+def get_page_url(date: datetime.date, index: int) -> str:
+    """開示情報一覧ページのURLを返す。"""
+    return f"I_list_{index:03}_{date:%Y%m%d}.html"
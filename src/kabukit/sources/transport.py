@@ -0,0 +1,85 @@
+"""複数のクライアントで共有するHTTPトランスポートを提供するモジュール。"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Self, final
+
+import httpx
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+@final
+class SharedTransport(httpx.AsyncBaseTransport):
+    """複数のクライアントで共有するコネクションプール付きのトランスポート。
+
+    クライアントを閉じてもコネクションプールは閉じない。
+    `async with`ブロックを抜けるとき、または`close`を呼び出したときに閉じる。
+    同じホストへの接続とTLSハンドシェイクを、クライアント間で再利用できる。
+
+    Example:
+        ```python
+        async with SharedTransport(http2=True) as transport:
+            df1 = await concurrent.get(JQuantsClient, ..., transport=transport)
+            df2 = await concurrent.get(JQuantsClient, ..., transport=transport)
+        ```
+
+    Args:
+        limits (httpx.Limits | None, optional): コネクションプールの上限と
+            キープアライブの有効期間。指定しないときはhttpxのデフォルト値。
+        http2 (bool, optional): HTTP/2を使用するとき True。
+            `h2`パッケージが必要。
+    """
+
+    transport: httpx.AsyncHTTPTransport
+
+    def __init__(
+        self,
+        limits: httpx.Limits | None = None,
+        *,
+        http2: bool = False,
+    ) -> None:
+        self.transport = create_transport(limits, http2=http2)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self.transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """クライアントから呼ばれる。共有しているため何もしない。"""
+
+    async def close(self) -> None:
+        """コネクションプールを閉じる。"""
+        await self.transport.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None = None,
+        exc_value: BaseException | None = None,
+        traceback: TracebackType | None = None,
+    ) -> None:
+        await self.close()
+
+
+def create_transport(
+    limits: httpx.Limits | None = None,
+    *,
+    http2: bool = False,
+) -> httpx.AsyncHTTPTransport:
+    """コネクションプールの設定を指定してトランスポートを作成する。
+
+    Args:
+        limits (httpx.Limits | None, optional): コネクションプールの上限と
+            キープアライブの有効期間。指定しないときはhttpxのデフォルト値。
+        http2 (bool, optional): HTTP/2を使用するとき True。
+
+    Returns:
+        httpx.AsyncHTTPTransport: 作成したトランスポート。
+    """
+    if limits is None:
+        return httpx.AsyncHTTPTransport(http2=http2)
+
+    return httpx.AsyncHTTPTransport(limits=limits, http2=http2)
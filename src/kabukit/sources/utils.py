@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import io
+import threading
 import zipfile
-from functools import cache
-from typing import TYPE_CHECKING, Literal, overload
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Literal, NamedTuple, final, overload
 
 import polars as pl
 from bs4 import BeautifulSoup
@@ -11,6 +12,7 @@ from bs4 import BeautifulSoup
 if TYPE_CHECKING:
     import re
     from collections.abc import Iterator
+    from typing import IO
 
 
 def normalize_code(data: pl.DataFrame, /, column: str = "Code") -> pl.DataFrame:
@@ -31,14 +33,109 @@ def normalize_code(data: pl.DataFrame, /, column: str = "Code") -> pl.DataFrame:
     )
 
 
-@cache
-def get_soup(html: str) -> BeautifulSoup:
-    return BeautifulSoup(html, "lxml")
+SOUP_CACHE_MAXSIZE = 16
+SOUP_CACHE_MAXCHARS = 16 * 1024 * 1024
+
+
+class SoupCacheInfo(NamedTuple):
+    """`SoupCache`の統計情報。"""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    maxchars: int
+    currchars: int
+
+
+@final
+class SoupCache:
+    """HTML文字列をキーとして解析結果を保持する、上限付きのLRUキャッシュ。
+
+    同じレスポンスに対して複数のパーサー関数を呼び出すとき、解析を一度で済ませる。
+    エントリー数が`maxsize`を、HTML文字列の文字数の合計が`maxchars`を超えると、
+    最も古く参照されたエントリーから破棄する。`maxchars`より長いHTMLはキャッシュしない。
+
+    `maxchars`が制限するのは入力のHTML文字列の文字数だけで、メモリ使用量ではない。
+    解析したBeautifulSoupオブジェクトは、元の文字列より何倍も大きくなる。
+
+    Args:
+        maxsize (int): 保持するエントリー数の上限。
+        maxchars (int): 保持するHTML文字列の文字数の合計の上限。
+    """
+
+    maxsize: int
+    maxchars: int
+
+    def __init__(
+        self,
+        maxsize: int = SOUP_CACHE_MAXSIZE,
+        maxchars: int = SOUP_CACHE_MAXCHARS,
+    ) -> None:
+        self.maxsize = maxsize
+        self.maxchars = maxchars
+        self._data: OrderedDict[str, BeautifulSoup] = OrderedDict()
+        self._nchars = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, html: str) -> BeautifulSoup:
+        """HTML文字列を解析したBeautifulSoupオブジェクトを返す。"""
+        with self._lock:
+            if (soup := self._data.get(html)) is not None:
+                self._data.move_to_end(html)
+                self._hits += 1
+                return soup
+
+            self._misses += 1
+
+        soup = BeautifulSoup(html, "lxml")
+
+        if len(html) > self.maxchars:
+            return soup
+
+        with self._lock:
+            if html in self._data:
+                return self._data[html]
+
+            self._data[html] = soup
+            self._nchars += len(html)
+
+            while len(self._data) > self.maxsize or self._nchars > self.maxchars:
+                key, _ = self._data.popitem(last=False)
+                self._nchars -= len(key)
+
+        return soup
+
+    def cache_info(self) -> SoupCacheInfo:
+        """キャッシュの統計情報を返す。"""
+        with self._lock:
+            return SoupCacheInfo(
+                self._hits,
+                self._misses,
+                self.maxsize,
+                len(self._data),
+                self.maxchars,
+                self._nchars,
+            )
+
+    def cache_clear(self) -> None:
+        """キャッシュと統計情報を消去する。"""
+        with self._lock:
+            self._data.clear()
+            self._nchars = 0
+            self._hits = 0
+            self._misses = 0
+
+
+get_soup = SoupCache()
+"""HTML文字列を解析する。TDnetやJPXのパーサー関数で共有する。"""
 
 
 @overload
 def iter_contents(
-    content: bytes,
+    content: bytes | IO[bytes] | str,
     pattern: re.Pattern[str],
     *,
     include_filename: Literal[False] = False,
@@ -47,7 +144,7 @@ def iter_contents(
 
 @overload
 def iter_contents(
-    content: bytes,
+    content: bytes | IO[bytes] | str,
     pattern: re.Pattern[str],
     *,
     include_filename: Literal[True],
@@ -55,14 +152,19 @@ def iter_contents(
 
 
 def iter_contents(
-    content: bytes,
+    content: bytes | IO[bytes] | str,
     pattern: re.Pattern[str],
     *,
     include_filename: bool = False,
 ) -> Iterator[bytes] | Iterator[tuple[str, bytes]]:
-    buffer = io.BytesIO(content)
+    """ZIPファイルから、名前がパターンに一致するメンバーの内容を順に返す。
+
+    `content`にファイルまたはパスを指定すると、アーカイブ全体をメモリに
+    読み込まずにメンバーを一つずつ展開する。
+    """
+    file = io.BytesIO(content) if isinstance(content, bytes) else content
 
-    with zipfile.ZipFile(buffer) as zf:
+    with zipfile.ZipFile(file) as zf:
         for info in zf.infolist():
             if pattern.match(info.filename):
                 with zf.open(info) as f:
@@ -0,0 +1,121 @@
+"""営業日の計算を行うためのモジュール。"""
+
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, final
+
+import polars as pl
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+PADDING = 31
+"""カレンダーの終端の休日から翌営業日を求めるために、末尾に追加する日数"""
+
+
+@final
+class BusinessCalendar:
+    """休日の一覧から営業日を計算するためのカレンダー。
+
+    `start`から`end`までの各日について、その日以降の最初の営業日を
+    あらかじめ求めておく。翌営業日への丸めは、日付と`start`の差を
+    インデックスとする配列の参照になるので、休日のリストを毎回渡して
+    計算するより速い。範囲外の日付と、末尾の追加した日数のうち次の営業日が
+    求まらない日付は、週末とすべての`holidays`から計算する。
+
+    土曜日と日曜日は、`holidays`に含まれていなくても休日とする。
+
+    Args:
+        holidays (Iterable[datetime.date]): 休日のリスト。
+        start (datetime.date | None, optional): カレンダーの開始日。
+            指定しないときは休日の最初の日。
+        end (datetime.date | None, optional): カレンダーの終了日。
+            指定しないときは休日の最後の日。
+
+    Attributes:
+        holidays (list[datetime.date]): 休日のリスト。
+        start (datetime.date | None): カレンダーの開始日。
+        end (datetime.date | None): カレンダーの終了日。
+    """
+
+    holidays: list[datetime.date]
+    start: datetime.date | None
+    end: datetime.date | None
+
+    def __init__(
+        self,
+        holidays: Iterable[datetime.date],
+        start: datetime.date | None = None,
+        end: datetime.date | None = None,
+    ) -> None:
+        self.holidays = sorted(set(holidays))
+        self.start = start or (self.holidays[0] if self.holidays else None)
+        self.end = end or (self.holidays[-1] if self.holidays else None)
+        self._next = self._build()
+
+    @classmethod
+    def from_frame(cls, df: pl.DataFrame) -> BusinessCalendar:
+        """`Date`列と`IsHoliday`列を持つDataFrameからカレンダーを作成する。
+
+        Args:
+            df (pl.DataFrame): 営業日カレンダー。`get_calendar`の戻り値を指定できる。
+
+        Returns:
+            BusinessCalendar: 作成したカレンダー。
+        """
+        holidays = df.filter(pl.col("IsHoliday"))["Date"]
+        start, end = df["Date"].min(), df["Date"].max()
+
+        if not isinstance(start, datetime.date) or not isinstance(end, datetime.date):
+            return cls(holidays)
+
+        return cls(holidays, start, end)
+
+    def _build(self) -> pl.Series:
+        if self.start is None or self.end is None:
+            return pl.Series(dtype=pl.Date)
+
+        end = self.end + datetime.timedelta(days=PADDING)
+        dates = pl.date_range(self.start, end, eager=True)
+        is_business = (dates.dt.weekday() <= 5) & ~dates.is_in(self.holidays)
+
+        expr = pl.when(is_business).then(dates).backward_fill()
+        next_ = pl.select(expr).to_series()
+
+        # 末尾の休日が続く部分は翌営業日が求まらないので、範囲外とする
+        return next_.head(next_.len() - next_.is_null().sum())
+
+    def __len__(self) -> int:
+        return len(self._next)
+
+    def roll_forward(self, expr: pl.Expr) -> pl.Expr:
+        """日付を、その日以降の最初の営業日に丸める式を返す。
+
+        Args:
+            expr (pl.Expr): 日付の式。
+
+        Returns:
+            pl.Expr: 営業日の式。営業日はそのまま返す。
+        """
+        fallback = expr.dt.add_business_days(0, holidays=self.holidays, roll="forward")
+
+        if self.start is None or not len(self):
+            return fallback
+
+        index = (expr - pl.lit(self.start)).dt.total_days()
+        in_range = index.is_between(0, len(self) - 1)
+        gathered = pl.lit(self._next).gather(index.clip(0, len(self) - 1))
+
+        return pl.when(in_range).then(gathered).otherwise(fallback).name.keep()
+
+    def is_business_day(self, expr: pl.Expr) -> pl.Expr:
+        """日付が営業日であるかを判定する式を返す。
+
+        Args:
+            expr (pl.Expr): 日付の式。
+
+        Returns:
+            pl.Expr: 営業日のときTrueとなる式。
+        """
+        return self.roll_forward(expr) == expr
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import datetime
+import os
+import re
 import shutil
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+from urllib.parse import quote
 
 import polars as pl
 
@@ -9,9 +14,116 @@ from .config import get_cache_dir
 from .datetime import today
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
     from pathlib import Path
 
+    from polars._typing import ParquetCompression
+
+HIVE_NULL = "__HIVE_DEFAULT_PARTITION__"
+"""The directory value of a null partition key, as read by polars."""
+
+PARTITION_GLOB = "*=*/**/*.parquet"
+"""The glob pattern of the partition files below a group directory."""
+
+
+COMPRESSION_PROFILES: dict[str, tuple[ParquetCompression, int | None]] = {
+    "balanced": ("zstd", 3),
+    "small": ("zstd", 12),
+    "fast": ("lz4", None),
+    "none": ("uncompressed", None),
+}
+"""Compression codec and level for each profile name.
+
+"balanced" is a good default, "small" trades write time for smaller files,
+and "fast" decompresses fastest for repeated scans.
+"""
+
+
+@dataclass(frozen=True)
+class ParquetOptions:
+    """Options for writing a cache group to Parquet.
+
+    Attributes:
+        sort_by: The columns to sort by before writing. Sorting by the natural
+            key keeps each row group to a narrow range of keys, so that the
+            row-group statistics let filters skip most of the file.
+            Columns missing from the DataFrame are ignored.
+        row_group_size: The number of rows per row group.
+            If None, the polars default is used.
+        profile: The name of the compression profile in `COMPRESSION_PROFILES`.
+    """
+
+    sort_by: tuple[str, ...] = ()
+    row_group_size: int | None = None
+    profile: str = "balanced"
+
+
+PARQUET_OPTIONS: dict[tuple[str, str], ParquetOptions] = {
+    ("jquants", "calendar"): ParquetOptions(("Date",)),
+    ("jquants", "info"): ParquetOptions(("Code", "Date")),
+    ("jquants", "prices"): ParquetOptions(("Code", "Date"), 65_536),
+    ("jquants", "statements"): ParquetOptions(("Code", "Date"), 16_384),
+    ("edinet", "list"): ParquetOptions(("Code", "Date")),
+    ("tdnet", "list"): ParquetOptions(("Code", "Date")),
+    ("jpx", "shares"): ParquetOptions(("Code", "Date"), 65_536),
+}
+"""Default Parquet options for each (source, group) of the cache."""
+
+
+def get_parquet_options(source: str, group: str) -> ParquetOptions:
+    """Return the Parquet options for a cache group.
+
+    Args:
+        source: The name of the cache subdirectory (e.g., "jquants", "edinet").
+        group: The name of the cache subdirectory (e.g., "prices", "statements").
+
+    Returns:
+        ParquetOptions: The options in `PARQUET_OPTIONS`, or the defaults.
+    """
+    return PARQUET_OPTIONS.get((source, group), ParquetOptions())
+
+
+def write_parquet(
+    df: pl.DataFrame,
+    file: str | Path,
+    options: ParquetOptions | None = None,
+    *,
+    profile: str | None = None,
+) -> None:
+    """Write a polars.DataFrame to a Parquet file with the given options.
+
+    The DataFrame is sorted by `options.sort_by`, and the file is always
+    written with row-group statistics.
+
+    Args:
+        df: The polars.DataFrame to write.
+        file: The path to the Parquet file.
+        options: The Parquet options. If None, the defaults are used.
+        profile: The compression profile, overriding `options.profile`.
+
+    Raises:
+        ValueError: If the compression profile is unknown.
+    """
+    options = options or ParquetOptions()
+    profile = profile or options.profile
+
+    if profile not in COMPRESSION_PROFILES:
+        msg = f"Unknown compression profile: {profile}"
+        raise ValueError(msg)
+
+    compression, level = COMPRESSION_PROFILES[profile]
+
+    if sort_by := [c for c in options.sort_by if c in df.columns]:
+        df = df.sort(sort_by, nulls_last=True, maintain_order=True)
+
+    df.write_parquet(
+        file,
+        compression=compression,
+        compression_level=level,
+        statistics=True,
+        row_group_size=options.row_group_size,
+    )
+
 
 def glob(source: str | None = None, group: str | None = None) -> Iterator[Path]:
     """Glob parquet files in the cache directory.
@@ -80,15 +192,52 @@ def read(source: str, group: str, name: str | None = None) -> pl.DataFrame:
     return pl.read_parquet(filepath)
 
 
-def write(source: str, group: str, df: pl.DataFrame, name: str | None = None) -> Path:
+def scan(source: str, group: str, name: str | None = None) -> pl.LazyFrame:
+    """Scan a cache file lazily as a polars.LazyFrame.
+
+    Unlike `read`, nothing is loaded until the LazyFrame is collected.
+    Column selections and filters are pushed down into the Parquet reader,
+    so only the needed columns are decoded and row groups whose statistics
+    exclude the filter are skipped.
+
+    Args:
+        source: The name of the cache subdirectory (e.g., "jquants", "edinet").
+        group: The name of the cache subdirectory (e.g., "info", "statements").
+        name: Optional. A specific filename (without extension) within the cache group.
+              If None, the latest file in the subdirectory is scanned.
+
+    Returns:
+        polars.LazyFrame: The LazyFrame over the cache file.
+
+    Raises:
+        FileNotFoundError: If no data is found in the cache.
+    """
+    filepath = _get_cache_filepath(source, group, name)
+    return pl.scan_parquet(filepath)
+
+
+def write(
+    source: str,
+    group: str,
+    df: pl.DataFrame,
+    name: str | None = None,
+    *,
+    profile: str | None = None,
+) -> Path:
     """Write a polars.DataFrame directly to the cache.
 
+    The file is written with the Parquet options of the group
+    (see `PARQUET_OPTIONS`): sorted by the natural key, with tuned row groups
+    and statistics, so that `scan` can skip row groups for filtered reads.
+
     Args:
         source: The name of the cache subdirectory (e.g., "jquants", "edinet").
         group: The name of the cache subdirectory (e.g., "info", "statements").
         df: The polars.DataFrame to write.
         name: Optional. The filename (without extension) for the parquet file.
               If None, a timestamp is used as the filename.
+        profile: Optional. The compression profile in `COMPRESSION_PROFILES`.
+              If None, the default profile of the group is used.
 
     Returns:
         Path: The path to the written Parquet file.
@@ -100,10 +249,135 @@ def write(source: str, group: str, df: pl.DataFrame, name: str | None = None) ->
         name = today().strftime("%Y%m%d")
 
     filename = data_dir / f"{name}.parquet"
-    df.write_parquet(filename)
+    write_parquet(df, filename, get_parquet_options(source, group), profile=profile)
+    return filename
+
+
+def write_partitions(
+    source: str,
+    group: str,
+    df: pl.DataFrame,
+    partition_by: str | Sequence[str],
+    *,
+    mode: Literal["overwrite", "append"] = "overwrite",
+    profile: str | None = None,
+) -> list[Path]:
+    """Write a polars.DataFrame to the cache as a Hive-partitioned dataset.
+
+    Each partition is a directory `<key>=<value>/...` below the group directory,
+    for example `jquants/prices/year=2025/month=10/part-00000.parquet`.
+    Only the partitions present in `df` are touched; other partitions are kept.
+    The partition columns are encoded in the directory names and are not stored
+    in the files. Snapshots written by `write` stay directly in the group
+    directory and are not part of the dataset.
+
+    Args:
+        source: The name of the cache subdirectory (e.g., "jquants", "edinet").
+        group: The name of the cache subdirectory (e.g., "prices", "statements").
+        df: The polars.DataFrame to write.
+        partition_by: The column name(s) to partition by, in directory order.
+        mode: "overwrite" replaces the files of each written partition.
+              "append" adds a new file next to the existing ones.
+        profile: Optional. The compression profile in `COMPRESSION_PROFILES`.
+              If None, the default profile of the group is used.
+
+    Returns:
+        list[Path]: The paths to the written Parquet files.
+    """
+    keys = [partition_by] if isinstance(partition_by, str) else list(partition_by)
+    data_dir = get_cache_dir() / source / group
+    options = get_parquet_options(source, group)
+    paths: list[Path] = []
+
+    parts = df.partition_by(keys, as_dict=True, include_key=False, maintain_order=True)
+
+    for values, part in parts.items():
+        names = (
+            f"{k}={_format_partition_value(v)}"
+            for k, v in zip(keys, values, strict=True)
+        )
+        part_dir = data_dir.joinpath(*names)
+        path = _write_partition(part_dir, part, options, mode=mode, profile=profile)
+        paths.append(path)
+
+    return paths
+
+
+def _format_partition_value(value: object) -> str:
+    if value is None:
+        return HIVE_NULL
+
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+
+    return quote(str(value), safe="")
+
+
+def _write_partition(
+    part_dir: Path,
+    df: pl.DataFrame,
+    options: ParquetOptions,
+    *,
+    mode: Literal["overwrite", "append"],
+    profile: str | None,
+) -> Path:
+    part_dir.mkdir(parents=True, exist_ok=True)
+    existing = sorted(part_dir.glob("part-*.parquet"))
+
+    if mode == "append":
+        index = max((_part_index(path) for path in existing), default=-1) + 1
+    else:
+        index = 0
+
+    filename = part_dir / f"part-{index:05d}.parquet"
+    tmp = filename.with_name(f"{filename.name}.{os.getpid()}.tmp")
+    write_parquet(df, tmp, options, profile=profile)
+
+    if mode == "overwrite":
+        for path in existing:
+            path.unlink()
+
+    tmp.replace(filename)
     return filename
 
 
+def _part_index(path: Path) -> int:
+    m = re.fullmatch(r"part-(\d+)\.parquet", path.name)
+    return int(m.group(1)) if m else -1
+
+
+def scan_partitions(source: str, group: str) -> pl.LazyFrame:
+    """Scan a Hive-partitioned dataset in the cache lazily.
+
+    The partition keys are added as columns parsed from the directory names.
+    Filters on the partition keys skip whole directories, and filters on other
+    columns and column selections are pushed down into the Parquet reader.
+    The schema is taken from the first file; columns missing in other files
+    are filled with nulls.
+
+    Args:
+        source: The name of the cache subdirectory (e.g., "jquants", "edinet").
+        group: The name of the cache subdirectory (e.g., "prices", "statements").
+
+    Returns:
+        polars.LazyFrame: The LazyFrame over all partitions of the dataset.
+
+    Raises:
+        FileNotFoundError: If the dataset has no partitions.
+    """
+    data_dir = get_cache_dir() / source / group
+
+    if not any(data_dir.glob(PARTITION_GLOB)):
+        msg = f"No partitioned data found for {source}/{group}"
+        raise FileNotFoundError(msg)
+
+    return pl.scan_parquet(
+        data_dir / PARTITION_GLOB,
+        hive_partitioning=True,
+        missing_columns="insert",
+    )
+
+
 def clean(source: str | None = None, group: str | None = None) -> None:
     """Remove the entire cache directory or a specified cache group.
 
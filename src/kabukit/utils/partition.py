@@ -0,0 +1,194 @@
+"""日ごとに分割した一覧をキャッシュに保存するためのモジュール。
+
+EDINETやTDnetの書類一覧は、日付ごとに取得する。過去の日付の一覧は
+ほとんど変わらないので、日付ごとのファイルに分けて保存しておけば、
+期間を指定した取得で、保存していない日と内容が変わりうる日だけを
+取得すればよい。
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, final
+
+import polars as pl
+
+from .config import get_cache_dir
+from .datetime import today
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+MANIFEST = "_manifest.json"
+"""保存した日付とその状態を記録するファイルの名前"""
+
+
+@final
+class DailyPartitions:
+    """日付の列で分割したDataFrameのキャッシュ。
+
+    各日の一覧を`<source>/<group>/<column>=YYYY-MM-DD/data.parquet`に保存する。
+    一覧が空の日はファイルを作らず、マニフェストにだけ記録する。
+
+    一覧を取得した時点でその日が過ぎていれば、その日は確定 (immutable) とし、
+    再び取得しない。当日以降の一覧は、書類が追加されうるので未確定とし、
+    次の取得で上書きする。
+
+    `group`の直下には`*.parquet`を置かないので、同じグループの
+    スナップショット (`cache.read`) とは干渉しない。
+
+    Args:
+        source (str): キャッシュのサブディレクトリの名前 (例: "edinet")。
+        group (str): キャッシュのサブディレクトリの名前 (例: "list")。
+        column (str): 分割に使う日付の列 (例: "FileDate")。
+        path (str | Path | None, optional): 保存先のディレクトリ。
+            指定しないときはキャッシュディレクトリの`<source>/<group>`。
+
+    Attributes:
+        source (str): キャッシュのサブディレクトリの名前。
+        group (str): キャッシュのサブディレクトリの名前。
+        column (str): 分割に使う日付の列。
+    """
+
+    source: str
+    group: str
+    column: str
+
+    def __init__(
+        self,
+        source: str,
+        group: str,
+        column: str,
+        *,
+        path: str | Path | None = None,
+    ) -> None:
+        self.source = source
+        self.group = group
+        self.column = column
+        self._path = Path(path) if path is not None else None
+        self._manifest: dict[datetime.date, tuple[int, bool]] | None = None
+
+    @property
+    def path(self) -> Path:
+        """保存先のディレクトリ。"""
+        if self._path is not None:
+            return self._path
+
+        return get_cache_dir() / self.source / self.group
+
+    def _partition_path(self, date: datetime.date) -> Path:
+        return self.path / f"{self.column}={date:%Y-%m-%d}" / "data.parquet"
+
+    @property
+    def manifest(self) -> dict[datetime.date, tuple[int, bool]]:
+        """保存した日付ごとの行数と確定しているかどうか。"""
+        if self._manifest is None:
+            self._manifest = self._load()
+
+        return self._manifest
+
+    def _load(self) -> dict[datetime.date, tuple[int, bool]]:
+        try:
+            text = (self.path / MANIFEST).read_text(encoding="utf-8")
+            data: dict[str, list[int]] = json.loads(text)
+        except (OSError, ValueError):
+            return {}
+
+        manifest: dict[datetime.date, tuple[int, bool]] = {}
+        for date, (rows, is_final) in data.items():
+            manifest[datetime.date.fromisoformat(date)] = (rows, bool(is_final))
+
+        return manifest
+
+    def flush(self) -> None:
+        """マニフェストをディスクに保存する。"""
+        if self._manifest is None:
+            return
+
+        data = {
+            f"{date:%Y-%m-%d}": [rows, int(is_final)]
+            for date, (rows, is_final) in sorted(self._manifest.items())
+        }
+        path = self.path / MANIFEST
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        tmp.replace(path)
+
+    def is_final(self, date: datetime.date) -> bool:
+        """日付の一覧が保存済みで、確定しているかを判定する。"""
+        entry = self.manifest.get(date)
+        return entry is not None and entry[1]
+
+    def missing(self, dates: Iterable[datetime.date]) -> list[datetime.date]:
+        """取得が必要な日付のリストを返す。
+
+        Args:
+            dates (Iterable[datetime.date]): 対象の日付。
+
+        Returns:
+            list[datetime.date]: 保存していないか、未確定の日付。
+                順序は`dates`と同じ。
+        """
+        return [date for date in dates if not self.is_final(date)]
+
+    def write(self, date: datetime.date, df: pl.DataFrame) -> None:
+        """日付の一覧を保存する。
+
+        マニフェストはメモリ上で更新するので、`flush`を呼び出して保存する。
+
+        Args:
+            date (datetime.date): 一覧の日付。
+            df (pl.DataFrame): 一覧。空のときはファイルを作らない。
+        """
+        path = self._partition_path(date)
+
+        if df.is_empty():
+            path.unlink(missing_ok=True)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            df.write_parquet(tmp)
+            tmp.replace(path)
+
+        self.manifest[date] = (df.height, date < today())
+
+    def scan(self, dates: Iterable[datetime.date] | None = None) -> pl.LazyFrame:
+        """保存した一覧を読み込むLazyFrameを返す。
+
+        対象の日付のファイルだけを読み込む。日によって列が異なることがあるので、
+        各ファイルのLazyFrameを列の和集合で結合する。
+        `filter`や`select`は各ファイルの読み込みに適用される。
+
+        Args:
+            dates (Iterable[datetime.date] | None, optional): 対象の日付。
+                指定しないときは保存したすべての日付。
+
+        Returns:
+            pl.LazyFrame: 一覧のLazyFrame。対象の一覧がすべて空のときは
+                列のないLazyFrame。
+        """
+        dates = self.manifest if dates is None else dates
+        targets = sorted({d for d in dates if self.manifest.get(d, (0,))[0]})
+        paths = [self._partition_path(d) for d in targets]
+        lfs = [pl.scan_parquet(path) for path in paths if path.exists()]
+
+        if not lfs:
+            return pl.LazyFrame()
+
+        return pl.concat(lfs, how="diagonal_relaxed")
+
+    def read(self, dates: Iterable[datetime.date] | None = None) -> pl.DataFrame:
+        """保存した一覧を読み込む。
+
+        Args:
+            dates (Iterable[datetime.date] | None, optional): 対象の日付。
+                指定しないときは保存したすべての日付。
+
+        Returns:
+            pl.DataFrame: 一覧。
+        """
+        return self.scan(dates).collect()
@@ -25,6 +25,7 @@ def mock_cache_dir(tmp_path: Path, mocker: MockerFixture) -> Path:
     # to avoid polluting the actual cache and ensure test isolation.
     mocker.patch("kabukit.utils.config.get_cache_dir", return_value=tmp_path)
     mocker.patch("kabukit.utils.cache.get_cache_dir", return_value=tmp_path)
+    mocker.patch("kabukit.utils.partition.get_cache_dir", return_value=tmp_path)
     return tmp_path
 
 
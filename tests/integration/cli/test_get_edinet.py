@@ -47,6 +47,7 @@ def test_get_edinet(mock_get_edinet: AsyncMock, mock_cache_dir: Path) -> None:
         years=10,
         progress=None,
         max_items=None,
+        cache=False,
     )
 
     assert not get_cache_files(mock_cache_dir)
@@ -63,6 +64,7 @@ def test_get_edinet_date(mock_get_edinet: AsyncMock, mock_cache_dir: Path) -> No
         years=10,
         progress=None,
         max_items=None,
+        cache=False,
     )
 
     assert not get_cache_files(mock_cache_dir)
@@ -84,6 +86,7 @@ def test_get_edinet_all(
         years=10,
         progress=mocker.ANY,
         max_items=None,
+        cache=True,
     )
 
     cache_files = get_cache_files(mock_cache_dir)
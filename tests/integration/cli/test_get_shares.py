@@ -47,7 +47,11 @@ def test_get_shares(
     assert str(MOCK_DF) in result.stdout
     assert "上場株式数を" in result.stdout
 
-    mock_get_shares.assert_called_once_with(progress=mocker.ANY, max_items=None)
+    mock_get_shares.assert_called_once_with(
+        progress=mocker.ANY,
+        max_items=None,
+        store=True,
+    )
 
     cache_files = get_cache_files(mock_cache_dir)
     assert len(cache_files) == 1
@@ -43,7 +43,12 @@ def test_get_tdnet(mock_get_tdnet: AsyncMock, mock_cache_dir: Path) -> None:
     assert result.exit_code == 0
     assert str(MOCK_DF) in result.stdout
 
-    mock_get_tdnet.assert_called_once_with(today(), progress=None, max_items=None)
+    mock_get_tdnet.assert_called_once_with(
+        today(),
+        progress=None,
+        max_items=None,
+        cache=False,
+    )
 
     assert not get_cache_files(mock_cache_dir)
 
@@ -54,7 +59,12 @@ def test_get_tdnet_date(mock_get_tdnet: AsyncMock, mock_cache_dir: Path) -> None
     assert result.exit_code == 0
     assert str(MOCK_DF) in result.stdout
 
-    mock_get_tdnet.assert_called_once_with(MOCK_DATE_OBJ, progress=None, max_items=None)
+    mock_get_tdnet.assert_called_once_with(
+        MOCK_DATE_OBJ,
+        progress=None,
+        max_items=None,
+        cache=False,
+    )
 
     assert not get_cache_files(mock_cache_dir)
 
@@ -70,7 +80,12 @@ def test_get_tdnet_all(
     assert str(MOCK_DF) in result.stdout
     assert "書類一覧を" in result.stdout
 
-    mock_get_tdnet.assert_called_once_with(None, progress=mocker.ANY, max_items=None)
+    mock_get_tdnet.assert_called_once_with(
+        None,
+        progress=mocker.ANY,
+        max_items=None,
+        cache=True,
+    )
 
     cache_files = get_cache_files(mock_cache_dir)
     assert len(cache_files) == 1
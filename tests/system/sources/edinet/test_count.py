@@ -14,5 +14,6 @@ async def test_count(client: EdinetClient) -> None:
     assert await client.get_count("2025-09-04") == 211
 
 
-async def test_count_zero(client: EdinetClient) -> None:
-    assert await client.get_count("1000-01-01") == 0
+async def test_count_error(client: EdinetClient) -> None:
+    with pytest.raises(ValueError, match="EDINET API"):
+        await client.get_count("1000-01-01")
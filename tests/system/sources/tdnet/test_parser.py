@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import re
 
+import polars as pl
 import pytest
 from bs4.element import Tag
+from polars.testing import assert_frame_equal
 
-from kabukit.sources.tdnet.parser import iter_page_numbers
+from kabukit.sources.tdnet.parser import iter_items, iter_page_numbers, parse_list
 from kabukit.sources.utils import get_soup
 
 pytestmark = pytest.mark.system
@@ -56,3 +58,10 @@ def test_table_format(page: str) -> None:  # noqa: C901
 
 def test_xbrl_content(xbrl_content: bytes) -> None:
     assert xbrl_content.startswith(b"PK\x03\x04\x14\x00\x08\x08\x08\x00")
+
+
+def test_parse_list(page: str) -> None:
+    df = parse_list(page)
+    items = [item.to_dict() for item in iter_items(page)]
+    expected = pl.DataFrame(items, infer_schema_length=None).drop("DisclosedDate")
+    assert_frame_equal(df, expected, check_dtypes=False)
@@ -42,6 +42,7 @@ def test_get_edinet(mock_get_edinet: AsyncMock, mock_cache_write: MagicMock) ->
         years=10,
         progress=None,
         max_items=None,
+        cache=False,
     )
     mock_cache_write.assert_not_called()
 
@@ -60,6 +61,7 @@ def test_get_edinet_date(
         years=10,
         progress=None,
         max_items=None,
+        cache=False,
     )
     mock_cache_write.assert_not_called()
 
@@ -78,6 +80,7 @@ def test_get_edinet_all(
         years=10,
         max_items=None,
         progress=CustomTqdm,
+        cache=True,
     )
     mock_cache_write.assert_called_once_with("edinet", "list", MOCK_DF)
 
@@ -107,4 +110,5 @@ def test_get_edinet_interrupt(mock_get_edinet: AsyncMock) -> None:
         years=10,
         max_items=None,
         progress=CustomTqdm,
+        cache=True,
     )
@@ -56,6 +56,7 @@ def test_get_jquants(
     mock_cli_statements.assert_awaited_once_with(
         arg,
         all_=a,
+        update=False,
         first=False,
         last=False,
         max_items=None,
@@ -64,8 +65,31 @@ def test_get_jquants(
     mock_cli_prices.assert_awaited_once_with(
         arg,
         all_=a,
+        update=False,
         first=False,
         last=False,
         max_items=None,
         quiet=q,
     )
+
+
+def test_get_jquants_update(
+    mock_cli_info: AsyncMock,
+    mock_cli_statements: AsyncMock,
+    mock_cli_prices: AsyncMock,
+) -> None:
+    result = runner.invoke(app, ["get", "jquants", "--update"])
+
+    assert result.exit_code == 0
+
+    mock_cli_info.assert_awaited_once()
+    for mock in [mock_cli_statements, mock_cli_prices]:
+        mock.assert_awaited_once_with(
+            None,
+            all_=False,
+            update=True,
+            first=False,
+            last=False,
+            max_items=None,
+            quiet=False,
+        )
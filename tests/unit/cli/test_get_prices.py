@@ -108,3 +108,61 @@ def test_get_prices_interrupt(mock_get_prices: AsyncMock) -> None:
         max_items=None,
         progress=CustomTqdm,
     )
+
+
+@pytest.fixture
+def mock_update_prices(mocker: MockerFixture) -> AsyncMock:
+    return mocker.patch(
+        "kabukit.sources.jquants.concurrent.update_prices",
+        new_callable=AsyncMock,
+    )
+
+
+def test_get_prices_update(
+    mock_update_prices: AsyncMock,
+    mock_get_prices: AsyncMock,
+    mock_cache_write: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    cached = MOCK_DF.head(1)
+    mocker.patch("kabukit.cli.utils.read", return_value=cached)
+    mock_update_prices.return_value = MOCK_DF
+
+    result = runner.invoke(app, ["get", "prices", "--update"])
+
+    assert result.exit_code == 0
+    assert f"全銘柄の株価情報を '{MOCK_PATH}' に保存しました。" in result.stdout
+
+    mock_update_prices.assert_awaited_once_with(cached, progress=CustomTqdm)
+    mock_get_prices.assert_not_awaited()
+    mock_cache_write.assert_called_once_with("jquants", "prices", MOCK_DF)
+
+
+def test_get_prices_update_without_cache(
+    mock_update_prices: AsyncMock,
+    mock_get_prices: AsyncMock,
+    mock_cache_write: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch("kabukit.cli.utils.read", side_effect=FileNotFoundError)
+    mock_get_prices.return_value = MOCK_DF
+
+    result = runner.invoke(app, ["get", "prices", "--update"])
+
+    assert result.exit_code == 0
+    mock_update_prices.assert_not_awaited()
+    mock_get_prices.assert_awaited_once_with(
+        None,
+        None,
+        max_items=None,
+        progress=CustomTqdm,
+    )
+    mock_cache_write.assert_called_once_with("jquants", "prices", MOCK_DF)
+
+
+def test_get_prices_update_with_arg(mock_update_prices: AsyncMock) -> None:
+    result = runner.invoke(app, ["get", "prices", MOCK_CODE, "--update"])
+
+    assert result.exit_code == 1
+    assert "--update は銘柄コード・日付と同時に指定できません。" in result.stderr
+    mock_update_prices.assert_not_awaited()
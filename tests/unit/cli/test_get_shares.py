@@ -39,7 +39,11 @@ def test_get_shares_all(
     assert result.exit_code == 0
     assert f"上場株式数を '{MOCK_PATH}' に保存しました。" in result.stdout
 
-    mock_get_shares.assert_awaited_once_with(progress=CustomTqdm, max_items=None)
+    mock_get_shares.assert_awaited_once_with(
+        progress=CustomTqdm,
+        max_items=None,
+        store=True,
+    )
     mock_cache_write.assert_called_once_with("jpx", "shares", MOCK_DF)
 
 
@@ -50,4 +54,8 @@ def test_get_shares_interrupt(mock_get_shares: AsyncMock) -> None:
 
     assert result.exit_code == 130
 
-    mock_get_shares.assert_awaited_once_with(progress=CustomTqdm, max_items=None)
+    mock_get_shares.assert_awaited_once_with(
+        progress=CustomTqdm,
+        max_items=None,
+        store=True,
+    )
@@ -108,3 +108,38 @@ def test_get_statements_interrupt(mock_get_statements: AsyncMock) -> None:
         max_items=None,
         progress=CustomTqdm,
     )
+
+
+@pytest.fixture
+def mock_update_statements(mocker: MockerFixture) -> AsyncMock:
+    return mocker.patch(
+        "kabukit.sources.jquants.concurrent.update_statements",
+        new_callable=AsyncMock,
+    )
+
+
+def test_get_statements_update(
+    mock_update_statements: AsyncMock,
+    mock_get_statements: AsyncMock,
+    mock_cache_write: MagicMock,
+    mocker: MockerFixture,
+) -> None:
+    cached = MOCK_DF.head(1)
+    mock_read = mocker.patch("kabukit.cli.utils.read", return_value=cached)
+    mock_update_statements.return_value = MOCK_DF
+
+    result = runner.invoke(app, ["get", "statements", "--update", "-q"])
+
+    assert result.exit_code == 0
+
+    mock_read.assert_called_once_with("jquants", "statements")
+    mock_update_statements.assert_awaited_once_with(cached, progress=None)
+    mock_get_statements.assert_not_awaited()
+    mock_cache_write.assert_called_once_with("jquants", "statements", MOCK_DF)
+
+
+def test_get_statements_update_with_arg(mock_update_statements: AsyncMock) -> None:
+    result = runner.invoke(app, ["get", "statements", MOCK_DATE, "--update"])
+
+    assert result.exit_code == 1
+    mock_update_statements.assert_not_awaited()
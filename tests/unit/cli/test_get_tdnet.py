@@ -37,7 +37,12 @@ def test_get_tdnet(mock_get_tdnet: AsyncMock, mock_cache_write: MagicMock) -> No
     assert result.exit_code == 0
     assert str(MOCK_DF) in result.stdout
 
-    mock_get_tdnet.assert_awaited_once_with(today(), progress=None, max_items=None)
+    mock_get_tdnet.assert_awaited_once_with(
+        today(),
+        progress=None,
+        max_items=None,
+        cache=False,
+    )
     mock_cache_write.assert_not_called()
 
 
@@ -54,6 +59,7 @@ def test_get_tdnet_date(
         MOCK_DATE_OBJ,
         progress=None,
         max_items=None,
+        cache=False,
     )
     mock_cache_write.assert_not_called()
 
@@ -64,7 +70,12 @@ def test_get_tdnet_all(mock_get_tdnet: AsyncMock, mock_cache_write: MagicMock) -
     assert result.exit_code == 0
     assert f"書類一覧を '{MOCK_PATH}' に保存しました。" in result.stdout
 
-    mock_get_tdnet.assert_awaited_once_with(None, progress=CustomTqdm, max_items=None)
+    mock_get_tdnet.assert_awaited_once_with(
+        None,
+        progress=CustomTqdm,
+        max_items=None,
+        cache=True,
+    )
     mock_cache_write.assert_called_once_with("tdnet", "list", MOCK_DF)
 
 
@@ -85,4 +96,9 @@ def test_get_tdnet_interrupt(mock_get_tdnet: AsyncMock) -> None:
 
     assert result.exit_code == 130
 
-    mock_get_tdnet.assert_awaited_once_with(None, progress=CustomTqdm, max_items=None)
+    mock_get_tdnet.assert_awaited_once_with(
+        None,
+        progress=CustomTqdm,
+        max_items=None,
+        cache=True,
+    )
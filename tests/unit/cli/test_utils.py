@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import polars as pl
 import pytest
@@ -11,8 +11,12 @@ from kabukit.cli.utils import (
     display_dataframe,
     display_value,
     get_code_date,
+    read_cache,
 )
 
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
 pytestmark = pytest.mark.unit
 
 
@@ -29,6 +33,30 @@ def test_get_code_date_invalid(capsys: pytest.CaptureFixture[str]) -> None:
     assert "無効な銘柄コード・日付の形式です。" in capsys.readouterr().err
 
 
+def test_read_cache(mocker: MockerFixture) -> None:
+    df = pl.DataFrame({"a": [1]})
+    mock_read = mocker.patch("kabukit.cli.utils.read", return_value=df)
+
+    assert read_cache("jquants", "prices") is df
+    mock_read.assert_called_once_with("jquants", "prices")
+
+
+def test_read_cache_empty(mocker: MockerFixture) -> None:
+    mocker.patch("kabukit.cli.utils.read", return_value=pl.DataFrame())
+
+    assert read_cache("jquants", "prices") is None
+
+
+def test_read_cache_not_found(
+    mocker: MockerFixture,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    mocker.patch("kabukit.cli.utils.read", side_effect=FileNotFoundError)
+
+    assert read_cache("jquants", "prices") is None
+    assert "キャッシュが見つからない" in capsys.readouterr().out
+
+
 @pytest.fixture(scope="module")
 def df() -> pl.DataFrame:
     return pl.DataFrame({"col1": [1, 2], "col2": ["abc", "def"]})
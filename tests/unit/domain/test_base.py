@@ -82,3 +82,44 @@ def test_init_from_cache_file_not_found(mocker: MockerFixture) -> None:
 def test_filter(data: pl.DataFrame) -> None:
     expected = pl.DataFrame({"A": [1], "B": ["x"]})
     assert_frame_equal(Derived(data).filter(pl.col("A") == 1).data, expected)
+
+
+def test_init_columns_and_constraints(data: pl.DataFrame) -> None:
+    derived = Derived(data, columns=["B"], A=2)
+    assert_frame_equal(derived.data, pl.DataFrame({"B": ["y"]}))
+
+
+def test_init_filters(data: pl.DataFrame) -> None:
+    derived = Derived(data, filters=pl.col("A") > 1)
+    assert_frame_equal(derived.data, data.filter(pl.col("A") > 1))
+
+
+def test_init_from_cache_scan(mocker: MockerFixture, data: pl.DataFrame) -> None:
+    mocker.patch.object(Derived, "__module__", "kabukit.domain.jquants.derived")
+    mock_cache_read = mocker.patch("kabukit.domain.base.read")
+    mock_cache_scan = mocker.patch(
+        "kabukit.domain.base.scan",
+        return_value=data.lazy(),
+    )
+
+    derived = Derived(name="file", columns=["A"], filters=[pl.col("B") == "x"])
+
+    assert_frame_equal(derived.data, pl.DataFrame({"A": [1]}))
+    mock_cache_scan.assert_called_once_with("jquants", "derived", "file")
+    mock_cache_read.assert_not_called()
+
+
+def test_init_from_cache_pushdown(
+    mocker: MockerFixture,
+    tmp_path: Path,
+    data: pl.DataFrame,
+) -> None:
+    mocker.patch.object(Derived, "__module__", "kabukit.domain.jquants.derived")
+    mocker.patch("kabukit.utils.cache.get_cache_dir", return_value=tmp_path)
+    Derived(data).write("file")
+    spy = mocker.spy(pl, "scan_parquet")
+
+    derived = Derived(columns=["B"], A=1)
+
+    assert_frame_equal(derived.data, pl.DataFrame({"B": ["x"]}))
+    spy.assert_called_once()
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+from httpx import Response
+
+from kabukit.sources.edinet.client import EdinetClient
+from kabukit.sources.response_cache import IMMUTABLE, SHORT_TTL
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+pytestmark = pytest.mark.unit
+
+
+def test_cache_ttl(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "kabukit.sources.response_cache.today",
+        return_value=datetime.date(2025, 10, 10),
+    )
+    client = EdinetClient("abc")
+    f = client.cache_ttl
+
+    assert f("/documents/S100TEST", {"type": 5}) == IMMUTABLE
+    assert f("/documents.json", {"date": "2025-10-09", "type": 2}) == IMMUTABLE
+    assert f("/documents.json", {"date": "2025-10-10", "type": 2}) == SHORT_TTL
+    assert f("/other", None) is None
+
+
+def test_cache_disabled_by_default() -> None:
+    assert EdinetClient("abc").cache is None
+
+
+@pytest.mark.parametrize(
+    ("url", "response", "expected"),
+    [
+        ("/documents/S100TEST", Response(200, content=b"zip"), True),
+        ("/documents/S100TEST", Response(200, json={"metadata": {}}), False),
+        ("/documents.json", Response(200, json={"metadata": {"status": "200"}}), True),
+        ("/documents.json", Response(200, json={"metadata": {"status": "404"}}), False),
+        ("/documents.json", Response(200, json={"message": "error"}), False),
+    ],
+)
+def test_is_cacheable(url: str, response: Response, *, expected: bool) -> None:
+    assert EdinetClient("abc").is_cacheable(url, response) is expected
@@ -38,6 +38,6 @@ async def test_get_count_fail(mock_get: AsyncMock, mocker: MockerFixture) -> Non
     response.raise_for_status = mocker.MagicMock()
 
     client = EdinetClient("test_key")
-    count = await client.get_count("2023-10-26")
 
-    assert count == 0
+    with pytest.raises(ValueError, match="status: 404"):
+        await client.get_count("2023-10-26")
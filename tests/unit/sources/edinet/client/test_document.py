@@ -1,24 +1,47 @@
 from __future__ import annotations
 
+import contextlib
+import functools
 import io
+import multiprocessing
 import zipfile
-from typing import TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
+import httpx
 import polars as pl
 import pytest
 from httpx import Response
 from polars.testing import assert_frame_equal
 
 from kabukit.sources.edinet.client import EdinetClient
+from kabukit.sources.edinet.store import DocumentStore
 
 if TYPE_CHECKING:
-    from unittest.mock import AsyncMock
+    from collections.abc import AsyncGenerator, Callable
+    from concurrent.futures import Executor
+    from pathlib import Path
+    from unittest.mock import AsyncMock, MagicMock
 
     from pytest_mock import MockerFixture
 
 pytestmark = pytest.mark.unit
 
 
+@pytest.fixture
+def mock_stream(mock_async_client: MagicMock, mocker: MockerFixture) -> MagicMock:
+    """`AsyncClient.stream`が`return_value`のレスポンスを返すようにする。"""
+
+    @contextlib.asynccontextmanager
+    async def stream(*args: Any, **kwargs: Any) -> AsyncGenerator[Response]:
+        del args, kwargs
+        yield mock.return_value
+
+    mock = mocker.MagicMock(side_effect=stream)
+    mock_async_client.stream = mock
+    return mock
+
+
 async def test_get_pdf(mock_get: AsyncMock, mocker: MockerFixture) -> None:
     mock_get.return_value = Response(
         200,
@@ -89,47 +112,55 @@ async def test_get_zip_invalid_doc_id(
     mock_get.assert_awaited_once_with("/documents/S100TEST", params={"type": 5})
 
 
-async def test_get_xbrl(mock_get: AsyncMock, mocker: MockerFixture) -> None:
+async def test_get_xbrl(mock_stream: MagicMock, mocker: MockerFixture) -> None:
     zip_buffer = io.BytesIO()
     data = "xbrl_コンテンツ".encode()
     with zipfile.ZipFile(zip_buffer, "w") as zf:
         zf.writestr("XBRL/PublicDoc/test.xbrl", data)
     zip_content = zip_buffer.getvalue()
 
-    mock_get.return_value = Response(
+    mock_stream.return_value = Response(
         200,
         content=zip_content,
         headers={"content-type": "application/octet-stream"},
     )
-    mock_get.return_value.raise_for_status = mocker.MagicMock()
+    mock_stream.return_value.raise_for_status = mocker.MagicMock()
 
     client = EdinetClient("test_key")
     xbrl = await client.get_xbrl("S100TEST")
 
     assert xbrl == "xbrl_コンテンツ"
-    mock_get.assert_awaited_once_with("/documents/S100TEST", params={"type": 1})
+    mock_stream.assert_called_once_with(
+        "GET",
+        "/documents/S100TEST",
+        params={"type": 1},
+    )
 
 
 async def test_get_xbrl_invalid_doc_id(
-    mock_get: AsyncMock,
+    mock_stream: MagicMock,
     mocker: MockerFixture,
 ) -> None:
-    mock_get.return_value = Response(
+    mock_stream.return_value = Response(
         200,
         content="not zip content",
         headers={"content-type": "text/plain"},
     )
-    mock_get.return_value.raise_for_status = mocker.MagicMock()
+    mock_stream.return_value.raise_for_status = mocker.MagicMock()
 
     client = EdinetClient("test_key")
     xbrl = await client.get_xbrl("S100TEST")
 
     assert xbrl is None
-    mock_get.assert_awaited_once_with("/documents/S100TEST", params={"type": 1})
+    mock_stream.assert_called_once_with(
+        "GET",
+        "/documents/S100TEST",
+        params={"type": 1},
+    )
 
 
 async def test_get_xbrl_no_xbrl_in_zip(
-    mock_get: AsyncMock,
+    mock_stream: MagicMock,
     mocker: MockerFixture,
 ) -> None:
     zip_buffer = io.BytesIO()
@@ -137,33 +168,37 @@ async def test_get_xbrl_no_xbrl_in_zip(
         zf.writestr("XBRL/PublicDoc/test.txt", "some text")
     zip_content = zip_buffer.getvalue()
 
-    mock_get.return_value = Response(
+    mock_stream.return_value = Response(
         200,
         content=zip_content,
         headers={"content-type": "application/octet-stream"},
     )
-    mock_get.return_value.raise_for_status = mocker.MagicMock()
+    mock_stream.return_value.raise_for_status = mocker.MagicMock()
 
     client = EdinetClient("test_key")
     xbrl = await client.get_xbrl("S100TEST")
 
     assert xbrl is None
-    mock_get.assert_awaited_once_with("/documents/S100TEST", params={"type": 1})
+    mock_stream.assert_called_once_with(
+        "GET",
+        "/documents/S100TEST",
+        params={"type": 1},
+    )
 
 
-async def test_get_csv(mock_get: AsyncMock, mocker: MockerFixture) -> None:
+async def test_get_csv(mock_stream: MagicMock, mocker: MockerFixture) -> None:
     csv_content = "header1\theader2\nvalue1\tvalue2"
     zip_buffer = io.BytesIO()
     with zipfile.ZipFile(zip_buffer, "w") as zf:
         zf.writestr("test.csv", csv_content.encode("utf-16-le"))
     zip_content = zip_buffer.getvalue()
 
-    mock_get.return_value = Response(
+    mock_stream.return_value = Response(
         200,
         content=zip_content,
         headers={"content-type": "application/octet-stream"},
     )
-    mock_get.return_value.raise_for_status = mocker.MagicMock()
+    mock_stream.return_value.raise_for_status = mocker.MagicMock()
 
     mock_transform_csv = mocker.patch("kabukit.sources.edinet.client.parse_csv")
     expected_df = pl.DataFrame({"header1": ["value1"], "header2": ["value2"]})
@@ -173,30 +208,38 @@ async def test_get_csv(mock_get: AsyncMock, mocker: MockerFixture) -> None:
     df = await client.get_csv("S100TEST")
 
     assert_frame_equal(df, expected_df)
-    mock_get.assert_awaited_once_with("/documents/S100TEST", params={"type": 5})
+    mock_stream.assert_called_once_with(
+        "GET",
+        "/documents/S100TEST",
+        params={"type": 5},
+    )
     mock_transform_csv.assert_called_once()
 
 
 async def test_get_csv_invalid_doc_id(
-    mock_get: AsyncMock,
+    mock_stream: MagicMock,
     mocker: MockerFixture,
 ) -> None:
-    mock_get.return_value = Response(
+    mock_stream.return_value = Response(
         200,
         content="not zip content",
         headers={"content-type": "text/plain"},
     )
-    mock_get.return_value.raise_for_status = mocker.MagicMock()
+    mock_stream.return_value.raise_for_status = mocker.MagicMock()
 
     client = EdinetClient("test_key")
     df = await client.get_csv("S100TEST")
 
     assert_frame_equal(df, pl.DataFrame())
-    mock_get.assert_awaited_once_with("/documents/S100TEST", params={"type": 5})
+    mock_stream.assert_called_once_with(
+        "GET",
+        "/documents/S100TEST",
+        params={"type": 5},
+    )
 
 
 async def test_get_csv_no_csv_in_zip(
-    mock_get: AsyncMock,
+    mock_stream: MagicMock,
     mocker: MockerFixture,
 ) -> None:
     zip_buffer = io.BytesIO()
@@ -204,12 +247,12 @@ async def test_get_csv_no_csv_in_zip(
         zf.writestr("test.txt", "some text")
     zip_content = zip_buffer.getvalue()
 
-    mock_get.return_value = Response(
+    mock_stream.return_value = Response(
         200,
         content=zip_content,
         headers={"content-type": "application/octet-stream"},
     )
-    mock_get.return_value.raise_for_status = mocker.MagicMock()
+    mock_stream.return_value.raise_for_status = mocker.MagicMock()
 
     client = EdinetClient("test_key")
     df = await client.get_csv("S100TEST")
@@ -248,3 +291,74 @@ async def test_get_document_calls_get_pdf_when_pdf_is_true(
     assert_frame_equal(df, expected_df)
     mock_get_pdf.assert_awaited_once_with(doc_id)
     mock_get_csv.assert_not_awaited()
+
+
+async def test_save_document(tmp_path: Path) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> Response:
+        requests.append(request)
+        headers = {"content-type": "application/pdf"}
+        return Response(200, content=b"%PDF", headers=headers)
+
+    store = DocumentStore(tmp_path)
+    client = EdinetClient("test_key", transport=httpx.MockTransport(handler))
+
+    first = await client.save_document("S100TEST", store)
+    second = await client.save_document("S100TEST", store)
+
+    assert_frame_equal(first, second)
+    assert first["Size"].item() == 4
+    assert len(requests) == 1
+    assert requests[0].url.params["type"] == "2"
+
+
+async def test_save_document_not_found(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> Response:
+        del request
+        return Response(200, json={"metadata": {"status": "404"}})
+
+    store = DocumentStore(tmp_path)
+    client = EdinetClient("test_key", transport=httpx.MockTransport(handler))
+
+    df = await client.save_document("S100TEST", store, doc_type=5)
+
+    assert df.is_empty()
+    assert not store.index
+
+
+@pytest.mark.parametrize(
+    "executor_factory",
+    [
+        functools.partial(ThreadPoolExecutor, 1),
+        functools.partial(
+            ProcessPoolExecutor,
+            1,
+            mp_context=multiprocessing.get_context("spawn"),
+        ),
+    ],
+    ids=["thread", "process"],
+)
+async def test_get_csv_executor(
+    mock_stream: MagicMock,
+    mocker: MockerFixture,
+    executor_factory: Callable[[], Executor],
+) -> None:
+    csv_content = "header1\theader2\nvalue1\tvalue2"
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w") as zf:
+        zf.writestr("test.csv", csv_content.encode("utf-16-le"))
+
+    mock_stream.return_value = Response(
+        200,
+        content=zip_buffer.getvalue(),
+        headers={"content-type": "application/octet-stream"},
+    )
+    mock_stream.return_value.raise_for_status = mocker.MagicMock()
+
+    with executor_factory() as executor:
+        client = EdinetClient("test_key", executor=executor)
+        df = await client.get_csv("S100TEST")
+
+    assert df["DocumentId"].to_list() == ["S100TEST"]
+    assert df["header2"].to_list() == ["value2"]
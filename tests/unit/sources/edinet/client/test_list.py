@@ -59,6 +59,18 @@ async def test_get_list_no_results(
     assert df.is_empty()
 
 
+async def test_get_list_error(mock_get: AsyncMock, mocker: MockerFixture) -> None:
+    json = {"metadata": {"status": "400", "message": "Bad Request"}}
+    response = Response(200, json=json)
+    mock_get.return_value = response
+    response.raise_for_status = mocker.MagicMock()
+
+    client = EdinetClient("test_key")
+
+    with pytest.raises(ValueError, match="status: 400"):
+        await client.get_list("2023-10-26")
+
+
 @pytest.mark.parametrize("transform", [True, False])
 async def test_get_list_empty_results(
     mock_get: AsyncMock,
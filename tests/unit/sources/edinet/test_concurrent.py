@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import datetime
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import polars as pl
@@ -8,10 +9,12 @@ import pytest
 from polars.testing import assert_frame_equal
 
 from kabukit.sources.edinet.client import EdinetClient
-from kabukit.sources.edinet.concurrent import get_documents, get_list
+from kabukit.sources.edinet.concurrent import backfill_list, get_documents, get_list
+from kabukit.sources.edinet.store import SCHEMA, DocumentStore
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from pathlib import Path
     from unittest.mock import AsyncMock, MagicMock
 
     from pytest_mock import MockerFixture
@@ -124,7 +127,10 @@ async def test_get_list_invalid_date(mock_concurrent_get: AsyncMock) -> None:
     assert result.is_empty()
 
 
-async def test_get_documents_csv(mock_concurrent_get: AsyncMock) -> None:
+async def test_get_documents_csv(
+    mock_concurrent_get: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
     mock_concurrent_get.return_value = pl.DataFrame({"DocumentId": [3]})
 
     result = await get_documents(
@@ -137,13 +143,16 @@ async def test_get_documents_csv(mock_concurrent_get: AsyncMock) -> None:
     assert_frame_equal(result, pl.DataFrame({"DocumentId": [3]}))
 
     mock_concurrent_get.assert_awaited_once_with(
-        EdinetClient,
+        mocker.ANY,
         EdinetClient.get_csv,
         ["doc1", "doc2", "doc3"],
         max_items=2,
         max_concurrency=5,
         progress=dummy_progress,
     )
+    factory = mock_concurrent_get.await_args.args[0]
+    assert factory.func is EdinetClient
+    assert isinstance(factory.keywords["executor"], ProcessPoolExecutor)
 
 
 async def test_get_documents_pdf(
@@ -162,3 +171,177 @@ async def test_get_documents_pdf(
         max_concurrency=mocker.ANY,
         progress=None,
     )
+
+
+@pytest.fixture
+def mock_backfill_client(mocker: MockerFixture) -> tuple[AsyncMock, AsyncMock]:
+    counts = {datetime.date(2025, 10, 10): 2, datetime.date(2025, 10, 11): 0}
+
+    async def get_count(_: EdinetClient, date: datetime.date) -> int:
+        return counts.get(date, 1)
+
+    async def get_list(_: EdinetClient, date: datetime.date) -> pl.DataFrame:
+        return pl.DataFrame({"Date": [date], "Code": [f"{date.day}000"]})
+
+    mock_count = mocker.patch.object(
+        EdinetClient,
+        "get_count",
+        autospec=True,
+        side_effect=get_count,
+    )
+    mock_list = mocker.patch.object(
+        EdinetClient,
+        "get_list",
+        autospec=True,
+        side_effect=get_list,
+    )
+    mocker.patch(
+        "kabukit.utils.partition.today",
+        return_value=datetime.date(2025, 10, 13),
+    )
+    return mock_count, mock_list
+
+
+async def test_backfill_list_skips_empty_days(
+    mock_backfill_client: tuple[AsyncMock, AsyncMock],
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    mocker.patch("kabukit.utils.partition.get_cache_dir", return_value=tmp_path)
+    mock_count, mock_list = mock_backfill_client
+    dates = ["2025-10-10", "2025-10-11"]
+
+    result = await backfill_list(dates)
+
+    assert result["Code"].to_list() == ["10000"]
+    assert mock_count.await_count == 2
+    mock_list.assert_awaited_once()
+    assert (tmp_path / "edinet" / "list" / "_manifest.json").exists()
+
+
+async def test_backfill_list_writes_days(
+    mock_backfill_client: tuple[AsyncMock, AsyncMock],
+    tmp_path: Path,
+) -> None:
+    del mock_backfill_client
+    await backfill_list(["2025-10-10", "2025-10-11"], path=tmp_path)
+
+    assert (tmp_path / "FileDate=2025-10-10" / "data.parquet").exists()
+    assert not (tmp_path / "FileDate=2025-10-11").exists()
+    assert (tmp_path / "_manifest.json").exists()
+
+
+async def test_backfill_list_resume(
+    mock_backfill_client: tuple[AsyncMock, AsyncMock],
+    tmp_path: Path,
+) -> None:
+    mock_count, mock_list = mock_backfill_client
+    dates = ["2025-10-10", "2025-10-11", "2025-10-12", "2025-10-13"]
+    await backfill_list(dates[:2], path=tmp_path)
+    mock_count.reset_mock()
+    mock_list.reset_mock()
+
+    result = await backfill_list(dates, path=tmp_path)
+
+    assert result["Code"].to_list() == ["10000", "12000", "13000"]
+    fetched = [c.args[1] for c in mock_count.await_args_list]
+    assert sorted(fetched) == [datetime.date(2025, 10, 12), datetime.date(2025, 10, 13)]
+
+
+async def test_backfill_list_refetches_today(
+    mock_backfill_client: tuple[AsyncMock, AsyncMock],
+    tmp_path: Path,
+) -> None:
+    mock_count, _ = mock_backfill_client
+    await backfill_list(["2025-10-13"], path=tmp_path)
+    await backfill_list(["2025-10-13"], path=tmp_path)
+
+    assert mock_count.await_count == 2
+
+
+async def test_backfill_list_error_not_saved(
+    mock_backfill_client: tuple[AsyncMock, AsyncMock],
+    tmp_path: Path,
+) -> None:
+    mock_count, _ = mock_backfill_client
+    mock_count.side_effect = ValueError("error")
+
+    with pytest.raises(ValueError, match="error"):
+        await backfill_list(["2025-10-10"], path=tmp_path)
+
+    mock_count.side_effect = None
+    mock_count.return_value = 0
+    await backfill_list(["2025-10-10"], path=tmp_path)
+
+    assert mock_count.await_count == 2
+
+
+async def test_get_list_cache(mocker: MockerFixture) -> None:
+    mock_df = pl.DataFrame({"Code": ["10000"], "Date": [datetime.date(2023, 1, 1)]})
+    mock_get_daily = mocker.patch(
+        "kabukit.sources.concurrent.get_daily",
+        new_callable=mocker.AsyncMock,
+        return_value=mock_df,
+    )
+
+    result = await get_list(["20230101", datetime.date(2023, 1, 2)], cache=True)
+
+    assert_frame_equal(result, mock_df)
+    args = mock_get_daily.await_args.args
+    assert args[2] == [datetime.date(2023, 1, 1), datetime.date(2023, 1, 2)]
+    assert (args[3].source, args[3].group, args[3].column) == (
+        "edinet",
+        "list",
+        "FileDate",
+    )
+
+
+async def test_get_list_cache_skips_empty_days(
+    mock_backfill_client: tuple[AsyncMock, AsyncMock],
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    mocker.patch("kabukit.utils.partition.get_cache_dir", return_value=tmp_path)
+    mock_count, mock_list = mock_backfill_client
+
+    result = await get_list(["2025-10-10", "2025-10-11"], cache=True)
+
+    assert result["Code"].to_list() == ["10000"]
+    assert mock_count.await_count == 2
+    mock_list.assert_awaited_once()
+
+
+async def test_get_documents_store(
+    mock_edinet_client: AsyncMock,
+    tmp_path: Path,
+) -> None:
+    ref = pl.DataFrame({"DocumentId": ["doc1"]})
+    mock_edinet_client.save_document.return_value = ref
+    store = DocumentStore(tmp_path)
+
+    result = await get_documents("doc1", pdf=True, store=store)
+
+    assert_frame_equal(result, ref)
+    mock_edinet_client.save_document.assert_awaited_once_with(
+        "doc1",
+        store,
+        doc_type=2,
+    )
+
+
+async def test_get_documents_store_empty(
+    mock_edinet_client: AsyncMock,
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    mock_edinet_client.save_document.return_value = pl.DataFrame()
+    mocker.patch(
+        "kabukit.sources.edinet.concurrent.DocumentStore",
+        return_value=DocumentStore(tmp_path),
+    )
+
+    result = await get_documents(["doc1"], store=True)
+
+    assert result.is_empty()
+    assert result.columns == list(SCHEMA)
+    assert mock_edinet_client.save_document.await_args.kwargs == {"doc_type": 5}
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+
+from kabukit.sources.edinet.store import SCHEMA, DocumentStore
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+pytestmark = pytest.mark.unit
+
+
+def test_put_and_get(tmp_path: Path) -> None:
+    store = DocumentStore(tmp_path)
+    file = io.BytesIO(b"%PDF-1.7")
+
+    ref = store.put("S100TEST", 2, file)
+
+    assert ref.schema == pl.Schema(SCHEMA)
+    row = ref.row(0, named=True)
+    assert row["Size"] == 8
+    assert row["Path"].endswith(f"{row['Sha256']}.pdf")
+    assert file.tell() == 0
+
+    assert Path(row["Path"]).read_bytes() == b"%PDF-1.7"
+
+    assert store.get("S100TEST", 2) is not None
+    assert store.get("S100TEST", 5) is None
+
+
+def test_put_deduplicates(tmp_path: Path) -> None:
+    store = DocumentStore(tmp_path)
+
+    a = store.put("A", 2, io.BytesIO(b"same"))
+    b = store.put("B", 2, io.BytesIO(b"same"))
+
+    assert a["Path"].item() == b["Path"].item()
+    assert len(list(tmp_path.joinpath("objects").glob("*/*"))) == 1
+
+
+def test_flush_and_load(tmp_path: Path) -> None:
+    store = DocumentStore(tmp_path)
+    store.put("A", 2, io.BytesIO(b"a"))
+    store.put("B", 5, io.BytesIO(b"b"))
+    store.flush()
+
+    index = pl.read_parquet(tmp_path / "index.parquet")
+    assert index["Path"].str.starts_with("objects/").all()
+
+    loaded = DocumentStore(tmp_path)
+    assert loaded.to_frame().equals(store.to_frame())
+    assert loaded.to_frame()["DocumentId"].to_list() == ["A", "B"]
+
+
+def test_get_missing_file(tmp_path: Path) -> None:
+    store = DocumentStore(tmp_path)
+    ref = store.put("A", 2, io.BytesIO(b"a"))
+
+    tmp_path.joinpath(ref["Path"].item()).unlink()
+
+    assert store.get("A", 2) is None
+
+
+def test_flush_without_index(tmp_path: Path) -> None:
+    DocumentStore(tmp_path).flush()
+    assert not (tmp_path / "index.parquet").exists()
+
+
+def test_default_path(tmp_path: Path, mocker: MockerFixture) -> None:
+    mocker.patch("kabukit.sources.edinet.store.get_cache_dir", return_value=tmp_path)
+    assert DocumentStore().path == tmp_path / "edinet" / "documents"
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
+import polars as pl
 import pytest
 from httpx import Response
+from polars.testing import assert_frame_equal
 
-from kabukit.sources.jpx.client import SHARES_URL, JpxClient
+from kabukit.sources.jpx.client import PAGES_PER_TASK, SHARES_URL, JpxClient
+from kabukit.sources.jpx.store import SharesStore
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from unittest.mock import AsyncMock
 
     from pytest_mock import MockerFixture
@@ -66,6 +71,42 @@ async def test_iter_shares_pdf_urls(mock_get: AsyncMock, mocker: MockerFixture)
     mock_get.assert_any_await("/a.html", params=None)
 
 
+async def test_iter_shares_pdf_urls_concurrent(
+    mock_get: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    history_html = """
+    <select class="backnumber">
+        <option value="/a.html">A</option>
+        <option value="/b.html">B</option>
+    </select>
+    """
+    running = 0
+    peak = 0
+
+    async def side_effect(url: str, **_kwargs: Any) -> Response:
+        nonlocal running, peak
+        if url == SHARES_URL:
+            res = Response(200, text=history_html)
+        else:
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            year = {"/a.html": 2023, "/b.html": 2024}[url]
+            res = Response(200, text=f'<a href="/HP-{year}.1.pdf">PDF</a>')
+        res.raise_for_status = mocker.MagicMock()
+        return res
+
+    mock_get.side_effect = side_effect
+
+    async with JpxClient() as client:
+        pdf_urls = [link async for link in client.iter_shares_pdf_urls()]
+
+    assert sorted(pdf_urls) == ["/HP-2023.1.pdf", "/HP-2024.1.pdf"]
+    assert peak == 2
+
+
 async def test_iter_shares_pdf_urls_with_html_url(
     mock_get: AsyncMock,
     mocker: MockerFixture,
@@ -84,24 +125,68 @@ async def test_iter_shares_pdf_urls_with_html_url(
 
 
 async def test_get_shares(mock_get: AsyncMock, mocker: MockerFixture) -> None:
-    """get_sharesがrun_in_executorを正しい引数で呼び出すことをテストする。"""
-    # Arrange
+    """get_sharesがPDFを取得してparse_sharesに渡すことをテストする。"""
     response = Response(200, content=b"pdf_content")
     mock_get.return_value = response
     response.raise_for_status = mocker.MagicMock()
-
-    mock_parse_shares = mocker.patch("kabukit.sources.jpx.client.parse_shares")
-    expected_df = mocker.MagicMock()
+    expected_df = pl.DataFrame({"Code": ["1234"]})
 
     async with JpxClient() as client:
-        # run_in_executor自体をモック化する
-        client.run_in_executor = mocker.AsyncMock(return_value=expected_df)
-
-        # Act
+        client.parse_shares = mocker.AsyncMock(return_value=expected_df)
         result = await client.get_shares("/a.pdf")
 
-    # Assert
     assert result is expected_df
     mock_get.assert_awaited_once_with("/a.pdf", params=None)
-    # run_in_executorが正しい引数で呼び出されたことを検証
-    client.run_in_executor.assert_awaited_once_with(mock_parse_shares, b"pdf_content")
+    client.parse_shares.assert_awaited_once_with(b"pdf_content")
+
+
+async def test_get_shares_store(
+    mock_get: AsyncMock,
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    response = Response(200, content=b"pdf_content")
+    mock_get.return_value = response
+    response.raise_for_status = mocker.MagicMock()
+    expected_df = pl.DataFrame({"Code": ["1234"]})
+    store = SharesStore(tmp_path)
+
+    async with JpxClient() as client:
+        client.parse_shares = mocker.AsyncMock(return_value=expected_df)
+        first = await client.get_shares("/a.pdf", store)
+        second = await client.get_shares("/a.pdf", store)
+
+    assert_frame_equal(first, expected_df)
+    assert_frame_equal(second, expected_df)
+    client.parse_shares.assert_awaited_once_with(b"pdf_content")
+
+
+async def test_parse_shares(mocker: MockerFixture) -> None:
+    header = "2023年10月分　会社別\n会社名 （コード） 月末現在上場株式数\n"
+    texts = ["cover", header, *(f"page{i}" for i in range(2, 10))]
+    mocker.patch("kabukit.sources.jpx.client.count_pages", return_value=len(texts))
+    extract = mocker.patch(
+        "kabukit.sources.jpx.client.extract_pages",
+        side_effect=lambda _, start, stop: texts[start:stop],
+    )
+    parse = mocker.patch("kabukit.sources.jpx.client.parse_shares_pages")
+
+    async with JpxClient() as client:
+        await client.parse_shares(b"pdf_content")
+
+    assert extract.call_args_list == [
+        mocker.call(b"pdf_content", 0, PAGES_PER_TASK),
+        mocker.call(b"pdf_content", PAGES_PER_TASK, 2 * PAGES_PER_TASK),
+    ]
+    pages = list(parse.call_args.args[0])
+    assert pages == texts[1:]
+
+
+def test_cache_ttl() -> None:
+    from kabukit.sources.response_cache import DAILY_TTL, IMMUTABLE
+
+    f = JpxClient().cache_ttl
+
+    assert f("/a/b.pdf", None) == IMMUTABLE
+    assert f(SHARES_URL, None) == DAILY_TTL
+    assert f("/a", None) is None
@@ -8,9 +8,11 @@ from polars.testing import assert_frame_equal
 
 from kabukit.sources.jpx.client import JpxClient
 from kabukit.sources.jpx.concurrent import get_shares
+from kabukit.sources.jpx.store import SharesStore
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
+    from pathlib import Path
     from unittest.mock import AsyncMock, MagicMock
 
     from pytest_mock import MockerFixture
@@ -63,13 +65,13 @@ async def test_get_shares(
         progress=dummy_progress,  # pyright: ignore[reportArgumentType]
     )
 
-    jpx_client_class_mock.mock_client_instance.iter_shares_pdf_urls.assert_called_once()
+    client = jpx_client_class_mock.mock_client_instance
+    client.iter_shares_pdf_urls.assert_called_once_with(max_concurrency=5)
 
-    expected_pdf_urls = ["url1.pdf", "url2.pdf"]
     mock_concurrent_get.assert_awaited_once_with(
         mocker.ANY,
         jpx_client_class_mock.get_shares,
-        expected_pdf_urls,
+        client.iter_shares_pdf_urls.return_value,
         max_items=10,
         max_concurrency=5,
         progress=dummy_progress,
@@ -89,3 +91,20 @@ async def test_get_shares_empty(
 
     assert result.is_empty()
     mock_concurrent_get.assert_awaited_once()
+
+
+async def test_get_shares_store(
+    jpx_client_class_mock: MagicMock,  # noqa: ARG001  # pyright: ignore[reportUnusedParameter]
+    mock_concurrent_get: AsyncMock,
+    mocker: MockerFixture,
+    tmp_path: Path,
+) -> None:
+    mock_concurrent_get.return_value = pl.DataFrame()
+    store = SharesStore(tmp_path)
+
+    await get_shares(store=store)
+
+    get = mock_concurrent_get.await_args.args[1]
+    client = mocker.MagicMock()
+    get(client, "url1.pdf")
+    client.get_shares.assert_called_once_with("url1.pdf", store)
@@ -9,6 +9,8 @@ from polars.testing import assert_frame_equal
 
 from kabukit.sources.jpx.parser import (
     Shares,
+    count_pages,
+    extract_pages,
     iter_shares,
     iter_shares_html_urls,
     iter_shares_pages,
@@ -117,6 +119,27 @@ def test_iter_shares_pages_no_match(mocker: MockerFixture) -> None:
     assert not pages_text
 
 
+def test_count_pages(mocker: MockerFixture) -> None:
+    mock_reader = mocker.MagicMock()
+    mock_reader.pages = [mocker.MagicMock()] * 3
+    mocker.patch("kabukit.sources.jpx.parser.PdfReader", return_value=mock_reader)
+
+    assert count_pages(b"dummy pdf content") == 3
+
+
+def test_extract_pages_range(mocker: MockerFixture) -> None:
+    mock_reader = mocker.MagicMock()
+    mock_pages = [mocker.MagicMock() for _ in range(4)]
+    for i, page in enumerate(mock_pages):
+        page.extract_text.return_value = f"page{i}"
+    mock_reader.pages = mock_pages
+    mocker.patch("kabukit.sources.jpx.parser.PdfReader", return_value=mock_reader)
+
+    assert extract_pages(b"dummy pdf content", 1, 3) == ["page1", "page2"]
+    assert extract_pages(b"dummy pdf content", 2) == ["page2", "page3"]
+    mock_pages[0].extract_text.assert_not_called()
+
+
 def test_iter_shares() -> None:
     page_text = """
 2023年10月分
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from kabukit.sources.jpx.store import SharesStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.unit
+
+URL = "https://www.jpx.co.jp/listing/co/HP-2025.9.pdf"
+
+
+def test_get_missing(tmp_path: Path) -> None:
+    assert SharesStore(tmp_path).get(URL, b"pdf") is None
+
+
+def test_put_get(tmp_path: Path) -> None:
+    store = SharesStore(tmp_path)
+    df = pl.DataFrame({"Code": ["1234"], "IssuedShares": [100]})
+
+    store.put(URL, b"pdf", df)
+
+    result = store.get(URL, b"pdf")
+    assert result is not None
+    assert_frame_equal(result, df)
+    assert [p.name[:10] for p in tmp_path.iterdir()] == ["HP-2025.9-"]
+
+
+def test_get_changed_content(tmp_path: Path) -> None:
+    store = SharesStore(tmp_path)
+    store.put(URL, b"pdf", pl.DataFrame({"Code": ["1234"]}))
+
+    assert store.get(URL, b"new pdf") is None
+
+
+def test_put_empty(tmp_path: Path) -> None:
+    store = SharesStore(tmp_path)
+    store.put(URL, b"pdf", pl.DataFrame())
+
+    result = store.get(URL, b"pdf")
+    assert result is not None
+    assert result.is_empty()
+
+
+def test_default_path() -> None:
+    store = SharesStore()
+    assert store.path.parts[-3:] == ("jpx", "shares", "pdf")
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import datetime
 from typing import TYPE_CHECKING
 
 import pytest
 from httpx import HTTPStatusError, Response
 
 from kabukit.sources.jquants.client import AuthKey, JQuantsClient
+from kabukit.sources.response_cache import DAILY_TTL, IMMUTABLE, SHORT_TTL
 
 if TYPE_CHECKING:
     from unittest.mock import AsyncMock
@@ -87,3 +89,18 @@ async def test_iter_pages(mock_get: AsyncMock, mocker: MockerFixture) -> None:
     dfs = [df async for df in client.iter_pages("/test", {}, "info")]
     assert dfs[0]["Code"].to_list() == ["1", "2"]
     assert dfs[1]["Code"].to_list() == ["3", "4"]
+
+
+def test_cache_ttl(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "kabukit.sources.response_cache.today",
+        return_value=datetime.date(2025, 10, 10),
+    )
+    client = JQuantsClient("abc")
+    f = client.cache_ttl
+
+    assert f("/fins/statements", {"date": "2025-10-09"}) == IMMUTABLE
+    assert f("/fins/statements", {"date": "2025-10-10"}) == SHORT_TTL
+    assert f("/fins/statements", {"code": "7203"}) is None
+    assert f("/markets/trading_calendar", None) == DAILY_TTL
+    assert f("/prices/daily_quotes", {"date": "2025-10-09"}) is None
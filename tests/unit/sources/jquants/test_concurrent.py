@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import datetime
 from typing import TYPE_CHECKING, Any
 
 import polars as pl
@@ -11,8 +12,12 @@ from kabukit.sources.jquants.concurrent import (
     get_calendar,
     get_info,
     get_prices,
+    get_prices_by_date,
     get_statements,
     get_target_codes,
+    get_trading_dates,
+    update_prices,
+    update_statements,
 )
 
 if TYPE_CHECKING:
@@ -44,6 +49,39 @@ async def test_get_calendar(mock_jquants_client: AsyncMock) -> None:
     mock_jquants_client.get_calendar.assert_awaited_once()
 
 
+async def test_get_trading_dates(
+    mock_jquants_client: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch(
+        "kabukit.sources.jquants.concurrent.today",
+        return_value=datetime.date(2025, 10, 14),
+    )
+    mock_jquants_client.get_calendar.return_value = pl.DataFrame({
+        "Date": [
+            datetime.date(2025, 10, 10),
+            datetime.date(2025, 10, 13),
+            datetime.date(2025, 10, 14),
+            datetime.date(2025, 10, 15),
+        ],
+        "IsHoliday": [False, True, False, False],
+    })
+
+    result = await get_trading_dates("2025-10-10", "2025-10-15")
+
+    assert result == [datetime.date(2025, 10, 10), datetime.date(2025, 10, 14)]
+    mock_jquants_client.get_calendar.assert_awaited_once_with(
+        from_="2025-10-10",
+        to="2025-10-15",
+    )
+
+
+async def test_get_trading_dates_empty(mock_jquants_client: AsyncMock) -> None:
+    mock_jquants_client.get_calendar.return_value = pl.DataFrame()
+
+    assert await get_trading_dates() == []
+
+
 async def test_get_info(mock_jquants_client: AsyncMock) -> None:
     await get_info()
 
@@ -238,3 +276,284 @@ async def test_get_prices(
         max_concurrency=mocker.ANY,
         progress=None,
     )
+
+
+@pytest.fixture
+def mock_get_trading_dates(mocker: MockerFixture) -> AsyncMock:
+    return mocker.patch(
+        "kabukit.sources.jquants.concurrent.get_trading_dates",
+        new_callable=mocker.AsyncMock,
+    )
+
+
+async def test_get_prices_by_date(
+    mock_get_trading_dates: AsyncMock,
+    mock_concurrent_get: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    dates = [datetime.date(2025, 10, 9), datetime.date(2025, 10, 10)]
+    mock_get_trading_dates.return_value = dates
+    mock_concurrent_get.return_value = pl.DataFrame(
+        {"Date": [2, 2, 1, 1], "Code": ["2", "1", "2", "1"]},
+    )
+
+    result = await get_prices_by_date(from_="2025-10-09", max_items=2)
+
+    assert_frame_equal(
+        result,
+        pl.DataFrame({"Date": [1, 2, 1, 2], "Code": ["1", "1", "2", "2"]}),
+    )
+
+    mock_get_trading_dates.assert_awaited_once_with("2025-10-09", None)
+    mock_concurrent_get.assert_awaited_once_with(
+        JQuantsClient,
+        mocker.ANY,
+        dates,
+        max_items=2,
+        max_concurrency=mocker.ANY,
+        progress=None,
+    )
+
+
+async def test_get_prices_by_date_with_codes(
+    mock_get_trading_dates: AsyncMock,
+    mock_concurrent_get: AsyncMock,
+) -> None:
+    mock_get_trading_dates.return_value = [datetime.date(2025, 10, 10)]
+    mock_concurrent_get.return_value = pl.DataFrame(
+        {"Date": [1, 1, 1], "Code": ["3", "2", "1"]},
+    )
+
+    result = await get_prices_by_date(["1", "3"])
+
+    assert result["Code"].to_list() == ["1", "3"]
+
+
+async def test_get_prices_by_date_empty(
+    mock_get_trading_dates: AsyncMock,
+    mock_concurrent_get: AsyncMock,
+) -> None:
+    mock_get_trading_dates.return_value = []
+    mock_concurrent_get.return_value = pl.DataFrame()
+
+    result = await get_prices_by_date()
+
+    assert result.is_empty()
+
+
+async def test_get_prices_by_date_function(mocker: MockerFixture) -> None:
+    from kabukit.sources.jquants.concurrent import _get_prices_by_date
+
+    client = mocker.AsyncMock()
+    date = datetime.date(2025, 10, 10)
+
+    await _get_prices_by_date(client, date)
+
+    client.get_prices.assert_awaited_once_with(date=date)
+
+
+async def test_get_prices_with_by_date(mocker: MockerFixture) -> None:
+    mock = mocker.patch(
+        "kabukit.sources.jquants.concurrent.get_prices_by_date",
+        new_callable=mocker.AsyncMock,
+    )
+
+    await get_prices("7203", by_date=True, from_="2025-01-01", to="2025-01-31")
+
+    mock.assert_awaited_once_with(
+        ["7203"],
+        from_="2025-01-01",
+        to="2025-01-31",
+        max_items=None,
+        max_concurrency=8,
+        progress=None,
+    )
+
+
+async def test_get_prices_by_date_flag_with_date(mocker: MockerFixture) -> None:
+    mock = mocker.patch(
+        "kabukit.sources.jquants.concurrent.get_prices_by_date",
+        new_callable=mocker.AsyncMock,
+    )
+
+    await get_prices(by_date=True, date="2025-01-10")
+
+    mock.assert_awaited_once_with(
+        None,
+        from_="2025-01-10",
+        to="2025-01-10",
+        max_items=None,
+        max_concurrency=8,
+        progress=None,
+    )
+
+
+async def test_get_prices_by_date_flag_date_and_range() -> None:
+    with pytest.raises(ValueError, match="同時に指定"):
+        await get_prices(by_date=True, date="2025-01-10", from_="2025-01-01")
+
+
+@pytest.fixture
+def mock_get_prices_by_date(mocker: MockerFixture) -> AsyncMock:
+    return mocker.patch(
+        "kabukit.sources.jquants.concurrent.get_prices_by_date",
+        new_callable=mocker.AsyncMock,
+    )
+
+
+def prices(dates: list[int], codes: list[str], factors: list[float]) -> pl.DataFrame:
+    return pl.DataFrame({
+        "Date": [datetime.date(2025, 10, d) for d in dates],
+        "Code": codes,
+        "Close": [float(d) for d in dates],
+        "AdjustmentFactor": [float(f) for f in factors],
+    })
+
+
+async def test_update_prices(
+    mock_get_prices_by_date: AsyncMock,
+    mock_concurrent_get: AsyncMock,
+) -> None:
+    data = prices([9, 9, 10, 10], ["1", "2", "1", "2"], [1, 1, 1, 1])
+    mock_get_prices_by_date.return_value = prices([14], ["1"], [1])
+
+    result = await update_prices(data)
+
+    assert result["Date"].to_list() == [
+        datetime.date(2025, 10, 9),
+        datetime.date(2025, 10, 10),
+        datetime.date(2025, 10, 14),
+        datetime.date(2025, 10, 9),
+        datetime.date(2025, 10, 10),
+    ]
+    assert result["Code"].to_list() == ["1", "1", "1", "2", "2"]
+
+    mock_get_prices_by_date.assert_awaited_once_with(
+        from_=datetime.date(2025, 10, 11),
+        max_concurrency=8,
+        progress=None,
+    )
+    mock_concurrent_get.assert_not_awaited()
+
+
+async def test_update_prices_adjustment(
+    mock_get_prices_by_date: AsyncMock,
+    mock_concurrent_get: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    data = prices([9, 9, 10, 10], ["1", "2", "1", "2"], [1, 1, 1, 1])
+    mock_get_prices_by_date.return_value = prices([14, 14], ["1", "2"], [1, 0.5])
+    mock_concurrent_get.return_value = prices([10, 14], ["2", "2"], [1, 0.5])
+
+    result = await update_prices(data)
+
+    assert result["Code"].to_list() == ["1", "1", "1", "2", "2"]
+    assert result["Date"].to_list()[3:] == [
+        datetime.date(2025, 10, 10),
+        datetime.date(2025, 10, 14),
+    ]
+
+    mock_concurrent_get.assert_awaited_once_with(
+        JQuantsClient,
+        JQuantsClient.get_prices,
+        ["2"],
+        max_concurrency=8,
+        progress=mocker.ANY,
+    )
+
+
+async def test_update_prices_up_to_date(
+    mock_get_prices_by_date: AsyncMock,
+) -> None:
+    data = prices([10], ["1"], [1])
+    mock_get_prices_by_date.return_value = pl.DataFrame()
+
+    result = await update_prices(data)
+
+    assert result is data
+
+
+async def test_update_prices_empty(mock_get_prices_by_date: AsyncMock) -> None:
+    data = pl.DataFrame()
+
+    result = await update_prices(data)
+
+    assert result is data
+    mock_get_prices_by_date.assert_not_awaited()
+
+
+def statements(
+    dates: list[int],
+    codes: list[str],
+    numbers: list[str],
+) -> pl.DataFrame:
+    return pl.DataFrame({
+        "Date": [datetime.date(2025, 10, d) for d in dates],
+        "Code": codes,
+        "DisclosedDate": [datetime.date(2025, 10, d) for d in dates],
+        "DisclosureNumber": numbers,
+        "Profit": [float(d) for d in dates],
+    })
+
+
+async def test_update_statements(
+    mock_concurrent_get: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    mocker.patch(
+        "kabukit.sources.jquants.concurrent.today",
+        return_value=datetime.date(2025, 10, 12),
+    )
+    data = statements([9, 10], ["1", "2"], ["a", "b"])
+    new = statements([10, 11], ["2", "1"], ["b", "c"])
+    new = new.with_columns(pl.col("Profit") * 10)
+    mock_concurrent_get.return_value = new
+
+    result = await update_statements(data)
+
+    assert result["Code"].to_list() == ["1", "1", "2"]
+    assert result["DisclosureNumber"].to_list() == ["a", "c", "b"]
+    assert result["Profit"].to_list() == [9, 110, 100]
+
+    mock_concurrent_get.assert_awaited_once_with(
+        JQuantsClient,
+        mocker.ANY,
+        [
+            datetime.date(2025, 10, 10),
+            datetime.date(2025, 10, 11),
+            datetime.date(2025, 10, 12),
+        ],
+        max_concurrency=12,
+        progress=None,
+    )
+
+
+async def test_update_statements_no_new_data(
+    mock_concurrent_get: AsyncMock,
+) -> None:
+    data = statements([9], ["1"], ["a"])
+    mock_concurrent_get.return_value = pl.DataFrame()
+
+    result = await update_statements(data)
+
+    assert result is data
+
+
+async def test_update_statements_empty(mock_concurrent_get: AsyncMock) -> None:
+    data = pl.DataFrame()
+
+    result = await update_statements(data)
+
+    assert result is data
+    mock_concurrent_get.assert_not_awaited()
+
+
+async def test_get_statements_by_date_function(mocker: MockerFixture) -> None:
+    from kabukit.sources.jquants.concurrent import _get_statements_by_date
+
+    client = mocker.AsyncMock()
+    date = datetime.date(2025, 10, 10)
+
+    await _get_statements_by_date(client, date)
+
+    client.get_statements.assert_awaited_once_with(date=date)
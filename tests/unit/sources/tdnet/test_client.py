@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
 from typing import TYPE_CHECKING
 
@@ -63,6 +64,56 @@ async def test_iter_pages(mocker: MockerFixture) -> None:
     assert mock_get_page.call_count == 2
 
 
+async def test_iter_pages_concurrent(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "kabukit.sources.tdnet.client.iter_page_numbers",
+        return_value=iter([1, 2, 3, 4, 2]),
+    )
+    running = 0
+    max_running = 0
+
+    async def get_page(self: TdnetClient, date: str, index: int) -> str:  # noqa: ARG001
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01 * (5 - index))  # later pages finish first
+        running -= 1
+        return f"html{index}"
+
+    mocker.patch.object(TdnetClient, "get_page", new=get_page)
+
+    client = TdnetClient()
+    pages = [p async for p in client.iter_pages("20230101")]
+
+    assert pages == ["html1", "html2", "html3", "html4"]
+    assert max_running == 3
+
+
+async def test_iter_pages_cancel(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "kabukit.sources.tdnet.client.iter_page_numbers",
+        return_value=iter([1, 2, 3]),
+    )
+    cancelled: list[int] = []
+
+    async def get_page(self: TdnetClient, date: str, index: int) -> str:  # noqa: ARG001
+        try:
+            await asyncio.sleep(0 if index < 3 else 10)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return f"html{index}"
+
+    mocker.patch.object(TdnetClient, "get_page", new=get_page)
+
+    client = TdnetClient()
+    ait = client.iter_pages("20230101")
+    assert [await anext(ait), await anext(ait)] == ["html1", "html2"]
+    await ait.aclose()
+
+    assert cancelled == [3]
+
+
 async def test_iter_pages_http_error(mocker: MockerFixture) -> None:
     mocker.patch.object(
         TdnetClient,
@@ -78,6 +129,9 @@ async def test_iter_pages_http_error(mocker: MockerFixture) -> None:
     pages = [p async for p in client.iter_pages("20230101")]
     assert pages == []
 
+    with pytest.raises(HTTPStatusError):
+        await client.get_list("20230101", strict=True)
+
 
 async def test_iter_items(mocker: MockerFixture) -> None:
     async def mock_iter_pages(
@@ -104,49 +158,70 @@ async def test_iter_items(mocker: MockerFixture) -> None:
     assert all(item.disclosed_date == datetime.date(2023, 1, 1) for item in items)
 
 
+async def mock_iter_pages(
+    self: TdnetClient,
+    date: str | datetime.date,
+    *,
+    strict: bool = False,
+) -> AsyncGenerator[str, None]:
+    del strict
+    assert isinstance(self, TdnetClient)
+    assert isinstance(date, datetime.date)
+    yield "html1"
+    yield "html2"
+
+
 async def test_get_list(mocker: MockerFixture) -> None:
-    async def mock_iter_items(
-        self: TdnetClient,
-        date: str | datetime.date,
-    ) -> AsyncGenerator[Item, None]:
-        assert isinstance(self, TdnetClient)
-        assert isinstance(date, str)
-        yield Item("1", None, datetime.time(12, 0), "A", "t1", None, None, None)
-        yield Item("2", None, datetime.time(12, 0), "A", "t1", None, None, None)
-
-    mocker.patch.object(TdnetClient, "iter_items", new=mock_iter_items)
-    mock_transform_list = mocker.patch(
-        "kabukit.sources.tdnet.client.transform_list",
-        return_value=pl.DataFrame({"a": [3]}),
+    mocker.patch.object(TdnetClient, "iter_pages", new=mock_iter_pages)
+    mock_parse_list = mocker.patch(
+        "kabukit.sources.tdnet.client.parse_list",
+        side_effect=[
+            pl.DataFrame({"Code": ["13010"], "Title": ["a"]}),
+            pl.DataFrame({"Code": ["13020"], "Title": ["b"]}),
+        ],
     )
     mock_with_date = mocker.patch(
         "kabukit.sources.tdnet.client.with_date",
-        return_value=pl.DataFrame({"a": [4]}),
+        side_effect=lambda df: df,  # pyright: ignore[reportUnknownLambdaType]
     )
 
     client = TdnetClient()
     result = await client.get_list("20230101")
 
-    mock_transform_list.assert_called_once()
+    assert mock_parse_list.call_count == 2
     mock_with_date.assert_called_once()
 
-    expected = pl.DataFrame({"a": [4]})
+    expected = pl.DataFrame({
+        "Code": ["1301", "1302"],
+        "DisclosedDate": [datetime.date(2023, 1, 1)] * 2,
+        "Title": ["a", "b"],
+    })
     assert_frame_equal(result, expected)
 
 
 async def test_get_list_empty(mocker: MockerFixture) -> None:
-    async def mock_iter_items(
-        self: TdnetClient,
-        date: str | datetime.date,
-    ) -> AsyncGenerator[Item, None]:
-        assert isinstance(self, TdnetClient)
-        assert isinstance(date, str)
-        for x in []:  # pyright: ignore[reportUnknownVariableType]
-            yield x
-
-    mocker.patch.object(TdnetClient, "iter_items", new=mock_iter_items)
+    mocker.patch.object(TdnetClient, "iter_pages", new=mock_iter_pages)
+    mocker.patch(
+        "kabukit.sources.tdnet.client.parse_list",
+        return_value=pl.DataFrame(),
+    )
 
     client = TdnetClient()
     result = await client.get_list("20230101")
 
     assert_frame_equal(result, pl.DataFrame())
+
+
+def test_cache_ttl(mocker: MockerFixture) -> None:
+    from kabukit.sources.response_cache import IMMUTABLE, SHORT_TTL
+
+    mocker.patch(
+        "kabukit.sources.response_cache.today",
+        return_value=datetime.date(2025, 10, 10),
+    )
+    f = TdnetClient().cache_ttl
+
+    assert f("I_list_001_20251009.html", None) == IMMUTABLE
+    assert f("I_list_002_20251010.html", None) == SHORT_TTL
+    assert f("I_main_00.html", None) == SHORT_TTL
+    assert f("other.html", None) is None
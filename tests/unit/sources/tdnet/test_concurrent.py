@@ -88,3 +88,22 @@ async def test_get_list_returns_empty_dataframe(mock_concurrent_get: AsyncMock)
 
     assert result.is_empty()
     assert_frame_equal(result, pl.DataFrame())
+
+
+async def test_get_list_cache(mocker: MockerFixture) -> None:
+    mock_df = pl.DataFrame({"Code": [1], "Date": [datetime.date(2023, 1, 1)]})
+    mock_get_daily = mocker.patch(
+        "kabukit.sources.concurrent.get_daily",
+        new_callable=mocker.AsyncMock,
+        return_value=mock_df,
+    )
+
+    result = await get_list("2023-01-01", cache=True)
+
+    assert_frame_equal(result, mock_df)
+    args = mock_get_daily.await_args.args
+    assert args[0] is TdnetClient
+    assert args[1].func is TdnetClient.get_list
+    assert args[1].keywords == {"strict": True}
+    assert args[2] == [datetime.date(2023, 1, 1)]
+    assert args[3].column == "DisclosedDate"
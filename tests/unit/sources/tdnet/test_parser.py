@@ -13,6 +13,7 @@ from kabukit.sources.tdnet.parser import (
     iter_items,
     iter_page_numbers,
     parse_item,
+    parse_list,
 )
 from kabukit.sources.utils import get_soup
 
@@ -157,3 +158,38 @@ def test_get_url_without_link() -> None:
     td = soup.find("td")
     assert td is not None
     assert get_url(td) is None
+
+
+def test_parse_list() -> None:
+    df = parse_list(FAKE_HTML_WITH_TABLE)
+    items = iter_items(FAKE_HTML_WITH_TABLE)
+    expected = pl.DataFrame([item.to_dict() for item in items]).drop("DisclosedDate")
+    assert_frame_equal(df, expected.cast({"UpdateStatus": pl.String}))
+
+
+def test_parse_list_nested_text() -> None:
+    html = """
+    <table id="main-list-table"><tr>
+        <td> 15:30 </td><td>13010</td><td> 極洋 <span> 株式会社 </span></td>
+        <td><a href="a.pdf"> 決算 <b>短信</b> </a></td><td></td><td>東証</td>
+        <td><!-- comment --></td>
+    </tr></table>
+    """
+    df = parse_list(html)
+    items = iter_items(html)
+    expected = pl.DataFrame([item.to_dict() for item in items]).drop("DisclosedDate")
+    assert_frame_equal(df, expected, check_dtypes=False)
+    assert df.row(0) == (
+        "13010",
+        datetime.time(15, 30),
+        "極洋株式会社",
+        "決算短信",
+        "a.pdf",
+        None,
+        None,
+    )
+
+
+@pytest.mark.parametrize("html", [FAKE_HTML_WITHOUT_TABLE, "", FAKE_HTML_WITH_PAGER])
+def test_parse_list_empty(html: str) -> None:
+    assert_frame_equal(parse_list(html), pl.DataFrame())
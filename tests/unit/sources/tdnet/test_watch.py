@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from httpx import HTTPStatusError, Request, Response
+
+from kabukit.sources.tdnet.client import TdnetClient
+from kabukit.sources.tdnet.watch import TdnetWatcher, get_page_url
+
+if TYPE_CHECKING:
+    from unittest.mock import AsyncMock
+
+    from pytest_mock import MockerFixture
+
+pytestmark = pytest.mark.unit
+
+
+def make_page(codes: list[str], pages: int = 1) -> str:
+    rows = "".join(
+        f"<tr><td>10:{code[2:4]}</td><td>{code}</td><td>A</td>"
+        f'<td><a href="{code}.pdf">T</a></td><td></td><td>東</td><td></td></tr>'
+        for code in codes
+    )
+    links = "".join(
+        f"<a onclick=\"pagerLink('I_list_{i:03}_20251010.html')\">{i}</a>"
+        for i in range(1, pages + 1)
+    )
+    return (
+        f'<div id="pager-box-top">{links}</div>'
+        f'<table id="main-list-table">{rows}</table>'
+    )
+
+
+def ok(text: str, headers: dict[str, str] | None = None) -> Response:
+    return Response(200, text=text, headers=headers)
+
+
+@pytest.fixture
+def mock_request(mocker: MockerFixture) -> AsyncMock:
+    mocker.patch(
+        "kabukit.sources.tdnet.watch.today",
+        return_value=datetime.date(2025, 10, 10),
+    )
+    mocker.patch(
+        "kabukit.sources.tdnet.watch.with_date",
+        side_effect=lambda df: df,  # pyright: ignore[reportUnknownLambdaType]
+    )
+    return mocker.patch.object(TdnetClient, "request")
+
+
+def test_get_page_url() -> None:
+    url = get_page_url(datetime.date(2025, 10, 10), 2)
+    assert url == "I_list_002_20251010.html"
+
+
+async def test_poll_initial(mock_request: AsyncMock) -> None:
+    mock_request.return_value = ok(make_page(["13020", "13010"]))
+    watcher = TdnetWatcher(TdnetClient(), initial=True)
+
+    df = await watcher.poll()
+
+    assert df["Code"].to_list() == ["1301", "1302"]
+    assert df["DisclosedDate"].unique().to_list() == [datetime.date(2025, 10, 10)]
+
+
+async def test_poll_skips_existing(mock_request: AsyncMock) -> None:
+    mock_request.side_effect = [
+        ok(make_page(["13020", "13010"])),
+        ok(make_page(["13040", "13030", "13020", "13010"])),
+        ok(make_page(["13040", "13030", "13020", "13010"])),
+    ]
+    watcher = TdnetWatcher(TdnetClient())
+
+    assert (await watcher.poll()).is_empty()
+    df = await watcher.poll()
+    assert df["Code"].to_list() == ["1303", "1304"]
+    assert (await watcher.poll()).is_empty()
+
+
+async def test_poll_fetches_next_page_only_when_all_new(
+    mock_request: AsyncMock,
+) -> None:
+    mock_request.side_effect = [
+        ok(make_page(["13010"], pages=1)),
+        ok(make_page(["13040", "13030"], pages=3)),
+        ok(make_page(["13020", "13010"], pages=3)),
+    ]
+    watcher = TdnetWatcher(TdnetClient())
+
+    await watcher.poll()
+    df = await watcher.poll()
+
+    assert df["Code"].to_list() == ["1302", "1303", "1304"]
+    assert mock_request.await_count == 3
+    mock_request.assert_awaited_with("I_list_002_20251010.html")
+
+
+async def test_poll_not_modified(mock_request: AsyncMock) -> None:
+    mock_request.side_effect = [
+        ok(make_page(["13010"]), {"ETag": '"a"', "Last-Modified": "Fri"}),
+        Response(304),
+    ]
+    watcher = TdnetWatcher(TdnetClient())
+
+    await watcher.poll()
+    assert (await watcher.poll()).is_empty()
+
+    mock_request.assert_awaited_with(
+        "I_list_001_20251010.html",
+        headers={"If-None-Match": '"a"', "If-Modified-Since": "Fri"},
+    )
+
+
+async def test_poll_http_error(mock_request: AsyncMock) -> None:
+    response = Response(404, request=Request("GET", "/"))
+    mock_request.side_effect = HTTPStatusError(
+        "",
+        request=response.request,
+        response=response,
+    )
+    watcher = TdnetWatcher(TdnetClient(), initial=True)
+
+    assert (await watcher.poll()).is_empty()
+
+
+async def test_poll_new_day(mocker: MockerFixture, mock_request: AsyncMock) -> None:
+    mock_today = mocker.patch("kabukit.sources.tdnet.watch.today")
+    mock_today.return_value = datetime.date(2025, 10, 10)
+    mock_request.return_value = ok(make_page(["13010"]))
+    watcher = TdnetWatcher(TdnetClient())
+    await watcher.poll()
+
+    mock_today.return_value = datetime.date(2025, 10, 11)
+    df = await watcher.poll()
+
+    assert df["Code"].to_list() == ["1301"]
+    assert df["DisclosedDate"].to_list() == [datetime.date(2025, 10, 11)]
+
+
+async def test_aiter(mocker: MockerFixture, mock_request: AsyncMock) -> None:
+    mocker.patch("kabukit.sources.tdnet.watch.asyncio.sleep")
+    mock_request.side_effect = [
+        ok(make_page(["13010"])),
+        ok(make_page(["13010"])),
+        ok(make_page(["13020", "13010"])),
+    ]
+    watcher = TdnetWatcher(TdnetClient(), interval=0)
+
+    ait = aiter(watcher)
+    df = await anext(ait)
+    await ait.aclose()
+
+    assert isinstance(df, pl.DataFrame)
+    assert df["Code"].to_list() == ["1302"]
+    assert mock_request.await_count == 3
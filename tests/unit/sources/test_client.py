@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import io
 from typing import TYPE_CHECKING, Any, ClassVar
 
+import httpx
 import pytest
 from httpx import ConnectTimeout, HTTPStatusError, Response
 
@@ -98,6 +100,130 @@ async def test_get_fails_after_retries(
     assert mock_sleep.call_count == 2
 
 
+def throttled_response(
+    mocker: MockerFixture,
+    status_code: int,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    response = Response(status_code, headers=headers)
+    response.raise_for_status = mocker.MagicMock(
+        side_effect=HTTPStatusError(
+            "Throttled",
+            request=mocker.MagicMock(),
+            response=response,
+        ),
+    )
+    return response
+
+
+@pytest.mark.parametrize("status_code", [429, 502, 503, 504])
+async def test_get_retries_on_throttling(
+    mock_get: AsyncMock,
+    mocker: MockerFixture,
+    status_code: int,
+) -> None:
+    mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+    error_response = throttled_response(mocker, status_code)
+    success_response = Response(200)
+    success_response.raise_for_status = mocker.MagicMock()
+    mock_get.side_effect = [error_response, success_response]
+
+    client = MockClient()
+    concurrency = client.limiter.concurrency
+    response = await client.get("test/path")
+
+    assert response == success_response
+    assert mock_get.call_count == 2
+    assert client.limiter.concurrency < concurrency
+
+
+async def test_get_honors_retry_after(
+    mock_get: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    mock_sleep = mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+    mocker.patch("kabukit.sources.limiter.time.monotonic", return_value=100.0)
+    error_response = throttled_response(mocker, 429, {"Retry-After": "7"})
+    success_response = Response(200)
+    success_response.raise_for_status = mocker.MagicMock()
+    mock_get.side_effect = [error_response, success_response]
+
+    client = MockClient()
+    await client.get("test/path")
+
+    # tenacity waits for Retry-After, then the limiter blocks until the same time.
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [7.0, 7.0]
+
+
+async def test_get_does_not_retry_client_error(
+    mock_get: AsyncMock,
+    mocker: MockerFixture,
+) -> None:
+    mock_get.return_value = throttled_response(mocker, 404)
+
+    client = MockClient()
+
+    with pytest.raises(HTTPStatusError):
+        await client.get("test/path")
+
+    assert mock_get.call_count == 1
+
+
+def download_client(*responses: Response) -> tuple[MockClient, list[str]]:
+    urls: list[str] = []
+    it = iter(responses)
+
+    def handler(request: httpx.Request) -> Response:
+        urls.append(str(request.url))
+        return next(it)
+
+    return MockClient(transport=httpx.MockTransport(handler)), urls
+
+
+async def test_download() -> None:
+    client, urls = download_client(Response(200, content=b"x" * 200_000))
+    file = io.BytesIO(b"stale content")
+
+    response = await client.download("file", file, {"type": 1})
+
+    assert response.status_code == 200
+    assert file.tell() == 0
+    assert file.read() == b"x" * 200_000
+    assert urls == ["http://mock.api/file?type=1"]
+
+
+async def test_download_retries_on_throttling(mocker: MockerFixture) -> None:
+    mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+    client, urls = download_client(
+        Response(503, content=b"error"),
+        Response(200, content=b"ok"),
+    )
+    file = io.BytesIO()
+
+    await client.download("file", file)
+
+    assert file.read() == b"ok"
+    assert len(urls) == 2
+
+
+async def test_download_does_not_retry_client_error() -> None:
+    client, urls = download_client(Response(404))
+
+    with pytest.raises(HTTPStatusError):
+        await client.download("file", io.BytesIO())
+
+    assert len(urls) == 1
+
+
+def test_rate_limit() -> None:
+    class RateLimitedClient(MockClient):
+        rate_limit: ClassVar[float | None] = 5
+
+    assert MockClient().limiter.rate is None
+    assert RateLimitedClient().limiter.rate == 5
+    assert RateLimitedClient(rate_limit=2).limiter.rate == 2
+
+
 async def test_run_in_executor_without_executor(mocker: MockerFixture) -> None:
     mock_loop = mocker.MagicMock()
     mock_loop.run_in_executor = mocker.AsyncMock()
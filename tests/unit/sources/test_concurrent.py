@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING, ClassVar
+import datetime
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import polars as pl
 import pytest
 
 from kabukit.sources.client import Client
-from kabukit.sources.concurrent import collect, get
+from kabukit.sources.concurrent import collect, get, get_daily, pipeline, sink
+from kabukit.sources.transport import SharedTransport
+from kabukit.utils.partition import DailyPartitions
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterable, AsyncIterator
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
 
 pytestmark = pytest.mark.unit
 
@@ -37,6 +43,160 @@ async def test_collect() -> None:
     assert sorted(result) == [0.01, 0.02, 0.03]
 
 
+async def test_collect_max_concurrency() -> None:
+    running = 0
+    peak = 0
+
+    async def func(x: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (x % 3))
+        running -= 1
+        return x
+
+    result = [x async for x in collect(func, range(20), max_concurrency=4)]
+    assert sorted(result) == list(range(20))
+    assert peak == 4
+
+
+async def test_collect_lazy_args() -> None:
+    consumed: list[int] = []
+
+    def args():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    async def func(x: int) -> int:
+        return x
+
+    ait = collect(func, args(), max_concurrency=2)
+    assert await anext(ait) in {0, 1}
+    assert len(consumed) <= 4
+    await ait.aclose()
+
+
+async def test_collect_exception() -> None:
+    async def func(x: int) -> int:
+        if x == 3:
+            raise ValueError
+        await asyncio.sleep(0.01)
+        return x
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = [x async for x in collect(func, range(10), max_concurrency=2)]
+
+
+async def test_collect_empty() -> None:
+    async def func(x: int) -> int:
+        return x
+
+    assert [x async for x in collect(func, [])] == []
+
+
+async def arange(n: int, produced: list[int] | None = None) -> AsyncIterator[int]:
+    for i in range(n):
+        await asyncio.sleep(0)
+        if produced is not None:
+            produced.append(i)
+        yield i
+
+
+async def test_pipeline() -> None:
+    async def func(x: int) -> int:
+        await asyncio.sleep(0.001 * (x % 3))
+        return x * 2
+
+    result = [x async for x in pipeline(func, arange(20), max_concurrency=4)]
+    assert sorted(result) == [x * 2 for x in range(20)]
+
+
+async def test_pipeline_max_concurrency() -> None:
+    running = 0
+    peak = 0
+
+    async def func(x: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (x % 3))
+        running -= 1
+        return x
+
+    result = [x async for x in pipeline(func, arange(20), max_concurrency=4)]
+    assert sorted(result) == list(range(20))
+    assert peak == 4
+
+
+async def test_pipeline_bounded_queue() -> None:
+    produced: list[int] = []
+    event = asyncio.Event()
+
+    async def func(x: int) -> int:
+        await event.wait()
+        return x
+
+    ait = pipeline(func, arange(100, produced), max_concurrency=2, maxsize=3)
+    task = asyncio.ensure_future(anext(ait))
+    for _ in range(100):
+        await asyncio.sleep(0)
+
+    # 実行中の2個、キューの3個、キューへの追加を待つ1個
+    assert len(produced) == 6
+
+    event.set()
+    assert await task in {0, 1}
+    await ait.aclose()
+
+
+async def test_pipeline_overlaps_producer() -> None:
+    started: list[int] = []
+
+    async def args() -> AsyncIterator[int]:
+        yield 0
+        await asyncio.sleep(0.05)
+        assert started == [0]
+        yield 1
+
+    async def func(x: int) -> int:
+        started.append(x)
+        return x
+
+    result = [x async for x in pipeline(func, args())]
+    assert result == [0, 1]
+
+
+async def test_pipeline_function_exception() -> None:
+    async def func(x: int) -> int:
+        if x == 3:
+            raise ValueError
+        await asyncio.sleep(0.01)
+        return x
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = [x async for x in pipeline(func, arange(10), max_concurrency=2)]
+
+
+async def test_pipeline_producer_exception() -> None:
+    async def args() -> AsyncIterator[int]:
+        yield 0
+        raise ValueError
+
+    async def func(x: int) -> int:
+        return x
+
+    with pytest.raises(ValueError):  # noqa: PT011
+        _ = [x async for x in pipeline(func, args())]
+
+
+async def test_pipeline_empty() -> None:
+    async def func(x: int) -> int:
+        return x
+
+    assert [x async for x in pipeline(func, arange(0))] == []
+
+
 async def sleep_df(second: float) -> pl.DataFrame:
     await asyncio.sleep(second)
     return pl.DataFrame({"a": [second]})
@@ -55,6 +215,21 @@ async def test_get() -> None:
     assert df["Code"].sort().to_list() == [1, 2, 3]
 
 
+async def test_get_client_options() -> None:
+    created: list[MockClient] = []
+
+    def factory(**kwargs: Any) -> MockClient:
+        client = MockClient(**kwargs)
+        created.append(client)
+        return client
+
+    async with SharedTransport() as transport:
+        df = await get(factory, MockClient.get_data, [1, 2], transport=transport)
+
+    assert df["Code"].sort().to_list() == [1, 2]
+    assert created[0].client._transport is transport  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
 async def progress(
     ait: AsyncIterable[pl.DataFrame],
     total: int | None = None,
@@ -81,3 +256,130 @@ async def test_get_with_max_items() -> None:
         max_concurrency=2,
     )
     assert df["Code"].sort().to_list() == [0, 1, 2]
+
+
+async def test_get_with_generator() -> None:
+    args = (i for i in range(5))
+    df = await get(MockClient, MockClient.get_data, args, max_items=3)
+    assert df["Code"].sort().to_list() == [0, 1, 2]
+
+
+async def test_get_with_async_iterable() -> None:
+    df = await get(MockClient, MockClient.get_data, arange(5), max_concurrency=2)
+    assert df["Code"].sort().to_list() == [0, 1, 2, 3, 4]
+
+
+async def test_get_with_async_iterable_max_items() -> None:
+    produced: list[int] = []
+    args = arange(100, produced)
+    df = await get(MockClient, MockClient.get_data, args, max_items=3)
+    assert df["Code"].sort().to_list() == [0, 1, 2]
+    assert len(produced) == 3
+
+
+async def test_get_progress_total_unknown() -> None:
+    totals: list[int | None] = []
+
+    async def progress(
+        ait: AsyncIterable[pl.DataFrame],
+        total: int | None = None,
+    ) -> AsyncIterator[pl.DataFrame]:
+        totals.append(total)
+        async for x in ait:
+            yield x
+
+    args = (i for i in range(3))
+    await get(MockClient, MockClient.get_data, args, progress=progress)
+    await get(MockClient, MockClient.get_data, range(5), max_items=2, progress=progress)
+    assert totals == [None, 2]
+
+
+def list_files(path: Path) -> list[str]:
+    return sorted(p.name for p in path.iterdir())
+
+
+async def test_sink(tmp_path: Path) -> None:
+    path = tmp_path / "data"
+    lf = await sink(MockClient, MockClient.get_data, range(5), path, batch_size=2)
+
+    assert isinstance(lf, pl.LazyFrame)
+    assert lf.collect()["Code"].sort().to_list() == [0, 1, 2, 3, 4]
+    assert list_files(path) == [
+        "part-00000.parquet",
+        "part-00001.parquet",
+        "part-00002.parquet",
+    ]
+
+
+async def test_sink_removes_stale_parts(tmp_path: Path) -> None:
+    await sink(MockClient, MockClient.get_data, range(5), tmp_path, batch_size=1)
+    (tmp_path / "other.txt").write_text("keep")
+
+    lf = await sink(MockClient, MockClient.get_data, range(2), tmp_path, batch_size=1)
+
+    assert lf.collect()["Code"].sort().to_list() == [0, 1]
+    assert list_files(tmp_path) == [
+        "other.txt",
+        "part-00000.parquet",
+        "part-00001.parquet",
+    ]
+    scanned = pl.scan_parquet(tmp_path / "*.parquet").collect()
+    assert scanned["Code"].sort().to_list() == [0, 1]
+
+
+class MockSchemaClient(Client):
+    base_url: ClassVar[str] = "http://mock.api"
+
+    async def get_data(self, code: int) -> pl.DataFrame:
+        if code == 0:
+            return pl.DataFrame()
+        if code % 2:
+            return pl.DataFrame({"Code": [code], "A": [1]})
+        return pl.DataFrame({"Code": [code], "B": [1.5]})
+
+
+async def test_sink_relaxed_schema(tmp_path: Path) -> None:
+    lf = await sink(
+        MockSchemaClient,
+        MockSchemaClient.get_data,
+        range(4),
+        tmp_path,
+        batch_size=1,
+    )
+
+    df = lf.collect().sort("Code")
+    assert df["Code"].to_list() == [1, 2, 3]
+    assert sorted(df.columns) == ["A", "B", "Code"]
+
+
+async def test_sink_empty(tmp_path: Path) -> None:
+    lf = await sink(MockSchemaClient, MockSchemaClient.get_data, [0], tmp_path)
+
+    assert lf.collect().is_empty()
+    assert not list_files(tmp_path)
+
+
+async def test_get_daily(tmp_path: Path, mocker: MockerFixture) -> None:
+    mocker.patch("kabukit.utils.partition.get_cache_dir", return_value=tmp_path)
+    today = datetime.date(2025, 1, 3)
+    mocker.patch("kabukit.utils.partition.today", return_value=today)
+    dates = [datetime.date(2025, 1, d) for d in [1, 2, 3]]
+    fetched: list[datetime.date] = []
+
+    class DailyClient(MockClient):
+        async def get_day(self, date: datetime.date) -> pl.DataFrame:
+            fetched.append(date)
+            if date.day == 2:
+                return pl.DataFrame()
+            return pl.DataFrame({"Date": [date]})
+
+    partitions = DailyPartitions("mock", "list", "Date")
+    df = await get_daily(DailyClient, DailyClient.get_day, dates, partitions)
+    assert df["Date"].to_list() == [dates[0], dates[2]]
+    assert sorted(fetched) == dates
+
+    fetched.clear()
+    partitions = DailyPartitions("mock", "list", "Date")
+    df = await get_daily(DailyClient, DailyClient.get_day, dates, partitions)
+    assert df["Date"].to_list() == [dates[0], dates[2]]
+    assert fetched == [dates[2]]
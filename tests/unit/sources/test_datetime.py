@@ -9,8 +9,10 @@ import pytest
 from polars.testing import assert_frame_equal
 
 from kabukit.sources.datetime import _CalendarCacheManager, _with_date, with_date
+from kabukit.utils.business_calendar import BusinessCalendar
 
 if TYPE_CHECKING:
+    from pathlib import Path
     from unittest.mock import AsyncMock, MagicMock
 
     from pytest_mock import MockerFixture
@@ -106,13 +108,14 @@ def test_with_date_error() -> None:
 
 
 @pytest.fixture(autouse=True)
-def reset_cache(mocker: MockerFixture):
+def reset_cache(mocker: MockerFixture, tmp_path: Path):
     """各テストの実行前にカレンダーキャッシュをリセットする"""
 
     mocker.patch(
         "kabukit.sources.datetime._calendar_cache_manager",
         _CalendarCacheManager(),
     )
+    mocker.patch("kabukit.utils.cache.get_cache_dir", return_value=tmp_path)
 
 
 @pytest.fixture
@@ -191,10 +194,11 @@ async def test_async_with_date(mocker: MockerFixture) -> None:
     """非同期関数 with_date が、依存する関数を正しく呼び出すことをテストする"""
 
     # 依存する関数をモック化
-    mock_get_holidays = mocker.patch(
-        "kabukit.sources.datetime._calendar_cache_manager.get_holidays",
+    calendar = BusinessCalendar([date(2025, 1, 6)])
+    mock_get_calendar = mocker.patch(
+        "kabukit.sources.datetime._calendar_cache_manager.get_business_calendar",
         new_callable=mocker.AsyncMock,
-        return_value=[date(2025, 1, 6)],
+        return_value=calendar,
     )
     expected_df = pl.DataFrame({"Date": [date(2025, 1, 6)]})
     mock_internal_with_date = mocker.patch(
@@ -207,12 +211,106 @@ async def test_async_with_date(mocker: MockerFixture) -> None:
     result_df = await with_date(input_df)
 
     # モックが期待通りに呼ばれたか確認
-    mock_get_holidays.assert_awaited_once()
+    mock_get_calendar.assert_awaited_once()
     mock_internal_with_date.assert_called_once()
 
     # _with_dateの引数を個別にチェック
     assert input_df.equals(mock_internal_with_date.call_args[0][0])
-    assert [date(2025, 1, 6)] == mock_internal_with_date.call_args[0][1]
+    assert mock_internal_with_date.call_args[0][1] is calendar
 
     # 最終的な返り値が正しいか確認
     assert_frame_equal(result_df, expected_df)
+
+
+CALENDAR = pl.DataFrame(
+    {
+        "Date": [date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 31)],
+        "IsHoliday": [True, False, False],
+    },
+)
+
+
+async def test_calendar_cache_manager_writes_disk_cache(
+    mock_jquants_client: AsyncMock,
+    MockJQuantsClient: MagicMock,  # noqa: N803
+) -> None:
+    from kabukit.utils import cache
+
+    mock_jquants_client.get_calendar.return_value = CALENDAR
+
+    await _CalendarCacheManager().get_holidays(date(2025, 1, 10))
+
+    assert_frame_equal(cache.read("jquants", "calendar"), CALENDAR)
+    MockJQuantsClient.assert_called_once()
+
+
+async def test_calendar_cache_manager_reads_disk_cache(
+    MockJQuantsClient: MagicMock,  # noqa: N803
+) -> None:
+    from kabukit.utils import cache
+
+    cache.write("jquants", "calendar", CALENDAR)
+
+    holidays = await _CalendarCacheManager().get_holidays(date(2025, 1, 31))
+
+    assert holidays == [date(2025, 1, 1)]
+    MockJQuantsClient.assert_not_called()
+
+
+async def test_calendar_cache_manager_refreshes_past_coverage(
+    mock_jquants_client: AsyncMock,
+    MockJQuantsClient: MagicMock,  # noqa: N803
+) -> None:
+    from kabukit.utils import cache
+
+    cache.write("jquants", "calendar", CALENDAR)
+    mock_jquants_client.get_calendar.return_value = pl.DataFrame(
+        {"Date": [date(2025, 2, 11)], "IsHoliday": [True]},
+    )
+    manager = _CalendarCacheManager()
+
+    assert await manager.get_holidays(date(2025, 2, 1)) == [date(2025, 2, 11)]
+    # APIから取得した後は、カバー範囲を超えても再取得しない
+    assert await manager.get_holidays(date(2025, 3, 1)) == [date(2025, 2, 11)]
+    MockJQuantsClient.assert_called_once()
+
+
+async def test_set_calendar(MockJQuantsClient: MagicMock) -> None:  # noqa: N803
+    from kabukit.sources.datetime import _calendar_cache_manager, set_calendar
+
+    set_calendar(CALENDAR.with_columns(Other=1))
+
+    holidays = await _calendar_cache_manager.get_holidays(date(2030, 1, 1))
+
+    assert holidays == [date(2025, 1, 1)]
+    MockJQuantsClient.assert_not_called()
+
+
+async def test_with_date_until(mocker: MockerFixture) -> None:
+    mock_get_calendar = mocker.patch(
+        "kabukit.sources.datetime._calendar_cache_manager.get_business_calendar",
+        new_callable=mocker.AsyncMock,
+        return_value=BusinessCalendar([]),
+    )
+    df = pl.DataFrame(
+        {
+            "SubmittedDate": [date(2025, 1, 4), date(2025, 1, 10)],
+            "SubmittedTime": [time(9, 0), None],
+        },
+    )
+    await with_date(df)
+
+    mock_get_calendar.assert_awaited_once_with(date(2025, 1, 24))
+
+
+async def test_calendar_cache_manager_business_calendar() -> None:
+    manager = _CalendarCacheManager()
+    manager.set_calendar(CALENDAR)
+
+    calendar = await manager.get_business_calendar()
+    assert calendar.start == date(2025, 1, 1)
+    assert calendar.end == date(2025, 1, 31)
+    assert await manager.get_business_calendar() is calendar
+
+    manager.set_calendar(CALENDAR)
+    assert await manager.get_business_calendar() is not calendar
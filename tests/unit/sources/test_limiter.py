@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import datetime
+import email.utils
+from typing import TYPE_CHECKING
+
+import pytest
+from httpx import Response
+
+from kabukit.sources.limiter import (
+    MAX_RETRY_AFTER,
+    THROTTLE_WINDOW,
+    RateLimiter,
+    get_retry_after,
+)
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+pytestmark = pytest.mark.unit
+
+
+def test_throttle(mocker: MockerFixture) -> None:
+    mock_time = mocker.patch("kabukit.sources.limiter.time.monotonic")
+    mock_time.return_value = 100.0
+    limiter = RateLimiter(max_concurrency=8)
+    limiter.throttle()
+    assert limiter.concurrency == 4
+
+    for k in range(1, 4):
+        mock_time.return_value = 100.0 + k * THROTTLE_WINDOW
+        limiter.throttle()
+    assert limiter.concurrency == 1
+
+
+def test_throttle_once_per_window(mocker: MockerFixture) -> None:
+    mock_time = mocker.patch("kabukit.sources.limiter.time.monotonic")
+    mock_time.return_value = 100.0
+    limiter = RateLimiter(max_concurrency=8)
+
+    for _ in range(5):
+        limiter.throttle()
+    assert limiter.concurrency == 4
+
+    mock_time.return_value = 100.0 + THROTTLE_WINDOW
+    limiter.throttle()
+    assert limiter.concurrency == 2
+
+
+def test_throttle_window_retry_after(mocker: MockerFixture) -> None:
+    mock_time = mocker.patch("kabukit.sources.limiter.time.monotonic")
+    mock_time.return_value = 100.0
+    limiter = RateLimiter(max_concurrency=8)
+    limiter.throttle(5)
+
+    mock_time.return_value = 104.0
+    limiter.throttle()
+    assert limiter.concurrency == 4
+
+    mock_time.return_value = 105.0
+    limiter.throttle()
+    assert limiter.concurrency == 2
+
+
+def test_succeed(mocker: MockerFixture) -> None:
+    mock_time = mocker.patch("kabukit.sources.limiter.time.monotonic")
+    mock_time.return_value = 100.0
+    limiter = RateLimiter(max_concurrency=8)
+    limiter.throttle()
+    mock_time.return_value = 100.0 + THROTTLE_WINDOW
+    limiter.throttle()
+    assert limiter.concurrency == 2
+
+    for _ in range(4):
+        limiter.succeed()
+    assert limiter.concurrency == 3
+
+    for _ in range(100):
+        limiter.succeed()
+    assert limiter.concurrency == 8
+
+
+async def test_concurrency() -> None:
+    limiter = RateLimiter(max_concurrency=4)
+    limiter.throttle()
+    running = 0
+    peak = 0
+
+    async def task() -> None:
+        nonlocal running, peak
+        async with limiter:
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+    await asyncio.gather(*(task() for _ in range(10)))
+    assert peak == 2
+
+
+async def test_rate(mocker: MockerFixture) -> None:
+    mocker.patch("kabukit.sources.limiter.time.monotonic", return_value=100.0)
+    mock_sleep = mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+    limiter = RateLimiter(rate=2)
+
+    for _ in range(3):
+        async with limiter:
+            pass
+
+    assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+
+async def test_retry_after_blocks(mocker: MockerFixture) -> None:
+    mocker.patch("kabukit.sources.limiter.time.monotonic", return_value=100.0)
+    mock_sleep = mocker.patch("asyncio.sleep", new_callable=mocker.AsyncMock)
+    limiter = RateLimiter()
+    limiter.throttle(3)
+
+    async with limiter:
+        pass
+
+    mock_sleep.assert_awaited_once_with(3.0)
+
+
+async def test_cancel_while_waiting_releases() -> None:
+    limiter = RateLimiter(max_concurrency=1)
+    limiter.throttle(10)
+    task = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert limiter._running == 0  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+def test_get_retry_after_none() -> None:
+    assert get_retry_after(Response(429)) is None
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("5", 5.0), ("-1", 0.0), ("1000", MAX_RETRY_AFTER), ("invalid", None)],
+)
+def test_get_retry_after_seconds(value: str, expected: float | None) -> None:
+    response = Response(429, headers={"Retry-After": value})
+    assert get_retry_after(response) == expected
+
+
+def test_get_retry_after_date() -> None:
+    date = datetime.datetime.now(datetime.UTC) + datetime.timedelta(seconds=30)
+    value = email.utils.format_datetime(date, usegmt=True)
+    response = Response(503, headers={"Retry-After": value})
+    seconds = get_retry_after(response)
+    assert seconds is not None
+    assert 25 < seconds <= 30
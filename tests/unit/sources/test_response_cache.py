@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import datetime
+import io
+from typing import TYPE_CHECKING, ClassVar
+
+import httpx
+import pytest
+from httpx import Request, Response
+
+from kabukit.sources.client import Client
+from kabukit.sources.response_cache import (
+    IMMUTABLE,
+    SHORT_TTL,
+    CacheEntry,
+    ResponseCache,
+    get_request_url,
+    ttl_for_date,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from unittest.mock import AsyncMock
+
+    from httpx._types import QueryParamTypes
+    from pytest_mock import MockerFixture
+
+pytestmark = pytest.mark.unit
+
+
+def test_ttl_for_date(mocker: MockerFixture) -> None:
+    mocker.patch(
+        "kabukit.sources.response_cache.today",
+        return_value=datetime.date(2025, 10, 10),
+    )
+    assert ttl_for_date("2025-10-09") == IMMUTABLE
+    assert ttl_for_date(datetime.date(2025, 10, 10)) == SHORT_TTL
+    assert ttl_for_date("20251011") == SHORT_TTL
+
+
+@pytest.mark.parametrize(
+    ("url", "params", "expected"),
+    [
+        ("/a.json", {"date": "2025-10-10"}, "https://x.com/v1/a.json?date=2025-10-10"),
+        ("a.html", None, "https://x.com/v1/a.html"),
+        ("https://y.com/a.pdf", None, "https://y.com/a.pdf"),
+    ],
+)
+def test_get_request_url(
+    url: str,
+    params: QueryParamTypes | None,
+    expected: str,
+) -> None:
+    assert get_request_url("https://x.com/v1", url, params) == expected
+
+
+def test_cache_entry_validators() -> None:
+    entry = CacheEntry("u", "d", 0, {"etag": '"abc"', "last-modified": "Mon"})
+    assert entry.validators() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon",
+    }
+
+
+def test_cache_entry_is_fresh(mocker: MockerFixture) -> None:
+    mocker.patch("kabukit.sources.response_cache.time.time", return_value=100.0)
+    entry = CacheEntry("u", "d", 50.0, {})
+    assert entry.is_fresh(IMMUTABLE)
+    assert entry.is_fresh(60)
+    assert not entry.is_fresh(40)
+
+
+def test_response_cache_store_and_read(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    key = cache.key("https://x.com/a")
+    response = Response(
+        200,
+        headers={"Content-Type": "text/html", "ETag": '"1"', "X-Other": "x"},
+        content=b"hello",
+    )
+
+    entry = cache.store(key, "https://x.com/a", response)
+    assert entry.headers == {"content-type": "text/html", "etag": '"1"'}
+
+    loaded = cache.load(key)
+    assert loaded == entry
+
+    cached = cache.read(entry)
+    assert cached.text == "hello"
+    assert cached.request.url == "https://x.com/a"
+    cached.raise_for_status()
+
+
+def test_response_cache_deduplicates_content(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    a = cache.store(cache.key("a"), "a", Response(200, content=b"same"))
+    b = cache.store(cache.key("b"), "b", Response(200, content=b"same"))
+
+    assert a.digest == b.digest
+    assert len(list((tmp_path / "objects").glob("*/*"))) == 1
+
+
+def test_response_cache_load_missing(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    assert cache.load(cache.key("a")) is None
+
+
+def test_response_cache_load_missing_object(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    key = cache.key("a")
+    entry = cache.store(key, "a", Response(200, content=b"x"))
+    (tmp_path / "objects" / entry.digest[:2] / entry.digest).unlink()
+
+    assert cache.load(key) is None
+
+
+def test_response_cache_default_path(mocker: MockerFixture, tmp_path: Path) -> None:
+    mocker.patch(
+        "kabukit.sources.response_cache.get_cache_dir",
+        return_value=tmp_path,
+    )
+    assert ResponseCache().path == tmp_path / "http"
+
+
+class CachedClient(Client):
+    base_url: ClassVar[str] = "http://mock.api"
+
+    def cache_ttl(self, url: str, params: QueryParamTypes | None) -> float | None:  # noqa: ARG002
+        return {"immutable": IMMUTABLE, "expired": -1}.get(url)
+
+    def is_cacheable(self, url: str, response: Response) -> bool:  # noqa: ARG002
+        return response.headers.get("content-type") != "x/error"
+
+
+def ok(content: bytes, headers: dict[str, str] | None = None) -> Response:
+    return Response(200, content=content, headers=headers, request=Request("GET", "/"))
+
+
+async def test_client_cache_disabled(mock_get: AsyncMock) -> None:
+    mock_get.return_value = ok(b"a")
+    client = CachedClient()
+
+    assert client.cache is None
+    await client.get("immutable")
+    await client.get("immutable")
+
+    assert mock_get.await_count == 2
+
+
+async def test_client_cache_hit(mock_get: AsyncMock, tmp_path: Path) -> None:
+    mock_get.return_value = ok(b"a")
+    client = CachedClient(cache=ResponseCache(tmp_path))
+
+    first = await client.get("immutable", params={"x": 1})
+    second = await client.get("immutable", params={"x": 1})
+
+    assert first.content == second.content == b"a"
+    mock_get.assert_awaited_once_with("immutable", params={"x": 1})
+
+
+async def test_client_cache_not_cacheable(mock_get: AsyncMock, tmp_path: Path) -> None:
+    mock_get.return_value = ok(b"a")
+    client = CachedClient(cache=ResponseCache(tmp_path))
+
+    await client.get("other")
+    await client.get("other")
+
+    assert mock_get.await_count == 2
+    assert not (tmp_path / "entries").exists()
+
+
+async def test_client_cache_rejects_error_body(
+    mock_get: AsyncMock,
+    tmp_path: Path,
+) -> None:
+    mock_get.side_effect = [ok(b"e", {"Content-Type": "x/error"}), ok(b"a")]
+    client = CachedClient(cache=ResponseCache(tmp_path))
+
+    first = await client.get("immutable")
+    second = await client.get("immutable")
+    third = await client.get("immutable")
+
+    assert [first.content, second.content, third.content] == [b"e", b"a", b"a"]
+    assert mock_get.await_count == 2
+
+
+async def test_client_cache_revalidate_not_modified(
+    mock_get: AsyncMock,
+    tmp_path: Path,
+) -> None:
+    mock_get.side_effect = [
+        ok(b"a", {"ETag": '"1"'}),
+        Response(304, request=Request("GET", "/")),
+    ]
+    client = CachedClient(cache=ResponseCache(tmp_path))
+
+    await client.get("expired")
+    response = await client.get("expired")
+
+    assert response.content == b"a"
+    assert response.status_code == 200
+    mock_get.assert_awaited_with(
+        "expired",
+        params=None,
+        headers={"If-None-Match": '"1"'},
+    )
+
+
+async def test_client_cache_revalidate_modified(
+    mock_get: AsyncMock,
+    tmp_path: Path,
+) -> None:
+    mock_get.side_effect = [ok(b"a", {"ETag": '"1"'}), ok(b"b", {"ETag": '"2"'})]
+    client = CachedClient(cache=ResponseCache(tmp_path))
+
+    await client.get("expired")
+    response = await client.get("expired")
+
+    assert response.content == b"b"
+    entry = client.cache.load(client.cache.key("http://mock.api/expired"))  # pyright: ignore[reportOptionalMemberAccess]
+    assert entry is not None
+    assert entry.headers["etag"] == '"2"'
+
+
+def test_client_cache_true(mocker: MockerFixture, tmp_path: Path) -> None:
+    mocker.patch(
+        "kabukit.sources.response_cache.get_cache_dir",
+        return_value=tmp_path,
+    )
+    client = CachedClient(cache=True)
+    assert client.cache is not None
+    assert client.cache.path == tmp_path / "http"
+
+
+async def test_client_download_cache(tmp_path: Path) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> Response:
+        requests.append(request)
+        return Response(200, content=b"zip", headers={"Content-Type": "x/zip"})
+
+    transport = httpx.MockTransport(handler)
+    client = CachedClient(cache=ResponseCache(tmp_path), transport=transport)
+
+    for _ in range(2):
+        file = io.BytesIO()
+        response = await client.download("immutable", file)
+        assert file.read() == b"zip"
+        assert response.headers["content-type"] == "x/zip"
+
+    assert len(requests) == 1
+
+
+async def test_client_download_rejects_error_body(tmp_path: Path) -> None:
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> Response:
+        requests.append(request)
+        return Response(200, content=b"e", headers={"Content-Type": "x/error"})
+
+    transport = httpx.MockTransport(handler)
+    client = CachedClient(cache=ResponseCache(tmp_path), transport=transport)
+
+    for _ in range(2):
+        await client.download("immutable", io.BytesIO())
+
+    assert len(requests) == 2
+
+
+async def test_client_download_shares_objects_with_get(
+    mock_get: AsyncMock,
+    tmp_path: Path,
+) -> None:
+    mock_get.return_value = ok(b"zip")
+    client = CachedClient(cache=ResponseCache(tmp_path))
+    await client.get("immutable")
+
+    file = io.BytesIO()
+    await client.download("immutable", file)
+
+    assert file.read() == b"zip"
+    mock_get.assert_awaited_once()
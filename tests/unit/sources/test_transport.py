@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, ClassVar
+
+import httpx
+import pytest
+
+from kabukit.sources.client import Client
+from kabukit.sources.transport import SharedTransport, create_transport
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+pytestmark = pytest.mark.unit
+
+
+class MockClient(Client):
+    base_url: ClassVar[str] = "http://mock.api"
+
+
+def test_create_transport() -> None:
+    transport = create_transport()
+    assert isinstance(transport, httpx.AsyncHTTPTransport)
+
+
+def test_create_transport_limits() -> None:
+    limits = httpx.Limits(max_connections=4, keepalive_expiry=30)
+    transport = create_transport(limits)
+    pool = transport._pool  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert pool._max_connections == 4  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+    assert pool._keepalive_expiry == 30  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, text=request.url.path)
+
+
+async def test_shared_transport_survives_client_close() -> None:
+    async with SharedTransport() as transport:
+        transport.transport = httpx.MockTransport(handler)  # pyright: ignore[reportAttributeAccessIssue]
+
+        for path in ["/a", "/b"]:
+            async with MockClient(transport=transport) as client:
+                response = await client.get(path)
+                assert response.text == path
+
+
+async def test_shared_transport_close(mocker: MockerFixture) -> None:
+    transport = SharedTransport()
+    aclose = mocker.spy(transport.transport, "aclose")
+
+    client = MockClient(transport=transport)
+    await client.aclose()
+    aclose.assert_not_called()
+
+    await transport.close()
+    aclose.assert_awaited_once()
+
+
+def test_client_limits_and_http2(mocker: MockerFixture) -> None:
+    mock_create_transport = mocker.patch("kabukit.sources.client.create_transport")
+    limits = httpx.Limits(max_connections=8)
+
+    MockClient(limits=limits)
+    mock_create_transport.assert_called_once_with(limits, http2=False)
+
+    mock_create_transport.reset_mock()
+    MockClient(http2=True)
+    mock_create_transport.assert_called_once_with(None, http2=True)
+
+
+def test_client_transport_overrides_limits(mocker: MockerFixture) -> None:
+    mock_create_transport = mocker.patch("kabukit.sources.client.create_transport")
+    transport = SharedTransport()
+
+    client = MockClient(transport=transport, limits=httpx.Limits(), http2=True)
+
+    mock_create_transport.assert_not_called()
+    assert client.client._transport is transport  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+def test_client_default_transport(mocker: MockerFixture) -> None:
+    mock_create_transport = mocker.patch("kabukit.sources.client.create_transport")
+    MockClient()
+    mock_create_transport.assert_not_called()
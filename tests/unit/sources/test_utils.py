@@ -9,7 +9,12 @@ import pytest
 from bs4 import BeautifulSoup, Tag
 from polars.testing import assert_frame_equal
 
-from kabukit.sources.utils import get_soup, iter_contents, normalize_code
+from kabukit.sources.utils import (
+    SoupCache,
+    get_soup,
+    iter_contents,
+    normalize_code,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -42,6 +47,56 @@ def test_get_soup_cache_different_html() -> None:
     get_soup.cache_clear()
 
 
+def test_soup_cache_info() -> None:
+    cache = SoupCache(maxsize=4, maxchars=1000)
+    cache("<p>a</p>")
+    cache("<p>a</p>")
+    cache("<p>b</p>")
+
+    info = cache.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.currsize == 2
+    assert info.currchars == 16
+
+    cache.cache_clear()
+    assert cache.cache_info() == (0, 0, 4, 0, 1000, 0)
+
+
+def test_soup_cache_maxsize() -> None:
+    cache = SoupCache(maxsize=2)
+    a = cache("<p>a</p>")
+    cache("<p>b</p>")
+    assert cache("<p>a</p>") is a  # a becomes most recently used
+    cache("<p>c</p>")  # evicts b
+
+    assert cache.cache_info().currsize == 2
+    assert cache("<p>a</p>") is a
+    misses = cache.cache_info().misses
+    cache("<p>b</p>")
+    assert cache.cache_info().misses == misses + 1
+
+
+def test_soup_cache_maxchars() -> None:
+    cache = SoupCache(maxsize=10, maxchars=20)
+    cache("<p>a</p>")
+    cache("<p>b</p>")
+    cache("<p>c</p>")  # 24 > 20 bytes, evicts a
+
+    info = cache.cache_info()
+    assert info.currsize == 2
+    assert info.currchars == 16
+
+
+def test_soup_cache_too_large() -> None:
+    cache = SoupCache(maxchars=4)
+    soup1 = cache("<p>a</p>")
+    soup2 = cache("<p>a</p>")
+
+    assert soup1 is not soup2
+    assert cache.cache_info().currsize == 0
+
+
 def test_normalize_code() -> None:
     df = pl.DataFrame({"Code": ["12340", "56789", "abcd"]})
     result = normalize_code(df)
@@ -66,6 +121,12 @@ def test_iter_contents_single_match(dummy_zip_content: bytes) -> None:
     assert result == [b"hello"]
 
 
+def test_iter_contents_file(dummy_zip_content: bytes) -> None:
+    pattern = re.compile(r".*\.txt")
+    result = list(iter_contents(io.BytesIO(dummy_zip_content), pattern))
+    assert result == [b"hello", b"world"]
+
+
 def test_iter_contents_multiple_matches(dummy_zip_content: bytes) -> None:
     pattern = re.compile(r".*\.txt")
     result = list(iter_contents(dummy_zip_content, pattern))
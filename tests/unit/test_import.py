@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+import kabukit
+
+pytestmark = pytest.mark.unit
+
+HEAVY_MODULES = [
+    "bs4",
+    "httpx",
+    "ixbrlparse",
+    "lxml",
+    "patito",
+    "polars",
+    "pypdf",
+    "tenacity",
+]
+
+
+def import_time(module: str) -> dict[str, int]:
+    """`python -X importtime`で各モジュールの累積インポート時間 (μs) を返す。"""
+    args = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    result = subprocess.run(args, capture_output=True, text=True, check=True)
+
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+
+    return times
+
+
+@pytest.mark.parametrize("module", ["kabukit", "kabukit.cli.app"])
+def test_import_does_not_load_heavy_modules(module: str) -> None:
+    times = import_time(module)
+    assert module in times
+    loaded = [name for name in HEAVY_MODULES if name in times]
+    assert not loaded
+
+
+def test_lazy_attribute() -> None:
+    from kabukit.sources.jquants.client import JQuantsClient
+
+    assert kabukit.JQuantsClient is JQuantsClient
+
+
+def test_lazy_attribute_alias() -> None:
+    from kabukit.sources.edinet.concurrent import get_list
+
+    assert kabukit.get_edinet_list is get_list
+
+
+def test_lazy_module() -> None:
+    from kabukit.utils import cache
+
+    assert kabukit.cache is cache
+
+
+@pytest.mark.parametrize("name", kabukit.__all__)
+def test_all(name: str) -> None:
+    assert getattr(kabukit, name) is not None
+    assert name in dir(kabukit)
+
+
+def test_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        _ = kabukit.unknown  # pyright: ignore[reportAttributeAccessIssue]
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+import polars as pl
+import pytest
+
+from kabukit.utils.business_calendar import BusinessCalendar
+
+pytestmark = pytest.mark.unit
+
+HOLIDAYS = [date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3), date(2025, 1, 13)]
+
+
+def roll_forward(calendar: BusinessCalendar, dates: list[date | None]) -> list[date]:
+    df = pl.DataFrame({"d": dates}, schema={"d": pl.Date})
+    return df.select(calendar.roll_forward(pl.col("d")))["d"].to_list()
+
+
+def test_init() -> None:
+    calendar = BusinessCalendar(reversed(HOLIDAYS))
+    assert calendar.holidays == HOLIDAYS
+    assert calendar.start == date(2025, 1, 1)
+    assert calendar.end == date(2025, 1, 13)
+    assert len(calendar) == 13 + 31
+
+
+def test_from_frame() -> None:
+    df = pl.DataFrame(
+        {
+            "Date": [date(2024, 12, 30), date(2025, 1, 1), date(2025, 1, 6)],
+            "IsHoliday": [False, True, False],
+        },
+    )
+    calendar = BusinessCalendar.from_frame(df)
+    assert calendar.holidays == [date(2025, 1, 1)]
+    assert calendar.start == date(2024, 12, 30)
+    assert calendar.end == date(2025, 1, 6)
+
+
+def test_from_frame_empty() -> None:
+    df = pl.DataFrame(
+        {"Date": [], "IsHoliday": []},
+        schema={"Date": pl.Date, "IsHoliday": pl.Boolean},
+    )
+    calendar = BusinessCalendar.from_frame(df)
+    assert calendar.start is None
+    assert len(calendar) == 0
+
+
+def test_roll_forward() -> None:
+    calendar = BusinessCalendar(HOLIDAYS)
+    dates = [
+        date(2025, 1, 1),  # 祝日
+        date(2025, 1, 6),  # 営業日
+        date(2025, 1, 11),  # 土曜日
+        date(2025, 1, 13),  # 祝日の月曜日
+        None,
+    ]
+    expected = [
+        date(2025, 1, 6),
+        date(2025, 1, 6),
+        date(2025, 1, 14),
+        date(2025, 1, 14),
+        None,
+    ]
+    assert roll_forward(calendar, dates) == expected
+
+
+def test_roll_forward_out_of_range() -> None:
+    calendar = BusinessCalendar(HOLIDAYS, start=date(2025, 1, 5), end=date(2025, 1, 10))
+    dates = [date(2025, 1, 1), date(2025, 1, 4), date(2025, 3, 1)]
+    expected = [date(2025, 1, 6), date(2025, 1, 6), date(2025, 3, 3)]
+    assert roll_forward(calendar, dates) == expected
+
+
+def test_roll_forward_before_start_onto_holiday() -> None:
+    calendar = BusinessCalendar([date(2025, 1, 6)])
+    assert calendar.start == date(2025, 1, 6)
+    assert roll_forward(calendar, [date(2025, 1, 5)]) == [date(2025, 1, 7)]
+
+
+def test_roll_forward_padding_ends_on_weekend() -> None:
+    calendar = BusinessCalendar([date(2025, 2, 20)])
+    end = date(2025, 2, 20) + timedelta(days=31)
+    assert end.weekday() == 6
+    assert roll_forward(calendar, [end]) == [date(2025, 3, 24)]
+
+
+def test_roll_forward_empty() -> None:
+    calendar = BusinessCalendar([])
+    assert roll_forward(calendar, [date(2025, 1, 4)]) == [date(2025, 1, 6)]
+
+
+def test_roll_forward_matches_add_business_days() -> None:
+    calendar = BusinessCalendar(HOLIDAYS, start=date(2024, 12, 1), end=date(2025, 2, 1))
+    start = date(2024, 11, 1)
+    dates: list[date | None] = [start + timedelta(days=i) for i in range(150)]
+
+    df = pl.DataFrame({"d": dates})
+    expected = df.select(
+        pl.col("d").dt.add_business_days(0, holidays=HOLIDAYS, roll="forward"),
+    )["d"].to_list()
+
+    assert roll_forward(calendar, dates) == expected
+
+
+def test_is_business_day() -> None:
+    calendar = BusinessCalendar(HOLIDAYS)
+    df = pl.DataFrame({"d": [date(2025, 1, 1), date(2025, 1, 6), date(2025, 1, 11)]})
+    result = df.select(calendar.is_business_day(pl.col("d")))["d"].to_list()
+    assert result == [False, True, False]
@@ -11,7 +11,19 @@ import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
-from kabukit.utils.cache import _get_cache_filepath, clean, glob, read, write
+from kabukit.utils.cache import (
+    ParquetOptions,
+    _get_cache_filepath,
+    clean,
+    get_parquet_options,
+    glob,
+    read,
+    scan,
+    scan_partitions,
+    write,
+    write_parquet,
+    write_partitions,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -263,3 +275,183 @@ def test_clean_no_dir(mocker: MockerFixture, tmp_path: Path) -> None:
     clean(source="jquants", group="non_existent_group")
     assert not (tmp_path / "jquants" / "non_existent_group").exists()
     mock_get_cache_dir.assert_called_once()  # Called once for clean(group=...)
+
+
+def prices() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "Date": [
+                datetime.date(2024, 12, 30),
+                datetime.date(2025, 1, 6),
+                datetime.date(2025, 1, 6),
+            ],
+            "Code": ["1301", "1301", "7203"],
+            "Close": [1.0, 2.0, 3.0],
+        },
+    ).with_columns(
+        pl.col("Date").dt.year().alias("year"),
+        pl.col("Date").dt.month().alias("month"),
+    )
+
+
+def test_write_partitions(mock_cache_dir: Path) -> None:
+    paths = write_partitions("jquants", "prices", prices(), ["year", "month"])
+
+    base = mock_cache_dir / "jquants" / "prices"
+    assert paths == [
+        base / "year=2024" / "month=12" / "part-00000.parquet",
+        base / "year=2025" / "month=1" / "part-00000.parquet",
+    ]
+    assert pl.read_parquet(paths[0]).columns == ["Date", "Code", "Close"]
+
+
+def test_scan_partitions(mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    df = prices()
+    write_partitions("jquants", "prices", df, ["year", "month"])
+
+    lf = scan_partitions("jquants", "prices")
+    result = lf.sort("Date", "Code").collect()
+    assert_frame_equal(result, df, check_dtypes=False)
+
+    result = lf.filter(year=2025, Code="7203").select("Close").collect()
+    assert result["Close"].to_list() == [3.0]
+
+
+def test_scan_partitions_prunes_directories(mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    write_partitions("jquants", "prices", prices(), "year")
+
+    plan = scan_partitions("jquants", "prices").filter(year=2024).explain()
+    assert "year=2024" in plan
+    assert "year=2025" not in plan
+
+
+def test_write_partitions_overwrite(mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    write_partitions("jquants", "prices", prices(), "year")
+    new = pl.DataFrame({"Date": [datetime.date(2025, 2, 3)], "Code": ["9999"]})
+    new = new.with_columns(pl.lit(2025).alias("year"))
+
+    write_partitions("jquants", "prices", new, "year")
+
+    result = scan_partitions("jquants", "prices").sort("Date").collect()
+    assert result["Code"].to_list() == ["1301", "9999"]
+    assert result["Close"].to_list() == [1.0, None]
+
+
+def test_write_partitions_append(mock_cache_dir: Path) -> None:
+    df = prices().filter(year=2025)
+    write_partitions("jquants", "prices", df, "year", mode="append")
+    paths = write_partitions("jquants", "prices", df, "year", mode="append")
+
+    assert paths == [
+        mock_cache_dir / "jquants" / "prices" / "year=2025" / "part-00001.parquet",
+    ]
+    assert scan_partitions("jquants", "prices").collect().height == 4
+
+
+def test_write_partitions_quote_and_null(mock_cache_dir: Path) -> None:
+    df = pl.DataFrame({"Market": ["A/B", None], "Value": [1, 2]})
+    write_partitions("jpx", "markets", df, "Market")
+
+    names = sorted(p.name for p in (mock_cache_dir / "jpx" / "markets").iterdir())
+    assert names == ["Market=A%2FB", "Market=__HIVE_DEFAULT_PARTITION__"]
+
+    result = scan_partitions("jpx", "markets").sort("Value").collect()
+    assert result["Market"].to_list() == ["A/B", None]
+
+
+def test_scan_partitions_ignores_snapshots(mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    write("jquants", "prices", pl.DataFrame({"Code": ["0000"]}), name="snapshot")
+    write_partitions("jquants", "prices", prices(), "year")
+
+    result = scan_partitions("jquants", "prices").collect()
+    assert "0000" not in result["Code"].to_list()
+    assert read("jquants", "prices", "snapshot")["Code"].to_list() == ["0000"]
+
+
+def test_scan_partitions_not_found(mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    write("jquants", "prices", pl.DataFrame({"Code": ["0000"]}))
+
+    with pytest.raises(FileNotFoundError, match="No partitioned data"):
+        scan_partitions("jquants", "prices")
+
+
+def test_scan(mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    df = pl.DataFrame({"Code": ["1301", "7203"], "Close": [1.0, 2.0]})
+    write("jquants", "prices", df, name="snapshot")
+
+    lf = scan("jquants", "prices")
+    assert isinstance(lf, pl.LazyFrame)
+
+    result = lf.filter(Code="7203").select("Close").collect()
+    assert result["Close"].to_list() == [2.0]
+
+
+def test_scan_not_found(mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    with pytest.raises(FileNotFoundError):
+        scan("jquants", "prices")
+
+
+def test_write_sorts_by_natural_key(mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    df = pl.DataFrame(
+        {
+            "Date": [datetime.date(2025, 1, 7), datetime.date(2025, 1, 6)] * 2,
+            "Code": ["7203", "7203", "1301", "1301"],
+        },
+    )
+    path = write("jquants", "prices", df, name="sorted")
+
+    result = pl.read_parquet(path)
+    assert_frame_equal(result, df.sort("Code", "Date"))
+
+
+def test_write_parquet_options(mocker: MockerFixture, mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    spy = mocker.spy(pl.DataFrame, "write_parquet")
+
+    write("jquants", "prices", pl.DataFrame({"Code": ["1301"]}))
+
+    kwargs = spy.call_args.kwargs
+    assert kwargs["compression"] == "zstd"
+    assert kwargs["compression_level"] == 3
+    assert kwargs["statistics"] is True
+    assert kwargs["row_group_size"] == 65_536
+
+
+def test_write_profile(mocker: MockerFixture, mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    spy = mocker.spy(pl.DataFrame, "write_parquet")
+    df = pl.DataFrame({"Code": ["1301"]})
+
+    path = write("jquants", "info", df, profile="fast")
+
+    assert spy.call_args.kwargs["compression"] == "lz4"
+    assert_frame_equal(pl.read_parquet(path), df)
+
+
+def test_write_unknown_profile(mock_cache_dir: Path) -> None:
+    del mock_cache_dir
+    with pytest.raises(ValueError, match="Unknown compression profile"):
+        write("jquants", "info", pl.DataFrame({"Code": ["1301"]}), profile="x")
+
+
+def test_write_parquet_missing_sort_columns(tmp_path: Path) -> None:
+    df = pl.DataFrame({"Code": ["7203", None, "1301"], "Value": [1, 2, 3]})
+    path = tmp_path / "data.parquet"
+
+    write_parquet(df, path, ParquetOptions(("Code", "Date"), profile="small"))
+
+    result = pl.read_parquet(path)
+    assert result["Code"].to_list() == ["1301", "7203", None]
+
+
+def test_get_parquet_options() -> None:
+    assert get_parquet_options("jquants", "prices").sort_by == ("Code", "Date")
+    assert get_parquet_options("unknown", "group") == ParquetOptions()
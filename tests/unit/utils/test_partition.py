@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+
+from kabukit.utils.partition import DailyPartitions
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
+
+pytestmark = pytest.mark.unit
+
+D1 = datetime.date(2025, 10, 9)
+D2 = datetime.date(2025, 10, 10)
+D3 = datetime.date(2025, 10, 11)
+TODAY = datetime.date(2025, 10, 11)
+
+
+@pytest.fixture
+def mock_cache_dir(tmp_path: Path, mocker: MockerFixture) -> Path:
+    mocker.patch("kabukit.utils.partition.get_cache_dir", return_value=tmp_path)
+    mocker.patch("kabukit.utils.partition.today", return_value=TODAY)
+    return tmp_path
+
+
+@pytest.fixture
+def partitions(mock_cache_dir: Path) -> DailyPartitions:
+    del mock_cache_dir
+    return DailyPartitions("edinet", "list", "FileDate")
+
+
+def frame(date: datetime.date, codes: list[str]) -> pl.DataFrame:
+    return pl.DataFrame({"Code": codes, "FileDate": [date] * len(codes)})
+
+
+def test_write_layout(partitions: DailyPartitions, mock_cache_dir: Path) -> None:
+    partitions.write(D1, frame(D1, ["10000"]))
+    partitions.write(D2, pl.DataFrame())
+    partitions.flush()
+
+    path = mock_cache_dir / "edinet" / "list"
+    assert (path / "FileDate=2025-10-09" / "data.parquet").exists()
+    assert not (path / "FileDate=2025-10-10").exists()
+    assert (path / "_manifest.json").exists()
+    assert not list(path.glob("*.parquet"))
+
+
+def test_path(tmp_path: Path) -> None:
+    partitions = DailyPartitions("edinet", "list", "FileDate", path=tmp_path)
+    partitions.write(D1, frame(D1, ["10000"]))
+    partitions.flush()
+
+    assert partitions.path == tmp_path
+    assert (tmp_path / "FileDate=2025-10-09" / "data.parquet").exists()
+    assert (tmp_path / "_manifest.json").exists()
+
+
+def test_missing(partitions: DailyPartitions) -> None:
+    partitions.write(D1, frame(D1, ["10000"]))
+    partitions.write(D2, pl.DataFrame())
+    partitions.write(D3, frame(D3, ["20000"]))
+
+    assert partitions.is_final(D1)
+    assert partitions.is_final(D2)
+    assert not partitions.is_final(D3)
+    assert partitions.missing([D3, D2, D1, TODAY + datetime.timedelta(1)]) == [
+        D3,
+        TODAY + datetime.timedelta(1),
+    ]
+
+
+def test_manifest_persisted(partitions: DailyPartitions) -> None:
+    partitions.write(D1, frame(D1, ["10000"]))
+    partitions.write(D3, frame(D3, ["20000"]))
+    partitions.flush()
+
+    loaded = DailyPartitions("edinet", "list", "FileDate")
+    assert loaded.manifest == {D1: (1, True), D3: (1, False)}
+
+
+def test_manifest_broken(partitions: DailyPartitions, mock_cache_dir: Path) -> None:
+    path = mock_cache_dir / "edinet" / "list" / "_manifest.json"
+    path.parent.mkdir(parents=True)
+    path.write_text("{", encoding="utf-8")
+
+    assert partitions.manifest == {}
+
+
+def test_write_overwrites(partitions: DailyPartitions) -> None:
+    partitions.write(D3, frame(D3, ["10000"]))
+    partitions.write(D3, frame(D3, ["10000", "20000"]))
+
+    assert partitions.read([D3])["Code"].to_list() == ["10000", "20000"]
+
+    partitions.write(D3, pl.DataFrame())
+    assert partitions.read([D3]).is_empty()
+
+
+def test_scan(partitions: DailyPartitions) -> None:
+    partitions.write(D1, frame(D1, ["10000", "20000"]))
+    partitions.write(D2, pl.DataFrame())
+    partitions.write(D3, frame(D3, ["30000"]).with_columns(pl.lit(1).alias("A")))
+
+    lf = partitions.scan()
+    assert isinstance(lf, pl.LazyFrame)
+
+    df = lf.filter(pl.col("Code") != "20000").collect()
+    assert df["Code"].to_list() == ["10000", "30000"]
+    assert df.columns == ["Code", "FileDate", "A"]
+
+    assert partitions.read([D1])["Code"].to_list() == ["10000", "20000"]
+    assert partitions.read([D2]).is_empty()